@@ -310,6 +310,13 @@ class RedshiftTableNameTooLong(Exception):
         )
 
 
+class DynamoDBUnprocessedKeysError(Exception):
+    def __init__(self, table_name: str, num_keys: int):
+        super().__init__(
+            f"DynamoDB didn't process {num_keys} keys of table {table_name} after retrying BatchGetItem."
+        )
+
+
 class SnowflakeCredentialsError(Exception):
     def __init__(self):
         super().__init__("Snowflake Connector failed due to incorrect credentials")
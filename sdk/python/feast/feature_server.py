@@ -1,8 +1,13 @@
+import asyncio
 import json
 import threading
+import time
 import traceback
 import warnings
-from typing import List, Optional
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 
 import gunicorn.app.base
 import pandas as pd
@@ -12,11 +17,13 @@ from fastapi.logger import logger
 from fastapi.params import Depends
 from google.protobuf.json_format import MessageToDict, Parse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 import feast
 from feast import proto_json, utils
 from feast.data_source import PushMode
 from feast.errors import PushSourceNotFoundException
+from feast.infra.feature_servers.base_config import PushBufferConfig
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesRequest
 
 
@@ -45,97 +52,299 @@ class MaterializeIncrementalRequest(BaseModel):
     feature_views: Optional[List[str]] = None
 
 
+_PushBufferKey = Tuple[str, PushMode, bool, Tuple[str, ...]]
+
+
+@dataclass
+class _BufferedPushes:
+    created_at: float
+    dfs: List[pd.DataFrame] = field(default_factory=list)
+    futures: List["Future[None]"] = field(default_factory=list)
+    num_rows: int = 0
+
+
+class PushBuffer:
+    """
+    Coalesces the dataframes pushed to the same push source, so that many small pushes are written to the
+    online and offline stores with a single push. Buffered dataframes are written by a background thread,
+    once the oldest of them has waited for the flush interval, or once the maximum number of rows is
+    buffered.
+    """
+
+    def __init__(self, store: "feast.FeatureStore", config: PushBufferConfig):
+        self._store = store
+        self._flush_interval = config.flush_interval_ms / 1000
+        self._max_rows = config.max_rows
+        self._condition = threading.Condition()
+        # Only dataframes with the same columns are concatenated.
+        self._buffers: Dict[_PushBufferKey, _BufferedPushes] = {}
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="feast_push_buffer", daemon=True
+        )
+        self._thread.start()
+
+    def push(
+        self,
+        push_source_name: str,
+        df: pd.DataFrame,
+        allow_registry_cache: bool = True,
+        to: PushMode = PushMode.ONLINE,
+    ) -> "Future[None]":
+        """
+        Buffers a dataframe to be pushed to a push source.
+
+        Returns:
+            A future that is resolved once the dataframe is written, or fails with the write error.
+
+        Raises:
+            PushSourceNotFoundException: The push source doesn't exist.
+        """
+        # Unknown push sources are reported right away, rather than when the buffer is flushed.
+        self._store._get_push_route(push_source_name, allow_registry_cache)
+
+        future: "Future[None]" = Future()
+        key = (push_source_name, to, allow_registry_cache, tuple(df.columns))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The push buffer is closed.")
+            buffered = self._buffers.get(key)
+            if buffered is None:
+                buffered = self._buffers[key] = _BufferedPushes(time.monotonic())
+                self._condition.notify()
+            buffered.dfs.append(df)
+            buffered.futures.append(future)
+            buffered.num_rows += len(df)
+            if buffered.num_rows >= self._max_rows:
+                self._condition.notify()
+        return future
+
+    def close(self):
+        """Writes all buffered dataframes and stops the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    ready = [
+                        key
+                        for key, buffered in self._buffers.items()
+                        if self._closed
+                        or buffered.num_rows >= self._max_rows
+                        or now - buffered.created_at >= self._flush_interval
+                    ]
+                    if ready or self._closed:
+                        break
+                    self._condition.wait(
+                        min(
+                            (
+                                buffered.created_at + self._flush_interval - now
+                                for buffered in self._buffers.values()
+                            ),
+                            default=None,
+                        )
+                    )
+                if not ready:
+                    return
+                batches = [(key, self._buffers.pop(key)) for key in ready]
+
+            for key, buffered in batches:
+                self._flush(key, buffered)
+
+    def _flush(self, key: _PushBufferKey, buffered: _BufferedPushes):
+        push_source_name, to, allow_registry_cache, _ = key
+        try:
+            self._store.push(
+                push_source_name=push_source_name,
+                df=pd.concat(buffered.dfs, ignore_index=True),
+                allow_registry_cache=allow_registry_cache,
+                to=to,
+            )
+        except Exception as e:
+            for future in buffered.futures:
+                future.set_exception(e)
+        else:
+            for future in buffered.futures:
+                future.set_result(None)
+
+
+def _log_push_error(future: "Future[None]"):
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to write buffered pushes", exc_info=error)
+
+
 def get_app(store: "feast.FeatureStore", registry_ttl_sec: int = 5):
     proto_json.patch()
 
     app = FastAPI()
-    # Asynchronously refresh registry, notifying shutdown and canceling the active timer if the app is shutting down
-    registry_proto = None
-    shutting_down = False
-    active_timer: Optional[threading.Timer] = None
 
     async def get_body(request: Request):
         return await request.body()
 
-    def async_refresh():
-        store.refresh_registry()
-        nonlocal registry_proto
-        registry_proto = store.registry.proto()
-        if shutting_down:
-            return
-        nonlocal active_timer
-        active_timer = threading.Timer(registry_ttl_sec, async_refresh)
-        active_timer.start()
+    # The registry is refreshed in the background, so that requests never wait for a refresh. A registry
+    # configured with the "thread" cache mode keeps its own refresh interval.
+    store.refresh_registry()
+    store.registry.start_background_refresh(timedelta(seconds=registry_ttl_sec))
+
+    push_buffer_config = (
+        getattr(store.config.feature_server, "push_buffer", None) or PushBufferConfig()
+    )
+    push_buffer = (
+        PushBuffer(store, push_buffer_config) if push_buffer_config.enabled else None
+    )
 
     @app.on_event("shutdown")
     def shutdown_event():
-        nonlocal shutting_down
-        shutting_down = True
-        if active_timer:
-            active_timer.cancel()
+        store.registry.stop_background_refresh()
+        if push_buffer is not None:
+            # Buffered rows are written before the server stops.
+            push_buffer.close()
+
+    def parse_get_online_features_request(body):
+        # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
+        request_proto = GetOnlineFeaturesRequest()
+        Parse(body, request_proto)
+
+        # Initialize parameters for FeatureStore.get_online_features(...) call
+        if request_proto.HasField("feature_service"):
+            features = store.get_feature_service(
+                request_proto.feature_service, allow_cache=True
+            )
+        else:
+            features = list(request_proto.features.val)
+
+        full_feature_names = request_proto.full_feature_names
 
-    async_refresh()
+        batch_sizes = [len(v.val) for v in request_proto.entities.values()]
+        num_entities = batch_sizes[0]
+        if any(batch_size != num_entities for batch_size in batch_sizes):
+            raise HTTPException(status_code=500, detail="Uneven number of columns")
+        return features, request_proto.entities, full_feature_names
+
+    def online_features_response_to_dict(response_proto):
+        # Convert the Protobuf object to JSON and return it
+        return MessageToDict(  # type: ignore
+            response_proto, preserving_proto_field_name=True, float_precision=18
+        )
+
+    def get_online_features_sync(body):
+        features, entity_values, full_feature_names = parse_get_online_features_request(
+            body
+        )
+        response = store._get_online_features(
+            features=features,
+            entity_values=entity_values,
+            full_feature_names=full_feature_names,
+            native_entity_values=False,
+        )
+        return online_features_response_to_dict(response.proto)
+
+    def prepare_online_features_request(body):
+        features, entity_values, full_feature_names = parse_get_online_features_request(
+            body
+        )
+        request = store._prepare_online_features_request(
+            features=features,
+            entity_values=entity_values,
+            full_feature_names=full_feature_names,
+            native_entity_values=False,
+        )
+        read_groups = store._group_online_reads_async(
+            request.plan, request.join_key_values
+        )
+        return request, read_groups, full_feature_names
+
+    def build_online_features_response(
+        request, read_groups, groups_read_rows, full_feature_names
+    ):
+        tables_read = store._online_read_groups_to_protos(
+            request.plan, read_groups, groups_read_rows
+        )
+        response = store._build_online_response(
+            request, tables_read, full_feature_names
+        )
+        return online_features_response_to_dict(response.proto)
+
+    # Online stores that support asynchronous reads are read from the event loop, while the requests and
+    # responses are built in the threadpool so that they don't hold up other requests. Others are read from
+    # the threadpool, which is also used once an online store turns out not to support asynchronous reads.
+    online_read_async_supported = True
 
     @app.post("/get-online-features")
-    def get_online_features(body=Depends(get_body)):
+    async def get_online_features(body=Depends(get_body)):
+        nonlocal online_read_async_supported
         try:
-            # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
-            request_proto = GetOnlineFeaturesRequest()
-            Parse(body, request_proto)
-
-            # Initialize parameters for FeatureStore.get_online_features(...) call
-            if request_proto.HasField("feature_service"):
-                features = store.get_feature_service(
-                    request_proto.feature_service, allow_cache=True
-                )
-            else:
-                features = list(request_proto.features.val)
-
-            full_feature_names = request_proto.full_feature_names
-
-            batch_sizes = [len(v.val) for v in request_proto.entities.values()]
-            num_entities = batch_sizes[0]
-            if any(batch_size != num_entities for batch_size in batch_sizes):
-                raise HTTPException(status_code=500, detail="Uneven number of columns")
-
-            response_proto = store._get_online_features(
-                features=features,
-                entity_values=request_proto.entities,
-                full_feature_names=full_feature_names,
-                native_entity_values=False,
-            ).proto
-
-            # Convert the Protobuf object to JSON and return it
-            return MessageToDict(  # type: ignore
-                response_proto, preserving_proto_field_name=True, float_precision=18
-            )
+            if online_read_async_supported:
+                (
+                    request,
+                    read_groups,
+                    full_feature_names,
+                ) = await run_in_threadpool(prepare_online_features_request, body)
+                try:
+                    groups_read_rows = await store._read_online_read_groups_async(
+                        request.plan, read_groups
+                    )
+                except NotImplementedError:
+                    online_read_async_supported = False
+                else:
+                    return await run_in_threadpool(
+                        build_online_features_response,
+                        request,
+                        read_groups,
+                        groups_read_rows,
+                        full_feature_names,
+                    )
+            return await run_in_threadpool(get_online_features_sync, body)
         except Exception as e:
             # Print the original exception on the server side
             logger.exception(traceback.format_exc())
             # Raise HTTPException to return the error message to the client
             raise HTTPException(status_code=500, detail=str(e))
 
-    @app.post("/push")
-    def push(body=Depends(get_body)):
-        try:
-            request = PushFeaturesRequest(**json.loads(body))
-            df = pd.DataFrame(request.df)
-            if request.to == "offline":
-                to = PushMode.OFFLINE
-            elif request.to == "online":
-                to = PushMode.ONLINE
-            elif request.to == "online_and_offline":
-                to = PushMode.ONLINE_AND_OFFLINE
-            else:
-                raise ValueError(
-                    f"{request.to} is not a supported push format. Please specify one of these ['online', 'offline', 'online_and_offline']."
-                )
-            store.push(
+    def push_or_buffer(body) -> Optional["Future[None]"]:
+        request = PushFeaturesRequest(**json.loads(body))
+        df = pd.DataFrame(request.df)
+        if request.to == "offline":
+            to = PushMode.OFFLINE
+        elif request.to == "online":
+            to = PushMode.ONLINE
+        elif request.to == "online_and_offline":
+            to = PushMode.ONLINE_AND_OFFLINE
+        else:
+            raise ValueError(
+                f"{request.to} is not a supported push format. Please specify one of these ['online', 'offline', 'online_and_offline']."
+            )
+        if push_buffer is not None:
+            return push_buffer.push(
                 push_source_name=request.push_source_name,
                 df=df,
                 allow_registry_cache=request.allow_registry_cache,
                 to=to,
             )
+        store.push(
+            push_source_name=request.push_source_name,
+            df=df,
+            allow_registry_cache=request.allow_registry_cache,
+            to=to,
+        )
+        return None
+
+    @app.post("/push")
+    async def push(body=Depends(get_body)):
+        try:
+            future = await run_in_threadpool(push_or_buffer, body)
+            if future is not None:
+                if push_buffer_config.ack_after_flush:
+                    # Waiting for the flush doesn't occupy a worker thread, so that requests keep being buffered.
+                    await asyncio.wrap_future(future)
+                else:
+                    future.add_done_callback(_log_push_error)
         except PushSourceNotFoundException as e:
             # Print the original exception on the server side
             logger.exception(traceback.format_exc())
@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import calendar
 import copy
 import itertools
 import os
 import warnings
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import (
@@ -23,16 +27,19 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 from colorama import Fore, Style
@@ -76,12 +83,18 @@ from feast.inference import (
     update_feature_views_with_inferred_features_and_entities,
 )
 from feast.infra.infra_object import Infra
+from feast.infra.offline_stores import offline_utils
+from feast.infra.offline_stores.offline_store import (
+    ChunkedRetrievalJob,
+    RetrievalMetadata,
+)
 from feast.infra.provider import Provider, RetrievalJob, get_provider
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.infra.registry.registry import Registry
 from feast.infra.registry.sql import SqlRegistry
 from feast.on_demand_feature_view import OnDemandFeatureView
-from feast.online_response import OnlineResponse
+from feast.online_response import ColumnarOnlineResponse, OnlineResponse
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.serving.ServingService_pb2 import (
     FieldStatus,
     GetOnlineFeaturesResponse,
@@ -93,13 +106,67 @@ from feast.repo_contents import RepoContents
 from feast.request_feature_view import RequestFeatureView
 from feast.saved_dataset import SavedDataset, SavedDatasetStorage, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
-from feast.type_map import python_values_to_proto_values
+from feast.type_map import proto_values_to_pa_array, python_values_to_proto_values
 from feast.usage import log_exceptions, log_exceptions_and_usage, set_usage_attribute
 from feast.value_type import ValueType
 from feast.version import get_version
 
 warnings.simplefilter("once", DeprecationWarning)
 
+# The maximum number of online retrieval plans cached per registry version.
+MAX_CACHED_ONLINE_RETRIEVAL_PLANS = 1000
+
+_FeatureViewT = TypeVar("_FeatureViewT", FeatureView, StreamFeatureView)
+
+
+@dataclass
+class _OnlineRetrievalPlan:
+    """
+    The parts of an online feature retrieval that only depend on the requested features and the
+    registry state, and can therefore be reused across `get_online_features` calls.
+    """
+
+    feature_refs: List[str]
+    requested_request_feature_views: List[RequestFeatureView]
+    requested_on_demand_feature_views: List[OnDemandFeatureView]
+    entity_name_to_join_key_map: Dict[str, str]
+    entity_type_map: Dict[str, ValueType]
+    join_keys_set: Set[str]
+    grouped_refs: List[Tuple[FeatureView, List[str]]]
+    grouped_odfv_refs: List[Tuple[OnDemandFeatureView, List[str]]]
+    grouped_request_fv_refs: List[Tuple[RequestFeatureView, List[str]]]
+    requested_result_row_names: Set[str]
+    needed_request_data: Set[str]
+    needed_request_fv_features: Set[str]
+    entityless_case: bool
+
+
+@dataclass
+class _OnlineFeaturesRequest:
+    """
+    A `get_online_features` call that is ready to read the feature views of its plan from the online store.
+    """
+
+    plan: _OnlineRetrievalPlan
+    # Populated with join keys and request data.
+    response: GetOnlineFeaturesResponse
+    join_key_values: Dict[str, List[Value]]
+    requested_result_row_names: Set[str]
+
+
+@dataclass
+class _OnlineReadGroups:
+    """
+    The feature views of an `_OnlineFeaturesRequest` that are read from the online store asynchronously,
+    grouped by the entity keys they are read for.
+    """
+
+    tables_unique_entities: List[
+        Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]
+    ]
+    groups: List[List[int]]
+    groups_entity_keys: List[List[EntityKeyProto]]
+
 
 class FeatureStore:
     """
@@ -110,12 +177,33 @@ class FeatureStore:
         repo_path: The path to the feature repo.
         _registry: The registry for the feature store.
         _provider: The provider for the feature store.
+        _online_read_executor: The thread pool used to read feature views from the online store
+            concurrently, if `online_read_concurrency` is greater than 1.
+        _online_read_many_supported: Whether the provider supports reading several feature views at
+            once with `online_read_many`. Set to False the first time the provider doesn't support it.
+        _online_read_many_async_supported: Whether the provider supports `online_read_many_async`.
+        _online_retrieval_plans: The registry proto and version that the cached online retrieval
+            plans were built against, and the plans keyed by the requested features.
+        _push_routes: The registry proto and version that the cached push routes were built against,
+            and the feature views that each push source writes to, keyed by push source name.
+        _batch_source_columns: The registry proto and version that the cached batch source columns were
+            fetched for, and the column names and types of the batch sources keyed by feature view name.
     """
 
     config: RepoConfig
     repo_path: Path
     _registry: BaseRegistry
     _provider: Provider
+    _online_read_executor: Optional[ThreadPoolExecutor]
+    _online_read_many_supported: bool
+    _online_read_many_async_supported: bool
+    _online_retrieval_plans: Optional[
+        Tuple[RegistryProto, str, Dict[Tuple[Any, ...], _OnlineRetrievalPlan]]
+    ]
+    _push_routes: Optional[Tuple[RegistryProto, str, Dict[str, List[FeatureView]]]]
+    _batch_source_columns: Optional[
+        Tuple[RegistryProto, str, Dict[str, List[Tuple[str, str]]]]
+    ]
 
     @log_exceptions
     def __init__(
@@ -171,6 +259,18 @@ class FeatureStore:
 
         self._provider = get_provider(self.config)
 
+        self._online_retrieval_plans = None
+        self._push_routes = None
+        self._batch_source_columns = None
+        self._online_read_executor = None
+        if self.config.online_read_concurrency > 1:
+            self._online_read_executor = ThreadPoolExecutor(
+                max_workers=self.config.online_read_concurrency,
+                thread_name_prefix="feast_online_read",
+            )
+        self._online_read_many_supported = True
+        self._online_read_many_async_supported = True
+
     @log_exceptions
     def version(self) -> str:
         """Returns the version of the current Feast SDK/CLI."""
@@ -204,6 +304,7 @@ class FeatureStore:
         refresh_registry() will become the only way to update the cached registry. If the TTL is set to a value
         greater than 0, then once the cache becomes stale (more time than the TTL has passed), a new cache will be
         downloaded synchronously, which may increase latencies if the triggering method is get_online_features().
+        With the "thread" registry cache mode, the cache is instead refreshed in a background thread.
         """
         registry_config = self.config.registry
         registry = Registry(
@@ -211,6 +312,11 @@ class FeatureStore:
         )
         registry.refresh(self.config.project)
 
+        refresh_thread = self._registry._refresh_thread
+        if refresh_thread is not None:
+            # Keep refreshing the registry in the background, rather than the replaced registry.
+            self._registry.stop_background_refresh()
+            registry.start_background_refresh(refresh_thread.interval)
         self._registry = registry
 
     @log_exceptions_and_usage
@@ -292,8 +398,7 @@ class FeatureStore:
                 and fv.entities
                 and fv.entities[0] == DUMMY_ENTITY_NAME
             ):
-                fv.entities = []
-                fv.entity_columns = []
+                fv = _without_dummy_entity(fv)
             feature_views.append(fv)
         return feature_views
 
@@ -306,9 +411,12 @@ class FeatureStore:
         for sfv in self._registry.list_stream_feature_views(
             self.project, allow_cache=allow_cache
         ):
-            if hide_dummy_entity and sfv.entities[0] == DUMMY_ENTITY_NAME:
-                sfv.entities = []
-                sfv.entity_columns = []
+            if (
+                hide_dummy_entity
+                and sfv.entities
+                and sfv.entities[0] == DUMMY_ENTITY_NAME
+            ):
+                sfv = _without_dummy_entity(sfv)
             stream_feature_views.append(sfv)
         return stream_feature_views
 
@@ -418,7 +526,9 @@ class FeatureStore:
             name, self.project, allow_cache=allow_registry_cache
         )
         if hide_dummy_entity and feature_view.entities[0] == DUMMY_ENTITY_NAME:
-            feature_view.entities = []
+            feature_view = _without_dummy_entity(
+                feature_view, hide_entity_columns=False
+            )
         return feature_view
 
     @log_exceptions_and_usage
@@ -452,7 +562,9 @@ class FeatureStore:
             name, self.project, allow_cache=allow_registry_cache
         )
         if hide_dummy_entity and stream_feature_view.entities[0] == DUMMY_ENTITY_NAME:
-            stream_feature_view.entities = []
+            stream_feature_view = _without_dummy_entity(
+                stream_feature_view, hide_entity_columns=False
+            )
         return stream_feature_view
 
     @log_exceptions_and_usage
@@ -1022,6 +1134,7 @@ class FeatureStore:
         entity_df: Union[pd.DataFrame, str],
         features: Union[List[str], FeatureService],
         full_feature_names: bool = False,
+        entity_df_chunk_size: Optional[int] = None,
     ) -> RetrievalJob:
         """Enrich an entity dataframe with historical feature values for either training or batch scoring.
 
@@ -1047,12 +1160,17 @@ class FeatureStore:
             full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
                 changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
                 changes to "customer_fv__daily_transactions").
+            entity_df_chunk_size (optional): If set, the entity dataframe is split into chunks of consecutive
+                event timestamps with about this many rows, and features are retrieved for one chunk at a time.
+                The result can then be consumed with `to_arrow_batches` or persisted to a parquet file or
+                directory without holding all of it in memory. Only supported for pandas entity dataframes.
 
         Returns:
             RetrievalJob which can be used to materialize the results.
 
         Raises:
-            ValueError: Both or neither of features and feature_refs are specified.
+            ValueError: Both or neither of features and feature_refs are specified, or entity_df_chunk_size
+                is invalid.
 
         Examples:
             Retrieve historical features from a local offline store.
@@ -1134,6 +1252,16 @@ class FeatureStore:
         _feature_refs = [ref for ref in _feature_refs if ref not in request_fv_refs]
         provider = self._get_provider()
 
+        if entity_df_chunk_size is not None:
+            return self._get_historical_features_in_chunks(
+                provider,
+                feature_views,
+                _feature_refs,
+                entity_df,
+                full_feature_names,
+                entity_df_chunk_size,
+            )
+
         job = provider.get_historical_features(
             self.config,
             feature_views,
@@ -1146,6 +1274,57 @@ class FeatureStore:
 
         return job
 
+    def _get_historical_features_in_chunks(
+        self,
+        provider: Provider,
+        feature_views: List[FeatureView],
+        feature_refs: List[str],
+        entity_df: Union[pd.DataFrame, str],
+        full_feature_names: bool,
+        entity_df_chunk_size: int,
+    ) -> RetrievalJob:
+        if not isinstance(entity_df, pd.DataFrame):
+            raise ValueError(
+                "entity_df_chunk_size is only supported for pandas entity dataframes."
+            )
+        if entity_df_chunk_size <= 0:
+            raise ValueError(
+                f"entity_df_chunk_size must be positive, got {entity_df_chunk_size}."
+            )
+
+        event_timestamp_col = offline_utils.infer_event_timestamp_from_entity_df(
+            dict(zip(entity_df.columns, entity_df.dtypes))
+        )
+
+        def create_retrieval_jobs() -> Iterator[RetrievalJob]:
+            for entity_df_chunk in offline_utils.split_entity_df(
+                entity_df, event_timestamp_col, entity_df_chunk_size
+            ):
+                yield provider.get_historical_features(
+                    self.config,
+                    feature_views,
+                    feature_refs,
+                    entity_df_chunk,
+                    self._registry,
+                    self.project,
+                    full_feature_names,
+                )
+
+        (
+            min_event_timestamp,
+            max_event_timestamp,
+        ) = offline_utils.get_entity_df_timestamp_bounds(entity_df, event_timestamp_col)
+        return ChunkedRetrievalJob(
+            create_retrieval_jobs,
+            full_feature_names=full_feature_names,
+            metadata=RetrievalMetadata(
+                features=feature_refs,
+                keys=list(set(entity_df.columns) - {event_timestamp_col}),
+                min_event_timestamp=min_event_timestamp,
+                max_event_timestamp=max_event_timestamp,
+            ),
+        )
+
     @log_exceptions_and_usage
     def create_saved_dataset(
         self,
@@ -1290,6 +1469,7 @@ class FeatureStore:
             self.config.online_store.type,
         )
         # TODO paging large loads
+        feature_views_with_intervals = []
         for feature_view in feature_views_to_materialize:
             start_date = feature_view.most_recent_end_time
             if start_date is None:
@@ -1308,35 +1488,20 @@ class FeatureStore:
                         "the start date will be set to 1 year before the current time."
                     )
                     start_date = datetime.utcnow() - timedelta(weeks=52)
-            provider = self._get_provider()
             print(
                 f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}"
                 f" from {Style.BRIGHT + Fore.GREEN}{start_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}"
                 f" to {Style.BRIGHT + Fore.GREEN}{end_date.replace(microsecond=0).astimezone()}{Style.RESET_ALL}:"
             )
-
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
-
-            start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
-
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
+            feature_views_with_intervals.append(
+                (
+                    feature_view,
+                    utils.make_tzaware(start_date),
+                    utils.make_tzaware(end_date),
+                )
             )
 
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+        self._materialize_feature_views(feature_views_with_intervals)
 
     @log_exceptions_and_usage
     def materialize(
@@ -1386,32 +1551,48 @@ class FeatureStore:
             self.config.online_store.type,
         )
         # TODO paging large loads
+        start_date = utils.make_tzaware(start_date)
+        end_date = utils.make_tzaware(end_date)
+        feature_views_with_intervals = []
         for feature_view in feature_views_to_materialize:
-            provider = self._get_provider()
             print(f"{Style.BRIGHT + Fore.GREEN}{feature_view.name}{Style.RESET_ALL}:")
+            feature_views_with_intervals.append((feature_view, start_date, end_date))
+
+        self._materialize_feature_views(feature_views_with_intervals)
 
-            def tqdm_builder(length):
-                return tqdm(total=length, ncols=100)
+    def _materialize_feature_views(
+        self, feature_views: List[Tuple[FeatureView, datetime, datetime]]
+    ) -> None:
+        """
+        Materializes the feature views, each over its own time range, and records the materialization
+        of those that succeeded in the registry. The first error is raised after all feature views
+        have been processed.
+        """
 
-            start_date = utils.make_tzaware(start_date)
-            end_date = utils.make_tzaware(end_date)
+        def tqdm_builder(length):
+            return tqdm(total=length, ncols=100)
 
-            provider.materialize_single_feature_view(
-                config=self.config,
-                feature_view=feature_view,
-                start_date=start_date,
-                end_date=end_date,
-                registry=self._registry,
-                project=self.project,
-                tqdm_builder=tqdm_builder,
-            )
+        provider = self._get_provider()
+        errors = provider.materialize_feature_views(
+            config=self.config,
+            feature_views=feature_views,
+            registry=self._registry,
+            project=self.project,
+            tqdm_builder=tqdm_builder,
+        )
 
-            self._registry.apply_materialization(
-                feature_view,
-                self.project,
-                start_date,
-                end_date,
-            )
+        for (feature_view, start_date, end_date), error in zip(feature_views, errors):
+            if error is None:
+                self._registry.apply_materialization(
+                    feature_view,
+                    self.project,
+                    start_date,
+                    end_date,
+                )
+
+        first_error = next((error for error in errors if error is not None), None)
+        if first_error is not None:
+            raise first_error
 
     @log_exceptions_and_usage
     def push(
@@ -1430,33 +1611,72 @@ class FeatureStore:
             allow_registry_cache: Whether to allow cached versions of the registry.
             to: Whether to push to online or offline store. Defaults to online store only.
         """
+        fvs_with_push_sources = self._get_push_route(
+            push_source_name, allow_registry_cache
+        )
+
+        for fv in fvs_with_push_sources:
+            if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                self._write_to_online_store(fv, df)
+            if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
+                self._write_to_offline_store(
+                    fv, df, allow_registry_cache=allow_registry_cache
+                )
+
+    def _get_push_route(
+        self, push_source_name: str, allow_registry_cache: bool
+    ) -> List[FeatureView]:
+        """Returns the feature views that the given push source writes to, reusing the cached push routes
+        if possible.
+
+        The push routes of all push sources are built at once, and cached until the registry returns a
+        different cached registry proto.
+        """
+        registry_proto = (
+            self._registry.get_cached_registry_proto(self.project)
+            if allow_registry_cache
+            else None
+        )
+        if registry_proto is None:
+            push_routes = self._build_push_routes(allow_registry_cache)
+        else:
+            # The push routes are replaced as a whole, like the online retrieval plans.
+            cached_push_routes = self._push_routes
+            if (
+                cached_push_routes is None
+                or cached_push_routes[0] is not registry_proto
+                or cached_push_routes[1] != registry_proto.version_id
+            ):
+                cached_push_routes = (
+                    registry_proto,
+                    registry_proto.version_id,
+                    self._build_push_routes(allow_registry_cache),
+                )
+                self._push_routes = cached_push_routes
+            push_routes = cached_push_routes[2]
+
+        push_route = push_routes.get(push_source_name)
+        if push_route is None:
+            raise PushSourceNotFoundException(push_source_name)
+        return push_route
+
+    def _build_push_routes(
+        self, allow_registry_cache: bool
+    ) -> Dict[str, List[FeatureView]]:
         from feast.data_source import PushSource
 
         all_fvs = self.list_feature_views(allow_cache=allow_registry_cache)
         all_fvs += self.list_stream_feature_views(allow_cache=allow_registry_cache)
 
-        fvs_with_push_sources = {
-            fv
-            for fv in all_fvs
+        push_routes: Dict[str, List[FeatureView]] = defaultdict(list)
+        for fv in all_fvs:
             if (
                 fv.stream_source is not None
                 and isinstance(fv.stream_source, PushSource)
-                and fv.stream_source.name == push_source_name
-            )
-        }
-
-        if not fvs_with_push_sources:
-            raise PushSourceNotFoundException(push_source_name)
-
-        for fv in fvs_with_push_sources:
-            if to == PushMode.ONLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_online_store(
-                    fv.name, df, allow_registry_cache=allow_registry_cache
-                )
-            if to == PushMode.OFFLINE or to == PushMode.ONLINE_AND_OFFLINE:
-                self.write_to_offline_store(
-                    fv.name, df, allow_registry_cache=allow_registry_cache
-                )
+                and fv not in push_routes[fv.stream_source.name]
+            ):
+                push_routes[fv.stream_source.name].append(fv)
+        return dict(push_routes)
 
     @log_exceptions_and_usage
     def write_to_online_store(
@@ -1482,6 +1702,9 @@ class FeatureStore:
             feature_view = self.get_feature_view(
                 feature_view_name, allow_registry_cache=allow_registry_cache
             )
+        self._write_to_online_store(feature_view, df)
+
+    def _write_to_online_store(self, feature_view: FeatureView, df: pd.DataFrame):
         provider = self._get_provider()
         provider.ingest_df(feature_view, df)
 
@@ -1509,9 +1732,23 @@ class FeatureStore:
                 feature_view_name, allow_registry_cache=allow_registry_cache
             )
 
+        self._write_to_offline_store(
+            feature_view,
+            df,
+            allow_registry_cache=allow_registry_cache,
+            reorder_columns=reorder_columns,
+        )
+
+    def _write_to_offline_store(
+        self,
+        feature_view: FeatureView,
+        df: pd.DataFrame,
+        allow_registry_cache: bool = True,
+        reorder_columns: bool = True,
+    ):
         # Get columns of the batch source and the input dataframe.
-        column_names_and_types = (
-            feature_view.batch_source.get_table_column_names_and_types(self.config)
+        column_names_and_types = self._get_batch_source_columns(
+            feature_view, allow_registry_cache
         )
         source_columns = [column for column, _ in column_names_and_types]
         input_columns = df.columns.values.tolist()
@@ -1528,6 +1765,42 @@ class FeatureStore:
         provider = self._get_provider()
         provider.ingest_df_to_offline_store(feature_view, table)
 
+    def _get_batch_source_columns(
+        self, feature_view: FeatureView, allow_registry_cache: bool
+    ) -> List[Tuple[str, str]]:
+        """Returns the column names and types of the batch source of the given feature view, reusing the
+        cached columns if possible.
+
+        The columns are fetched once per feature view, and cached until the registry returns a different
+        cached registry proto.
+        """
+        registry_proto = (
+            self._registry.get_cached_registry_proto(self.project)
+            if allow_registry_cache
+            else None
+        )
+        if registry_proto is None:
+            return list(
+                feature_view.batch_source.get_table_column_names_and_types(self.config)
+            )
+
+        # The cached columns are replaced as a whole, like the push routes.
+        cached_columns = self._batch_source_columns
+        if (
+            cached_columns is None
+            or cached_columns[0] is not registry_proto
+            or cached_columns[1] != registry_proto.version_id
+        ):
+            cached_columns = (registry_proto, registry_proto.version_id, {})
+            self._batch_source_columns = cached_columns
+        column_names_and_types = cached_columns[2].get(feature_view.name)
+        if column_names_and_types is None:
+            column_names_and_types = list(
+                feature_view.batch_source.get_table_column_names_and_types(self.config)
+            )
+            cached_columns[2][feature_view.name] = column_names_and_types
+        return column_names_and_types
+
     @log_exceptions_and_usage
     def get_online_features(
         self,
@@ -1576,6 +1849,114 @@ class FeatureStore:
             ... )
             >>> online_response_dict = online_response.to_dict()
         """
+        return self._get_online_features(
+            features=features,
+            entity_values=self._entity_rows_to_columnar(entity_rows),
+            full_feature_names=full_feature_names,
+            native_entity_values=True,
+        )
+
+    async def get_online_features_async(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: List[Dict[str, Any]],
+        full_feature_names: bool = False,
+    ) -> OnlineResponse:
+        """
+        Retrieves the latest online feature data asynchronously.
+
+        This method behaves like `get_online_features`, but reads from the online store with
+        `online_read_async`, so that the event loop isn't blocked while waiting for the online store.
+        Feature views are read concurrently.
+
+        Args:
+            features: The list of features that should be retrieved from the online store. These features can be
+                specified either as a list of string feature references or as a feature service. String feature
+                references must have format "feature_view:feature", e.g. "customer_fv:daily_transactions".
+            entity_rows: A list of dictionaries where each key-value is an entity-name, entity-value pair.
+            full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
+                changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
+                changes to "customer_fv__daily_transactions").
+
+        Returns:
+            OnlineResponse containing the feature data in records.
+
+        Raises:
+            Exception: No entity with the specified name exists.
+            NotImplementedError: The online store doesn't support asynchronous reads.
+
+        Examples:
+            Retrieve online features from an online store asynchronously.
+
+            >>> from feast import FeatureStore, RepoConfig
+            >>> fs = FeatureStore(repo_path="project/feature_repo")
+            >>> online_response = await fs.get_online_features_async(
+            ...     features=["driver_hourly_stats:conv_rate"],
+            ...     entity_rows=[{"driver_id": 1001}, {"driver_id": 1002}],
+            ... ) # doctest: +SKIP
+        """
+        return await self._get_online_features_async(
+            features=features,
+            entity_values=self._entity_rows_to_columnar(entity_rows),
+            full_feature_names=full_feature_names,
+            native_entity_values=True,
+        )
+
+    @log_exceptions_and_usage
+    def get_online_features_columnar(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_rows: List[Dict[str, Any]],
+        full_feature_names: bool = False,
+    ) -> ColumnarOnlineResponse:
+        """
+        Retrieves the latest online feature data as columns.
+
+        This method behaves like `get_online_features`, but decodes the data read from the online store
+        straight into one Arrow array per feature, with NumPy arrays for the statuses and event timestamps,
+        instead of building a protobuf response. This is considerably cheaper for large lookups, and
+        `to_arrow()` on the result does not copy the feature data.
+
+        Args:
+            features: The list of features that should be retrieved from the online store. These features can be
+                specified either as a list of string feature references or as a feature service. String feature
+                references must have format "feature_view:feature", e.g. "customer_fv:daily_transactions".
+            entity_rows: A list of dictionaries where each key-value is an entity-name, entity-value pair.
+            full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
+                changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
+                changes to "customer_fv__daily_transactions").
+
+        Returns:
+            ColumnarOnlineResponse containing the feature data in columns.
+
+        Raises:
+            Exception: No entity with the specified name exists.
+
+        Examples:
+            Retrieve online features from an online store as an Arrow table.
+
+            >>> from feast import FeatureStore, RepoConfig
+            >>> fs = FeatureStore(repo_path="project/feature_repo")
+            >>> online_response = fs.get_online_features_columnar(
+            ...     features=[
+            ...         "driver_hourly_stats:conv_rate",
+            ...         "driver_hourly_stats:acc_rate",
+            ...         "driver_hourly_stats:avg_daily_trips",
+            ...     ],
+            ...     entity_rows=[{"driver_id": 1001}, {"driver_id": 1002}, {"driver_id": 1003}, {"driver_id": 1004}],
+            ... )
+            >>> online_response_table = online_response.to_arrow()
+        """
+        return self._get_online_features_columnar(
+            features=features,
+            entity_values=self._entity_rows_to_columnar(entity_rows),
+            full_feature_names=full_feature_names,
+        )
+
+    @staticmethod
+    def _entity_rows_to_columnar(
+        entity_rows: List[Dict[str, Any]]
+    ) -> Dict[str, List[Any]]:
         columnar: Dict[str, List[Any]] = {k: [] for k in entity_rows[0].keys()}
         for entity_row in entity_rows:
             for key, value in entity_row.items():
@@ -1583,15 +1964,30 @@ class FeatureStore:
                     columnar[key].append(value)
                 except KeyError as e:
                     raise ValueError("All entity_rows must have the same keys.") from e
+        return columnar
 
-        return self._get_online_features(
-            features=features,
-            entity_values=columnar,
-            full_feature_names=full_feature_names,
-            native_entity_values=True,
+    def _get_online_features(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool = False,
+        native_entity_values: bool = True,
+    ) -> OnlineResponse:
+        request = self._prepare_online_features_request(
+            features, entity_values, full_feature_names, native_entity_values
+        )
+        tables_read = self._read_grouped_refs_from_online_store(
+            request.plan,
+            request.join_key_values,
+            lambda read_rows, requested_features, _: self._read_rows_to_protos(
+                read_rows, requested_features
+            ),
         )
+        return self._build_online_response(request, tables_read, full_feature_names)
 
-    def _get_online_features(
+    async def _get_online_features_async(
         self,
         features: Union[List[str], FeatureService],
         entity_values: Mapping[
@@ -1599,41 +1995,51 @@ class FeatureStore:
         ],
         full_feature_names: bool = False,
         native_entity_values: bool = True,
-    ):
+    ) -> OnlineResponse:
+        request = self._prepare_online_features_request(
+            features, entity_values, full_feature_names, native_entity_values
+        )
+        read_groups = self._group_online_reads_async(
+            request.plan, request.join_key_values
+        )
+        groups_read_rows = await self._read_online_read_groups_async(
+            request.plan, read_groups
+        )
+        tables_read = self._online_read_groups_to_protos(
+            request.plan, read_groups, groups_read_rows
+        )
+        return self._build_online_response(request, tables_read, full_feature_names)
+
+    def _prepare_online_features_request(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool,
+        native_entity_values: bool,
+    ) -> _OnlineFeaturesRequest:
         # Extract Sequence from RepeatedValue Protobuf.
         entity_value_lists: Dict[str, Union[List[Any], List[Value]]] = {
             k: list(v) if isinstance(v, Sequence) else list(v.val)
             for k, v in entity_values.items()
         }
 
-        _feature_refs = self._get_features(features, allow_cache=True)
-        (
-            requested_feature_views,
-            requested_request_feature_views,
-            requested_on_demand_feature_views,
-        ) = self._get_feature_views_to_use(
-            features=features, allow_cache=True, hide_dummy_entity=False
-        )
+        plan = self._get_online_retrieval_plan(features, full_feature_names)
 
-        if requested_request_feature_views:
+        if plan.requested_request_feature_views:
             warnings.warn(
                 "Request feature view is deprecated. "
                 "Please use request data source instead",
                 DeprecationWarning,
             )
 
-        (
-            entity_name_to_join_key_map,
-            entity_type_map,
-            join_keys_set,
-        ) = self._get_entity_maps(requested_feature_views)
-
         entity_proto_values: Dict[str, List[Value]]
         if native_entity_values:
             # Convert values to Protobuf once.
             entity_proto_values = {
                 k: python_values_to_proto_values(
-                    v, entity_type_map.get(k, ValueType.UNKNOWN)
+                    v, plan.entity_type_map.get(k, ValueType.UNKNOWN)
                 )
                 for k, v in entity_value_lists.items()
             }
@@ -1641,56 +2047,229 @@ class FeatureStore:
             entity_proto_values = entity_value_lists
 
         num_rows = _validate_entity_values(entity_proto_values)
-        _validate_feature_refs(_feature_refs, full_feature_names)
-        (
-            grouped_refs,
-            grouped_odfv_refs,
-            grouped_request_fv_refs,
-            _,
-        ) = _group_feature_refs(
-            _feature_refs,
-            requested_feature_views,
-            requested_request_feature_views,
-            requested_on_demand_feature_views,
+        set_usage_attribute("odfv", bool(plan.grouped_odfv_refs))
+        set_usage_attribute("request_fv", bool(plan.grouped_request_fv_refs))
+
+        # All requested features should be present in the result. The plan is shared between
+        # requests, so join keys and request data are added to a copy.
+        requested_result_row_names = set(plan.requested_result_row_names)
+        join_key_values, request_data_features = self._split_entity_values(
+            plan, entity_proto_values, requested_result_row_names
         )
-        set_usage_attribute("odfv", bool(grouped_odfv_refs))
-        set_usage_attribute("request_fv", bool(grouped_request_fv_refs))
 
-        # All requested features should be present in the result.
-        requested_result_row_names = {
-            feat_ref.replace(":", "__") for feat_ref in _feature_refs
-        }
-        if not full_feature_names:
-            requested_result_row_names = {
-                name.rpartition("__")[-1] for name in requested_result_row_names
-            }
+        # Populate online features response proto with join keys and request data features
+        online_features_response = GetOnlineFeaturesResponse(results=[])
+        self._populate_result_rows_from_columnar(
+            online_features_response=online_features_response,
+            data=dict(**join_key_values, **request_data_features),
+        )
 
-        feature_views = list(view for view, _ in grouped_refs)
+        # Add the Entityless case after populating result rows to avoid having to remove
+        # it later.
+        if plan.entityless_case:
+            join_key_values[DUMMY_ENTITY_ID] = python_values_to_proto_values(
+                [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
+            )
 
-        needed_request_data, needed_request_fv_features = self.get_needed_request_data(
-            grouped_odfv_refs, grouped_request_fv_refs
+        return _OnlineFeaturesRequest(
+            plan=plan,
+            response=online_features_response,
+            join_key_values=join_key_values,
+            requested_result_row_names=requested_result_row_names,
         )
 
-        join_key_values: Dict[str, List[Value]] = {}
-        request_data_features: Dict[str, List[Value]] = {}
+    def _build_online_response(
+        self,
+        request: _OnlineFeaturesRequest,
+        tables_read: List[Tuple[Tuple[List[int], ...], Any]],
+        full_feature_names: bool,
+    ) -> OnlineResponse:
+        """Populates the response of an online request with the feature views that were read."""
+        plan = request.plan
+        online_features_response = request.response
+        for (table, requested_features), (idxs, feature_data) in zip(
+            plan.grouped_refs, tables_read
+        ):
+            # Populate the result_rows with the Features from the OnlineStore inplace.
+            self._populate_response_from_feature_data(
+                feature_data,
+                idxs,
+                online_features_response,
+                full_feature_names,
+                requested_features,
+                table,
+            )
+
+        if plan.grouped_odfv_refs:
+            self._augment_response_with_on_demand_transforms(
+                online_features_response,
+                plan.feature_refs,
+                plan.requested_on_demand_feature_views,
+                full_feature_names,
+            )
+
+        self._drop_unneeded_columns(
+            online_features_response, request.requested_result_row_names
+        )
+        return OnlineResponse(online_features_response)
+
+    def _get_online_features_columnar(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[str, Sequence[Any]],
+        full_feature_names: bool = False,
+    ) -> ColumnarOnlineResponse:
+        entity_value_lists: Dict[str, List[Any]] = {
+            k: list(v) for k, v in entity_values.items()
+        }
+
+        plan = self._get_online_retrieval_plan(features, full_feature_names)
+
+        if plan.requested_request_feature_views:
+            warnings.warn(
+                "Request feature view is deprecated. "
+                "Please use request data source instead",
+                DeprecationWarning,
+            )
+
+        num_rows = _validate_entity_values(entity_value_lists)
+        set_usage_attribute("odfv", bool(plan.grouped_odfv_refs))
+        set_usage_attribute("request_fv", bool(plan.grouped_request_fv_refs))
+
+        requested_result_row_names = set(plan.requested_result_row_names)
+        join_key_native_values, request_data_features = self._split_entity_values(
+            plan, entity_value_lists, requested_result_row_names
+        )
+
+        # Only the join keys need to be converted to Protobuf, to build entity keys.
+        join_key_values: Dict[str, List[Value]] = {
+            k: python_values_to_proto_values(
+                v, plan.entity_type_map.get(k, ValueType.UNKNOWN)
+            )
+            for k, v in join_key_native_values.items()
+        }
+
+        present_statuses = np.full(num_rows, FieldStatus.PRESENT, dtype=np.int32)
+        no_event_timestamps = np.zeros(num_rows, dtype=np.int64)
+
+        feature_names: List[str] = []
+        values: Dict[str, pa.Array] = {}
+        statuses: Dict[str, np.ndarray] = {}
+        event_timestamps: Dict[str, np.ndarray] = {}
+
+        # Populate the response with join keys and request data features.
+        for name, proto_values in join_key_values.items():
+            feature_names.append(name)
+            values[name] = proto_values_to_pa_array(
+                proto_values, plan.entity_type_map.get(name, ValueType.UNKNOWN)
+            )
+            statuses[name] = present_statuses
+            event_timestamps[name] = no_event_timestamps
+        for name, native_values in request_data_features.items():
+            feature_names.append(name)
+            values[name] = pa.array(native_values)
+            statuses[name] = present_statuses
+            event_timestamps[name] = no_event_timestamps
+
+        if plan.entityless_case:
+            join_key_values[DUMMY_ENTITY_ID] = python_values_to_proto_values(
+                [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
+            )
+
+        tables_read = self._read_grouped_refs_from_online_store(
+            plan, join_key_values, self._read_rows_to_columns
+        )
+        for (table, requested_features), (idxs, (table_timestamps, columns)) in zip(
+            plan.grouped_refs, tables_read
+        ):
+            # Map every result row to the position of its entity in the data that was read.
+            row_to_entity = np.empty(num_rows, dtype=np.int64)
+            for entity_idx, row_idxs in enumerate(idxs):
+                row_to_entity[row_idxs] = entity_idx
+            row_to_entity_array = pa.array(row_to_entity)
+            row_timestamps = table_timestamps[row_to_entity]
+
+            for feature_name in requested_features:
+                name = (
+                    f"{table.projection.name_to_use()}__{feature_name}"
+                    if full_feature_names
+                    else feature_name
+                )
+                feature_values, feature_statuses = columns[feature_name]
+                feature_names.append(name)
+                values[name] = feature_values.take(row_to_entity_array)
+                statuses[name] = feature_statuses[row_to_entity]
+                event_timestamps[name] = row_timestamps
+
+        if plan.grouped_odfv_refs:
+            initial_response_df = ColumnarOnlineResponse(
+                feature_names, values, statuses, event_timestamps
+            ).to_df()
+            odfv_feature_refs = self._get_odfv_feature_refs(
+                plan.feature_refs,
+                plan.requested_on_demand_feature_views,
+                full_feature_names,
+            )
+            for odfv in plan.requested_on_demand_feature_views:
+                if odfv.name not in odfv_feature_refs:
+                    continue
+                transformed_features_df = odfv.get_transformed_features_df(
+                    initial_response_df,
+                    full_feature_names,
+                )
+                for name in transformed_features_df.columns:
+                    if name in odfv_feature_refs[odfv.name]:
+                        feature_names.append(name)
+                        values[name] = pa.Array.from_pandas(
+                            transformed_features_df[name]
+                        )
+                        statuses[name] = present_statuses
+                        event_timestamps[name] = no_event_timestamps
+
+        # Drop values that aren't needed, such as request data and unrequested input feature views.
+        feature_names = [
+            name for name in feature_names if name in requested_result_row_names
+        ]
+        return ColumnarOnlineResponse(
+            feature_names=feature_names,
+            values={name: values[name] for name in feature_names},
+            statuses={name: statuses[name] for name in feature_names},
+            event_timestamps={name: event_timestamps[name] for name in feature_names},
+        )
+
+    def _split_entity_values(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        entity_values: Dict[str, List[Any]],
+        requested_result_row_names: Set[str],
+    ) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+        """Splits entity rows into join key values and request data.
+
+        Join keys, and request data that was requested as a feature, are added to
+        `requested_result_row_names` so that they appear in the result.
+        """
+        join_key_values: Dict[str, List[Any]] = {}
+        request_data_features: Dict[str, List[Any]] = {}
         # Entity rows may be either entities or request data.
-        for join_key_or_entity_name, values in entity_proto_values.items():
+        for join_key_or_entity_name, values in entity_values.items():
             # Found request data
             if (
-                join_key_or_entity_name in needed_request_data
-                or join_key_or_entity_name in needed_request_fv_features
+                join_key_or_entity_name in plan.needed_request_data
+                or join_key_or_entity_name in plan.needed_request_fv_features
             ):
-                if join_key_or_entity_name in needed_request_fv_features:
+                if join_key_or_entity_name in plan.needed_request_fv_features:
                     # If the data was requested as a feature then
                     # make sure it appears in the result.
                     requested_result_row_names.add(join_key_or_entity_name)
                 request_data_features[join_key_or_entity_name] = values
             else:
-                if join_key_or_entity_name in join_keys_set:
+                if join_key_or_entity_name in plan.join_keys_set:
                     join_key = join_key_or_entity_name
                 else:
                     try:
-                        join_key = entity_name_to_join_key_map[join_key_or_entity_name]
+                        join_key = plan.entity_name_to_join_key_map[
+                            join_key_or_entity_name
+                        ]
                     except KeyError:
                         raise EntityNotFoundException(
                             join_key_or_entity_name, self.project
@@ -1705,67 +2284,318 @@ class FeatureStore:
                 join_key_values[join_key] = values
 
         self.ensure_request_data_values_exist(
-            needed_request_data, needed_request_fv_features, request_data_features
+            plan.needed_request_data,
+            plan.needed_request_fv_features,
+            request_data_features,
         )
+        return join_key_values, request_data_features
 
-        # Populate online features response proto with join keys and request data features
-        online_features_response = GetOnlineFeaturesResponse(results=[])
-        self._populate_result_rows_from_columnar(
-            online_features_response=online_features_response,
-            data=dict(**join_key_values, **request_data_features),
+    def _read_grouped_refs_from_online_store(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        join_key_values: Dict[str, List[Value]],
+        convert_function: Callable[
+            [
+                List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]],
+                List[str],
+                FeatureView,
+            ],
+            Any,
+        ],
+    ) -> List[Tuple[Tuple[List[int], ...], Any]]:
+        """Reads every feature view of the plan from the online store, and converts the rows with `convert_function`.
+
+        Feature views with the same join keys are read at once with `online_read_many`, if the
+        provider supports it.
+
+        Returns, in the order of `plan.grouped_refs`, the indexes at which each unique entity
+        appears in the result rows and the data that `convert_function` returned for the entities.
+        """
+        provider = self._get_provider()
+        tables_unique_entities = self._get_tables_unique_entities(plan, join_key_values)
+        read_groups = self._get_online_read_groups(
+            tables_unique_entities, self._online_read_many_supported
         )
 
-        # Add the Entityless case after populating result rows to avoid having to remove
-        # it later.
-        entityless_case = DUMMY_ENTITY_NAME in [
-            entity_name
-            for feature_view in feature_views
-            for entity_name in feature_view.entities
-        ]
-        if entityless_case:
-            join_key_values[DUMMY_ENTITY_ID] = python_values_to_proto_values(
-                [DUMMY_ENTITY_VAL] * num_rows, DUMMY_ENTITY.value_type
+        def read_group(group: List[int]) -> List[Any]:
+            # Fetch feature data for the minimum set of Entities.
+            entity_keys = self._get_entity_key_protos(
+                tables_unique_entities[group[0]][0]
             )
+            tables = [plan.grouped_refs[idx] for idx in group]
+            tables_read_rows = None
+            if len(tables) > 1:
+                try:
+                    tables_read_rows = provider.online_read_many(
+                        config=self.config, tables=tables, entity_keys=entity_keys
+                    )
+                except NotImplementedError:
+                    self._online_read_many_supported = False
+            if tables_read_rows is None:
+                tables_read_rows = [
+                    provider.online_read(
+                        config=self.config,
+                        table=table,
+                        entity_keys=entity_keys,
+                        requested_features=requested_features,
+                    )
+                    for table, requested_features in tables
+                ]
+            return [
+                convert_function(read_rows, requested_features, table)
+                for (table, requested_features), read_rows in zip(
+                    tables, tables_read_rows
+                )
+            ]
+
+        # Reads may run concurrently, but both `map` implementations return results in the same
+        # order as `read_groups`.
+        read_map: Callable[..., Iterable[Any]] = (
+            self._online_read_executor.map
+            if self._online_read_executor is not None and len(read_groups) > 1
+            else map
+        )
+        tables_data: List[Any] = [None] * len(plan.grouped_refs)
+        for group, group_data in zip(read_groups, read_map(read_group, read_groups)):
+            for idx, table_data in zip(group, group_data):
+                tables_data[idx] = table_data
+        return [
+            (idxs, table_data)
+            for (_, idxs), table_data in zip(tables_unique_entities, tables_data)
+        ]
 
+    def _group_online_reads_async(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        join_key_values: Dict[str, List[Value]],
+    ) -> "_OnlineReadGroups":
+        """Groups the feature views of the plan by the entity keys they are read for with `online_read_async`.
+
+        Feature views with the same join keys are read at once with `online_read_many_async`, if the
+        provider supports it.
+        """
+        tables_unique_entities = self._get_tables_unique_entities(plan, join_key_values)
+        groups = self._get_online_read_groups(
+            tables_unique_entities, self._online_read_many_async_supported
+        )
+        return _OnlineReadGroups(
+            tables_unique_entities=tables_unique_entities,
+            groups=groups,
+            groups_entity_keys=[
+                self._get_entity_key_protos(tables_unique_entities[group[0]][0])
+                for group in groups
+            ],
+        )
+
+    async def _read_online_read_groups_async(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        read_groups: "_OnlineReadGroups",
+    ) -> List[List[Any]]:
+        """Reads the groups of feature views from the online store concurrently, and returns their read rows.
+
+        Only the online store is read here, so that the rows can be converted outside of the event loop.
+        """
         provider = self._get_provider()
-        for table, requested_features in grouped_refs:
-            # Get the correct set of entity values with the correct join keys.
-            table_entity_values, idxs = self._get_unique_entities(
-                table,
-                join_key_values,
-                entity_name_to_join_key_map,
+
+        async def read_group(group: List[int], entity_keys: List[EntityKeyProto]):
+            tables = [plan.grouped_refs[idx] for idx in group]
+            if len(tables) > 1:
+                try:
+                    return await provider.online_read_many_async(
+                        config=self.config, tables=tables, entity_keys=entity_keys
+                    )
+                except NotImplementedError:
+                    self._online_read_many_async_supported = False
+            return await asyncio.gather(
+                *[
+                    provider.online_read_async(
+                        config=self.config,
+                        table=table,
+                        entity_keys=entity_keys,
+                        requested_features=requested_features,
+                    )
+                    for table, requested_features in tables
+                ]
             )
 
-            # Fetch feature data for the minimum set of Entities.
-            feature_data = self._read_from_online_store(
-                table_entity_values,
-                provider,
-                requested_features,
-                table,
+        return await asyncio.gather(
+            *[
+                read_group(group, entity_keys)
+                for group, entity_keys in zip(
+                    read_groups.groups, read_groups.groups_entity_keys
+                )
+            ]
+        )
+
+    def _online_read_groups_to_protos(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        read_groups: "_OnlineReadGroups",
+        groups_read_rows: List[List[Any]],
+    ) -> List[Tuple[Tuple[List[int], ...], Any]]:
+        """Returns the same result as `_read_grouped_refs_from_online_store` with `_read_rows_to_protos`."""
+        tables_data: List[Any] = [None] * len(plan.grouped_refs)
+        for group, tables_read_rows in zip(read_groups.groups, groups_read_rows):
+            for idx, read_rows in zip(group, tables_read_rows):
+                _, requested_features = plan.grouped_refs[idx]
+                tables_data[idx] = self._read_rows_to_protos(
+                    read_rows, requested_features
+                )
+        return [
+            (idxs, table_data)
+            for (_, idxs), table_data in zip(
+                read_groups.tables_unique_entities, tables_data
             )
+        ]
 
-            # Populate the result_rows with the Features from the OnlineStore inplace.
-            self._populate_response_from_feature_data(
-                feature_data,
-                idxs,
-                online_features_response,
-                full_feature_names,
-                requested_features,
-                table,
+    @staticmethod
+    def _get_online_read_groups(
+        tables_unique_entities: List[
+            Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]
+        ],
+        group_by_join_keys: bool,
+    ) -> List[List[int]]:
+        """Returns the indexes of the feature views that should be read from the online store together.
+
+        Feature views with the same unique entities can be read for the same entity keys at once if
+        `group_by_join_keys` is True. Feature views with the same join keys may still have different
+        entity values, e.g. projections with different join key maps.
+        """
+        if not group_by_join_keys:
+            return [[idx] for idx in range(len(tables_unique_entities))]
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for idx, (table_entity_values, _) in enumerate(tables_unique_entities):
+            join_keys = tuple(table_entity_values[0]) if table_entity_values else ()
+            entity_values = tuple(
+                tuple(value.SerializeToString() for value in entity.values())
+                for entity in table_entity_values
             )
+            groups.setdefault((join_keys, entity_values), []).append(idx)
+        return list(groups.values())
 
-        if grouped_odfv_refs:
-            self._augment_response_with_on_demand_transforms(
-                online_features_response,
-                _feature_refs,
-                requested_on_demand_feature_views,
-                full_feature_names,
+    def _get_tables_unique_entities(
+        self,
+        plan: "_OnlineRetrievalPlan",
+        join_key_values: Dict[str, List[Value]],
+    ) -> List[Tuple[Tuple[Dict[str, Value], ...], Tuple[List[int], ...]]]:
+        """Returns the unique entities of every feature view of the plan, with the indexes at which they appear."""
+        # Get the correct set of entity values with the correct join keys.
+        return [
+            self._get_unique_entities(
+                table,
+                join_key_values,
+                plan.entity_name_to_join_key_map,
             )
+            for table, _ in plan.grouped_refs
+        ]
 
-        self._drop_unneeded_columns(
-            online_features_response, requested_result_row_names
+    def _get_online_retrieval_plan(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        """Returns the retrieval plan for the given features, reusing a cached plan if possible.
+
+        Plans only depend on the requested features and the registry state, so they are cached
+        until the registry returns a different cached registry proto.
+        """
+        registry_proto = self._registry.get_cached_registry_proto(self.project)
+        if registry_proto is None:
+            return self._plan_online_retrieval(features, full_feature_names)
+
+        # The plans are replaced as a whole, so that a plan built against an older registry
+        # version by a concurrent request is never added to the plans for a newer version.
+        cached_plans = self._online_retrieval_plans
+        if (
+            cached_plans is None
+            or cached_plans[0] is not registry_proto
+            or cached_plans[1] != registry_proto.version_id
+        ):
+            cached_plans = (registry_proto, registry_proto.version_id, {})
+            self._online_retrieval_plans = cached_plans
+        plans = cached_plans[2]
+
+        key: Tuple[Any, ...]
+        if isinstance(features, FeatureService):
+            key = ("feature_service", features, full_feature_names)
+        else:
+            assert isinstance(features, list)
+            key = ("feature_refs", tuple(features), full_feature_names)
+
+        plan = plans.get(key)
+        if plan is None:
+            plan = self._plan_online_retrieval(features, full_feature_names)
+            if len(plans) < MAX_CACHED_ONLINE_RETRIEVAL_PLANS:
+                plans[key] = plan
+        return plan
+
+    def _plan_online_retrieval(
+        self,
+        features: Union[List[str], FeatureService],
+        full_feature_names: bool,
+    ) -> "_OnlineRetrievalPlan":
+        _feature_refs = self._get_features(features, allow_cache=True)
+        (
+            requested_feature_views,
+            requested_request_feature_views,
+            requested_on_demand_feature_views,
+        ) = self._get_feature_views_to_use(
+            features=features, allow_cache=True, hide_dummy_entity=False
+        )
+
+        (
+            entity_name_to_join_key_map,
+            entity_type_map,
+            join_keys_set,
+        ) = self._get_entity_maps(requested_feature_views)
+
+        _validate_feature_refs(_feature_refs, full_feature_names)
+        (
+            grouped_refs,
+            grouped_odfv_refs,
+            grouped_request_fv_refs,
+            _,
+        ) = _group_feature_refs(
+            _feature_refs,
+            requested_feature_views,
+            requested_request_feature_views,
+            requested_on_demand_feature_views,
+        )
+
+        requested_result_row_names = {
+            feat_ref.replace(":", "__") for feat_ref in _feature_refs
+        }
+        if not full_feature_names:
+            requested_result_row_names = {
+                name.rpartition("__")[-1] for name in requested_result_row_names
+            }
+
+        needed_request_data, needed_request_fv_features = self.get_needed_request_data(
+            grouped_odfv_refs, grouped_request_fv_refs
+        )
+
+        entityless_case = DUMMY_ENTITY_NAME in [
+            entity_name
+            for feature_view, _ in grouped_refs
+            for entity_name in feature_view.entities
+        ]
+
+        return _OnlineRetrievalPlan(
+            feature_refs=_feature_refs,
+            requested_request_feature_views=requested_request_feature_views,
+            requested_on_demand_feature_views=requested_on_demand_feature_views,
+            entity_name_to_join_key_map=entity_name_to_join_key_map,
+            entity_type_map=entity_type_map,
+            join_keys_set=join_keys_set,
+            grouped_refs=grouped_refs,
+            grouped_odfv_refs=grouped_odfv_refs,
+            grouped_request_fv_refs=grouped_request_fv_refs,
+            requested_result_row_names=requested_result_row_names,
+            needed_request_data=needed_request_data,
+            needed_request_fv_features=needed_request_fv_features,
+            entityless_case=entityless_case,
         )
-        return OnlineResponse(online_features_response)
 
     @staticmethod
     def _get_columnar_entity_values(
@@ -1937,36 +2767,21 @@ class FeatureStore:
         )
         return unique_entities, indexes
 
-    def _read_from_online_store(
-        self,
-        entity_rows: Iterable[Mapping[str, Value]],
-        provider: Provider,
-        requested_features: List[str],
-        table: FeatureView,
-    ) -> List[Tuple[List[Timestamp], List["FieldStatus.ValueType"], List[Value]]]:
-        """Read and process data from the OnlineStore for a given FeatureView.
-
-        This method guarantees that the order of the data in each element of the
-        List returned is the same as the order of `requested_features`.
-
-        This method assumes that `provider.online_read` returns data for each
-        combination of Entities in `entity_rows` in the same order as they
-        are provided.
-        """
+    @staticmethod
+    def _get_entity_key_protos(
+        entity_rows: Iterable[Mapping[str, Value]]
+    ) -> List[EntityKeyProto]:
         # Instantiate one EntityKeyProto per Entity.
-        entity_key_protos = [
+        return [
             EntityKeyProto(join_keys=row.keys(), entity_values=row.values())
             for row in entity_rows
         ]
 
-        # Fetch data for Entities.
-        read_rows = provider.online_read(
-            config=self.config,
-            table=table,
-            entity_keys=entity_key_protos,
-            requested_features=requested_features,
-        )
-
+    @staticmethod
+    def _read_rows_to_protos(
+        read_rows: List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]],
+        requested_features: List[str],
+    ) -> List[Tuple[List[Timestamp], List["FieldStatus.ValueType"], List[Value]]]:
         # Each row is a set of features for a given entity key. We only need to convert
         # the data to Protobuf once.
         null_value = Value()
@@ -1995,6 +2810,50 @@ class FeatureStore:
             read_row_protos.append((event_timestamps, statuses, values))
         return read_row_protos
 
+    @staticmethod
+    def _read_rows_to_columns(
+        read_rows: List[Tuple[Optional[datetime], Optional[Dict[str, Value]]]],
+        requested_features: List[str],
+        table: FeatureView,
+    ) -> Tuple[np.ndarray, Dict[str, Tuple[pa.Array, np.ndarray]]]:
+        """Converts the data read from the OnlineStore for a given FeatureView into columns.
+
+        Returns the event timestamp of every entity in seconds since the epoch, and for each
+        requested feature its values and `FieldStatus` per entity. Entities are in the same
+        order as `read_rows`.
+        """
+        event_timestamps = np.zeros(len(read_rows), dtype=np.int64)
+        for idx, (row_ts, _) in enumerate(read_rows):
+            if row_ts is not None:
+                # Naive timestamps are in UTC, like in `Timestamp.FromDatetime`.
+                event_timestamps[idx] = calendar.timegm(row_ts.utctimetuple())
+
+        feature_types = {
+            feature.name: feature.dtype.to_value_type() for feature in table.features
+        }
+        columns: Dict[str, Tuple[pa.Array, np.ndarray]] = {}
+        for feature_name in requested_features:
+            feature_values = [
+                None if feature_data is None else feature_data.get(feature_name)
+                for _, feature_data in read_rows
+            ]
+            feature_statuses = np.fromiter(
+                (
+                    FieldStatus.NOT_FOUND if value is None else FieldStatus.PRESENT
+                    for value in feature_values
+                ),
+                dtype=np.int32,
+                count=len(feature_values),
+            )
+            columns[feature_name] = (
+                proto_values_to_pa_array(
+                    feature_values,
+                    feature_types.get(feature_name, ValueType.UNKNOWN),
+                ),
+                feature_statuses,
+            )
+        return event_timestamps, columns
+
     @staticmethod
     def _populate_response_from_feature_data(
         feature_data: Iterable[
@@ -2010,7 +2869,7 @@ class FeatureStore:
     ):
         """Populate the GetOnlineFeaturesResponse with feature data.
 
-        This method assumes that `_read_from_online_store` returns data for each
+        This method assumes that `_read_grouped_refs_from_online_store` returns data for each
         combination of Entities in `entity_rows` in the same order as they
         are provided.
 
@@ -2077,17 +2936,9 @@ class FeatureStore:
         requested_odfv_map = {
             odfv.name: odfv for odfv in requested_on_demand_feature_views
         }
-        requested_odfv_feature_names = requested_odfv_map.keys()
-
-        odfv_feature_refs = defaultdict(list)
-        for feature_ref in feature_refs:
-            view_name, feature_name = feature_ref.split(":")
-            if view_name in requested_odfv_feature_names:
-                odfv_feature_refs[view_name].append(
-                    f"{requested_odfv_map[view_name].projection.name_to_use()}__{feature_name}"
-                    if full_feature_names
-                    else feature_name
-                )
+        odfv_feature_refs = FeatureStore._get_odfv_feature_refs(
+            feature_refs, requested_on_demand_feature_views, full_feature_names
+        )
 
         initial_response = OnlineResponse(online_features_response)
         initial_response_df = initial_response.to_df()
@@ -2123,6 +2974,28 @@ class FeatureStore:
                     )
                 )
 
+    @staticmethod
+    def _get_odfv_feature_refs(
+        feature_refs: List[str],
+        requested_on_demand_feature_views: List[OnDemandFeatureView],
+        full_feature_names: bool,
+    ) -> Dict[str, List[str]]:
+        """Returns the result names of the requested features of each on demand feature view."""
+        requested_odfv_map = {
+            odfv.name: odfv for odfv in requested_on_demand_feature_views
+        }
+
+        odfv_feature_refs: Dict[str, List[str]] = defaultdict(list)
+        for feature_ref in feature_refs:
+            view_name, feature_name = feature_ref.split(":")
+            if view_name in requested_odfv_map:
+                odfv_feature_refs[view_name].append(
+                    f"{requested_odfv_map[view_name].projection.name_to_use()}__{feature_name}"
+                    if full_feature_names
+                    else feature_name
+                )
+        return odfv_feature_refs
+
     @staticmethod
     def _drop_unneeded_columns(
         online_features_response: GetOnlineFeaturesResponse,
@@ -2530,6 +3403,20 @@ def _print_materialization_log(
         )
 
 
+def _without_dummy_entity(
+    feature_view: _FeatureViewT, hide_entity_columns: bool = True
+) -> _FeatureViewT:
+    """
+    Returns a copy of an entityless feature view without its dummy entity. The feature view is copied
+    because the registry may return the same object to every caller of a cached lookup.
+    """
+    feature_view = type(feature_view).from_proto(feature_view.to_proto())
+    feature_view.entities = []
+    if hide_entity_columns:
+        feature_view.entity_columns = []
+    return feature_view
+
+
 def _validate_feature_views(feature_views: List[BaseFeatureView]):
     """Verify feature views have case-insensitively unique names"""
     fv_names = set()
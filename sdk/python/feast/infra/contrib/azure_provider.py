@@ -1,12 +1,13 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT license.
 from datetime import datetime
-from typing import Callable
+from typing import Callable, List, Optional, Tuple
 
 from tqdm import tqdm
 
 from feast.feature_view import FeatureView
 from feast.infra.passthrough_provider import PassthroughProvider
+from feast.infra.provider import Provider
 from feast.infra.registry.base_registry import BaseRegistry
 from feast.repo_config import RepoConfig
 from feast.utils import (
@@ -19,6 +20,19 @@ DEFAULT_BATCH_SIZE = 10_000
 
 
 class AzureProvider(PassthroughProvider):
+    def materialize_feature_views(
+        self,
+        config: RepoConfig,
+        feature_views: List[Tuple[FeatureView, datetime, datetime]],
+        registry: BaseRegistry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> List[Optional[BaseException]]:
+        # Feature views are materialized by this provider rather than by the batch engine.
+        return Provider.materialize_feature_views(
+            self, config, feature_views, registry, project, tqdm_builder
+        )
+
     def materialize_single_feature_view(
         self,
         config: RepoConfig,
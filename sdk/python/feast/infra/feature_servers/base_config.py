@@ -24,6 +24,23 @@ class FeatureLoggingConfig(FeastConfigBaseModel):
     """Timeout for adding new log item to the queue."""
 
 
+class PushBufferConfig(FeastConfigBaseModel):
+    enabled: StrictBool = False
+    """Whether the feature server should buffer pushed rows and write them in batches."""
+
+    flush_interval_ms: StrictInt = 100
+    """Maximum time that pushed rows wait in the buffer before they are written."""
+
+    max_rows: StrictInt = 1000
+    """Number of buffered rows of a push source after which they are written,
+    even if the flush interval hasn't passed yet."""
+
+    ack_after_flush: StrictBool = True
+    """If True, a push request is answered once its rows are written, and write errors are
+    returned to the client. If False, it is answered as soon as its rows are buffered,
+    and write errors are only logged."""
+
+
 class BaseFeatureServerConfig(FeastConfigBaseModel):
     """Base Feature Server config that should be extended"""
 
@@ -32,3 +49,6 @@ class BaseFeatureServerConfig(FeastConfigBaseModel):
 
     feature_logging: Optional[FeatureLoggingConfig]
     """ Feature logging configuration """
+
+    push_buffer: Optional[PushBufferConfig] = None
+    """ Push buffering configuration """
@@ -1,10 +1,27 @@
 import struct
-from typing import List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
 
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.protos.feast.types.Value_pb2 import ValueType
 
+if TYPE_CHECKING:
+    import pyarrow
+
+    from feast import value_type
+
+# The Value proto fields that can be serialized in entity keys, with their value types.
+_ENTITY_KEY_VALUE_TYPES_BY_FIELD = {
+    "string_val": ValueType.STRING,
+    "bytes_val": ValueType.BYTES,
+    "int32_val": ValueType.INT32,
+    "int64_val": ValueType.INT64,
+}
+
 
 def _serialize_val(
     value_type, v: ValueProto, entity_key_serialization_version=1
@@ -72,3 +89,207 @@ def serialize_entity_key(
         output.append(val_bytes)
 
     return b"".join(output)
+
+
+def serialize_entity_keys(
+    entity_keys: Sequence[EntityKeyProto], entity_key_serialization_version=1
+) -> List[bytes]:
+    """
+    Serialize a batch of entity keys. The result is identical to calling serialize_entity_key on every
+    entity key, but the values of entity keys that share the same join keys are encoded column by column.
+    """
+    if not entity_keys:
+        return []
+
+    # Usually all entity keys belong to the same feature view.
+    first_join_keys = entity_keys[0].join_keys
+    if all(entity_key.join_keys == first_join_keys for entity_key in entity_keys):
+        return _serialize_entity_keys_with_join_keys(
+            tuple(first_join_keys), entity_keys, entity_key_serialization_version
+        )
+
+    idxs_by_join_keys: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    for idx, entity_key in enumerate(entity_keys):
+        idxs_by_join_keys[tuple(entity_key.join_keys)].append(idx)
+
+    output: List[bytes] = [b""] * len(entity_keys)
+    for join_keys, idxs in idxs_by_join_keys.items():
+        serialized = _serialize_entity_keys_with_join_keys(
+            join_keys,
+            [entity_keys[idx] for idx in idxs],
+            entity_key_serialization_version,
+        )
+        for idx, entity_key_bin in zip(idxs, serialized):
+            output[idx] = entity_key_bin
+    return output
+
+
+def serialize_entity_key_columns(
+    join_key_values: Mapping[str, Union[Sequence[Any], np.ndarray, "pyarrow.Array"]],
+    join_key_types: Mapping[str, "value_type.ValueType"],
+    entity_key_serialization_version=1,
+) -> List[bytes]:
+    """
+    Serialize entity keys given as columns of native values, e.g. NumPy or Arrow arrays, one per join key.
+    Row i of the result is identical to serialize_entity_key for the entity key made up of the i-th value
+    of every column.
+
+    Args:
+        join_key_values: The values of each join key.
+        join_key_types: The value type of each join key. Only strings, bytes, and 32 and 64 bit integers
+            are supported.
+        entity_key_serialization_version: The entity key serialization version.
+
+    Returns:
+        The serialized entity keys.
+    """
+    join_keys = tuple(join_key_values.keys())
+    columns = []
+    value_types = []
+    for join_key in join_keys:
+        feast_value_type = join_key_types[join_key]
+        if feast_value_type.value not in _ENTITY_KEY_VALUE_TYPES_BY_FIELD.values():
+            raise ValueError(
+                f"Value type not supported for entity keys: {feast_value_type}"
+            )
+        values = join_key_values[join_key]
+        if hasattr(values, "null_count"):
+            # Arrow array
+            if values.null_count:
+                raise ValueError(f"Entity key {join_key} contains null values.")
+            values = values.to_pylist()  # type: ignore
+        columns.append(values)
+        value_types.append(feast_value_type.value)
+    return _serialize_entity_value_columns(
+        join_keys, columns, value_types, entity_key_serialization_version
+    )
+
+
+@lru_cache(maxsize=None)
+def _serialize_entity_key_prefix(join_keys: Tuple[str, ...]) -> bytes:
+    return serialize_entity_key_prefix(list(join_keys))
+
+
+def _serialize_entity_keys_with_join_keys(
+    join_keys: Tuple[str, ...],
+    entity_keys: Sequence[EntityKeyProto],
+    entity_key_serialization_version: int,
+) -> List[bytes]:
+    """
+    Serialize entity keys that all have the given join keys. The values are encoded column by column,
+    unless a join key has values of several types.
+    """
+    if len(set(join_keys)) == len(join_keys):
+        native_columns: List[List[Any]] = []
+        value_types: List[int] = []
+        for column in zip(*[entity_key.entity_values for entity_key in entity_keys]):
+            fields = {v.WhichOneof("val") for v in column}
+            field = fields.pop() if len(fields) == 1 else None
+            if field not in _ENTITY_KEY_VALUE_TYPES_BY_FIELD:
+                break
+            native_columns.append([getattr(v, field) for v in column])
+            value_types.append(_ENTITY_KEY_VALUE_TYPES_BY_FIELD[field])
+        else:
+            return _serialize_entity_value_columns(
+                join_keys,
+                native_columns,
+                value_types,
+                entity_key_serialization_version,
+            )
+
+    return [
+        serialize_entity_key(
+            entity_key,
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+        for entity_key in entity_keys
+    ]
+
+
+def _serialize_entity_value_columns(
+    join_keys: Tuple[str, ...],
+    columns: Sequence[Union[Sequence[Any], np.ndarray]],
+    value_types: Sequence[int],
+    entity_key_serialization_version: int,
+) -> List[bytes]:
+    num_rows = len(columns[0]) if columns else 0
+    if num_rows == 0:
+        return []
+
+    prefix = _serialize_entity_key_prefix(join_keys)
+    # Values are ordered by join key, like the prefix.
+    order = sorted(range(len(join_keys)), key=lambda i: join_keys[i])
+
+    encoded_columns: List[Union[np.ndarray, List[bytes]]] = [
+        _encode_entity_value_column(
+            columns[i], value_types[i], entity_key_serialization_version
+        )
+        for i in order
+    ]
+
+    if all(isinstance(column, np.ndarray) for column in encoded_columns):
+        # Every entity key has the same length, so all of them can be encoded at once.
+        matrix = np.hstack(
+            [
+                np.broadcast_to(
+                    np.frombuffer(prefix, dtype=np.uint8), (num_rows, len(prefix))
+                ),
+                *encoded_columns,
+            ]
+        )
+        return _split_rows(matrix)
+
+    byte_columns = [
+        _split_rows(column) if isinstance(column, np.ndarray) else column
+        for column in encoded_columns
+    ]
+    if len(byte_columns) == 1:
+        return [prefix + value_bin for value_bin in byte_columns[0]]
+    return [prefix + b"".join(row) for row in zip(*byte_columns)]
+
+
+def _encode_entity_value_column(
+    values: Union[Sequence[Any], np.ndarray],
+    value_type: int,
+    entity_key_serialization_version: int,
+) -> Union[np.ndarray, List[bytes]]:
+    """
+    Encode the values of a single join key like serialize_entity_key does, including the value type and
+    length. Integers are encoded into a matrix with one row of bytes per value, other values into bytes.
+    """
+    type_bin = struct.pack("<I", value_type)
+    if value_type == ValueType.STRING:
+        return [
+            type_bin + struct.pack("<I", len(value_bin)) + value_bin
+            for value_bin in (str(v).encode("utf8") for v in values)
+        ]
+    if value_type == ValueType.BYTES:
+        return [type_bin + struct.pack("<I", len(v)) + v for v in values]
+
+    ints = np.asarray(values)
+    if ints.dtype.kind not in "iu":
+        ints = np.array([int(v) for v in values], dtype=np.int64)
+    dtype: np.dtype
+    if value_type == ValueType.INT32:
+        int_format, dtype = "<i", np.dtype("<i4")
+    elif 0 <= entity_key_serialization_version <= 1:
+        int_format, dtype = "<l", np.dtype("<i4")
+    else:
+        int_format, dtype = "<q", np.dtype("<i8")
+    out_of_range = (ints < np.iinfo(dtype).min) | (ints > np.iinfo(dtype).max)
+    if out_of_range.any():
+        # Raise the same error as struct.pack in serialize_entity_key.
+        struct.pack(int_format, int(ints[out_of_range.argmax()]))
+
+    encoded = np.empty((len(ints), 8 + dtype.itemsize), dtype=np.uint8)
+    encoded[:, :8] = np.frombuffer(
+        type_bin + struct.pack("<I", dtype.itemsize), dtype=np.uint8
+    )
+    encoded[:, 8:] = ints.astype(dtype).view(np.uint8).reshape(len(ints), -1)
+    return encoded
+
+
+def _split_rows(matrix: np.ndarray) -> List[bytes]:
+    row_length = matrix.shape[1]
+    buffer = np.ascontiguousarray(matrix).tobytes()
+    return [buffer[i : i + row_length] for i in range(0, len(buffer), row_length)]
@@ -1,7 +1,22 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, List, Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
 
+from pydantic import StrictInt
 from tqdm import tqdm
 
 from feast.batch_feature_view import BatchFeatureView
@@ -34,6 +49,15 @@ class LocalMaterializationEngineConfig(FeastConfigBaseModel):
     type: Literal["local"] = "local"
     """ Type selector"""
 
+    max_workers: StrictInt = 1
+    """ (optional) The maximum number of feature views that are materialized concurrently. Values greater
+    than 1 require an online store that supports concurrent writes."""
+
+    pipeline_queue_size: StrictInt = 0
+    """ (optional) If greater than 0, batches of each feature view are converted to protos in a background
+    thread while previous batches are written to the online store. The value is the maximum number of
+    converted batches waiting to be written."""
+
 
 @dataclass
 class LocalMaterializationJob(MaterializationJob):
@@ -107,8 +131,8 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
     def materialize(
         self, registry, tasks: List[MaterializationTask]
     ) -> List[MaterializationJob]:
-        return [
-            self._materialize_one(
+        def materialize_task(task: MaterializationTask) -> MaterializationJob:
+            return self._materialize_one(
                 registry,
                 task.feature_view,
                 task.start_time,
@@ -116,8 +140,15 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
                 task.project,
                 task.tqdm_builder,
             )
-            for task in tasks
-        ]
+
+        max_workers = min(self.repo_config.batch_engine.max_workers, len(tasks))
+        if max_workers <= 1:
+            return [materialize_task(task) for task in tasks]
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="feast_materialize"
+        ) as executor:
+            return list(executor.map(materialize_task, tasks))
 
     def _materialize_one(
         self,
@@ -153,29 +184,42 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
                 end_date=end_date,
             )
 
-            table = offline_job.to_arrow()
-
-            if feature_view.batch_source.field_mapping is not None:
-                table = _run_pyarrow_field_mapping(
-                    table, feature_view.batch_source.field_mapping
-                )
-
+            field_mapping = feature_view.batch_source.field_mapping
             join_key_to_value_type = {
                 entity.name: entity.dtype.to_value_type()
                 for entity in feature_view.entity_columns
             }
 
-            with tqdm_builder(table.num_rows) as pbar:
-                for batch in table.to_batches(DEFAULT_BATCH_SIZE):
-                    rows_to_write = _convert_arrow_to_proto(
+            def convert_batches() -> Generator[List[Any], None, None]:
+                # The offline store result is consumed incrementally, so that only a few batches are held
+                # in memory at a time.
+                for batch in offline_job.to_arrow_batches(
+                    batch_size=DEFAULT_BATCH_SIZE
+                ):
+                    if field_mapping:
+                        batch = _run_pyarrow_field_mapping(batch, field_mapping)
+                    yield _convert_arrow_to_proto(
                         batch, feature_view, join_key_to_value_type
                     )
-                    self.online_store.online_write_batch(
-                        self.repo_config,
-                        feature_view,
-                        rows_to_write,
-                        lambda x: pbar.update(x),
+
+            # The number of rows is unknown upfront, so the total grows as batches are read.
+            with tqdm_builder(0) as pbar:
+                batches_to_write = convert_batches()
+                pipeline_queue_size = self.repo_config.batch_engine.pipeline_queue_size
+                if pipeline_queue_size > 0:
+                    batches_to_write = _iterate_in_background(
+                        batches_to_write, pipeline_queue_size
                     )
+                with closing(batches_to_write):
+                    for rows_to_write in batches_to_write:
+                        pbar.total += len(rows_to_write)
+                        pbar.refresh()
+                        self.online_store.online_write_batch(
+                            self.repo_config,
+                            feature_view,
+                            rows_to_write,
+                            lambda x: pbar.update(x),
+                        )
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.SUCCEEDED
             )
@@ -183,3 +227,55 @@ class LocalMaterializationEngine(BatchMaterializationEngine):
             return LocalMaterializationJob(
                 job_id=job_id, status=MaterializationJobStatus.ERROR, error=e
             )
+
+
+def _iterate_in_background(
+    items: Iterable[Any], queue_size: int
+) -> Generator[Any, None, None]:
+    """
+    Iterates over `items` in a background thread, buffering at most `queue_size` items that haven't been
+    consumed yet. Exceptions raised while iterating are raised to the consumer. If the consumer stops early,
+    the background thread stops too.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    end = object()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except BaseException as e:
+            put((end, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(
+        target=produce, name="feast_materialize_producer", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is end:
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
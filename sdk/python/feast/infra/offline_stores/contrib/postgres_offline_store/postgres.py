@@ -1,4 +1,5 @@
 import contextlib
+import uuid
 from dataclasses import asdict
 from datetime import datetime
 from typing import (
@@ -298,6 +299,38 @@ class PostgreSQLRetrievalJob(RetrievalJob):
                 )
                 return table
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        with self._query_generator() as query:
+            with _get_conn(self.config.offline_store) as conn:
+                conn.set_session(readonly=True)
+                # A named cursor is a server-side cursor, so rows are fetched a batch at a time.
+                with conn.cursor(name=f"feast_{uuid.uuid4().hex}") as cur:
+                    cur.execute(query)
+                    schema = None
+                    while True:
+                        rows = cur.fetchmany(batch_size or cur.itersize)
+                        if schema is None:
+                            schema = pa.schema(
+                                [
+                                    (c.name, pg_type_code_to_arrow(c.type_code))
+                                    for c in cur.description
+                                ]
+                            )
+                        if not rows:
+                            return
+                        columns = list(zip(*rows))
+                        yield pa.RecordBatch.from_arrays(
+                            [
+                                pa.array(column, type=field.type)
+                                for column, field in zip(columns, schema)
+                            ],
+                            schema=schema,
+                        )
+
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
         return self._metadata
@@ -1,15 +1,23 @@
 import os
+import posixpath
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
 
 import dask.dataframe as dd
+import fsspec
+import numpy as np
 import pandas as pd
 import pyarrow
+import pyarrow.compute
 import pyarrow.dataset
+import pyarrow.fs
 import pyarrow.parquet
 import pytz
+from pydantic import StrictBool, StrictInt
 from pydantic.typing import Literal
 
 from feast.data_source import DataSource
@@ -20,6 +28,7 @@ from feast.errors import (
 from feast.feature_logging import LoggingConfig, LoggingSource
 from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL, FeatureView
 from feast.infra.offline_stores.file_source import (
+    DATE_PARTITION_COLUMN,
     FileLoggingDestination,
     FileSource,
     SavedDatasetFileStorage,
@@ -41,8 +50,16 @@ from feast.usage import log_exceptions_and_usage
 from feast.utils import (
     _get_requested_feature_views_to_features_dict,
     _run_dask_field_mapping,
+    make_tzaware,
 )
 
+# The column that numbers the entity rows while feature views are joined with them
+_ENTITY_ROW_ID = "__entity_row_id"
+# The date partition of appended rows without event timestamp
+_UNKNOWN_DATE_PARTITION = "unknown"
+
+_T = TypeVar("_T")
+
 
 class FileOfflineStoreConfig(FeastConfigBaseModel):
     """Offline store config for local (file-based) store"""
@@ -50,6 +67,26 @@ class FileOfflineStoreConfig(FeastConfigBaseModel):
     type: Literal["file"] = "file"
     """ Offline store type selector"""
 
+    join_engine: Literal["dask", "asof"] = "dask"
+    """ (optional) How get_historical_features joins feature views with the entity dataframe. "dask" merges
+    every row of a feature view with the matching entity rows before filtering them with dask. "asof" sorts the
+    entity dataframe once and joins the latest feature row of every entity row with pandas.merge_asof, which
+    needs far less memory for entities with long histories."""
+
+    max_join_workers: Optional[StrictInt] = None
+    """ (optional) The maximum number of feature views that get_historical_features joins with the entity
+    dataframe concurrently. Defaults to the number of CPUs. Set to 1 to join feature views one by one."""
+
+    offline_write_mode: Literal["rewrite", "append"] = "rewrite"
+    """ (optional) How offline_write_batch writes rows to a file source. "rewrite" rewrites the parquet file of
+    the source with the new rows added. "append" writes the new rows to new parquet files in the directory of
+    the source, which can be compacted with compact_file_source."""
+
+    offline_write_partition_by_date: StrictBool = False
+    """ (optional) If True, rows appended by offline_write_batch are written to a hive partition per event date
+    (in UTC), e.g. date=2023-01-31, instead of to the directory of the source, so that reads skip the dates
+    they don't need."""
+
 
 class FileRetrievalJob(RetrievalJob):
     def __init__(
@@ -58,11 +95,16 @@ class FileRetrievalJob(RetrievalJob):
         full_feature_names: bool,
         on_demand_feature_views: Optional[List[OnDemandFeatureView]] = None,
         metadata: Optional[RetrievalMetadata] = None,
+        batch_evaluation_function: Optional[
+            Callable[[Optional[int]], Iterator[pyarrow.RecordBatch]]
+        ] = None,
     ):
         """Initialize a lazy historical retrieval job"""
 
         # The evaluation function executes a stored procedure to compute a historical retrieval.
         self.evaluation_function = evaluation_function
+        # The optional batch evaluation function computes the same result incrementally, given a batch size.
+        self.batch_evaluation_function = batch_evaluation_function
         self._full_feature_names = full_feature_names
         self._on_demand_feature_views = on_demand_feature_views or []
         self._metadata = metadata
@@ -88,6 +130,17 @@ class FileRetrievalJob(RetrievalJob):
         df = self.evaluation_function().compute()
         return pyarrow.Table.from_pandas(df)
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        if self.batch_evaluation_function is None:
+            return super()._to_arrow_batches_internal(
+                batch_size=batch_size, timeout=timeout
+            )
+        return self.batch_evaluation_function(batch_size)
+
     def persist(
         self,
         storage: SavedDatasetStorage,
@@ -115,6 +168,43 @@ class FileRetrievalJob(RetrievalJob):
                 self.to_arrow(), root_path=path, filesystem=filesystem
             )
 
+    @classmethod
+    def _persist_tables(
+        cls,
+        schema: pyarrow.Schema,
+        tables: Iterator[pyarrow.Table],
+        storage: SavedDatasetStorage,
+        allow_overwrite: bool = False,
+    ):
+        """
+        Persists the tables to a parquet file, or to a directory with a parquet file per table.
+        """
+        assert isinstance(storage, SavedDatasetFileStorage)
+
+        # Check if the specified location already exists.
+        if not allow_overwrite and os.path.exists(storage.file_options.uri):
+            raise SavedDatasetLocationAlreadyExists(location=storage.file_options.uri)
+
+        filesystem, path = FileSource.create_filesystem_and_path(
+            storage.file_options.uri,
+            storage.file_options.s3_endpoint_override,
+        )
+
+        if not path.endswith(".parquet"):
+            # otherwise assume destination is directory
+            for table in tables:
+                pyarrow.parquet.write_to_dataset(
+                    table, root_path=path, filesystem=filesystem
+                )
+            return
+
+        writer = pyarrow.parquet.ParquetWriter(path, schema, filesystem=filesystem)
+        try:
+            for table in tables:
+                writer.write_table(table)
+        finally:
+            writer.close()
+
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
         return self._metadata
@@ -212,23 +302,23 @@ class FileOfflineStore(OfflineStore):
                 entity_df_event_timestamp_col
             )
 
-            all_join_keys = []
+            # Number the entity rows, so that the features of every feature view can be joined back to them
+            entity_columns = list(entity_df_with_features.columns)
+            entity_df_with_features[_ENTITY_ROW_ID] = 1
+            entity_df_with_features[_ENTITY_ROW_ID] = entity_df_with_features[
+                _ENTITY_ROW_ID
+            ].cumsum()
 
-            # Load feature view data from sources and join them incrementally
-            for feature_view, features in feature_views_to_features.items():
+            def join_feature_view(
+                feature_view: FeatureView, features: List[str]
+            ) -> dd.DataFrame:
                 timestamp_field = feature_view.batch_source.timestamp_field
                 created_timestamp_column = (
                     feature_view.batch_source.created_timestamp_column
                 )
 
                 # Build a list of entity columns to join on (from the right table)
-                join_keys = []
-
-                for entity_column in feature_view.entity_columns:
-                    join_key = feature_view.projection.join_key_map.get(
-                        entity_column.name, entity_column.name
-                    )
-                    join_keys.append(join_key)
+                join_keys = _get_join_keys(feature_view)
 
                 right_entity_key_columns = [
                     timestamp_field,
@@ -236,9 +326,16 @@ class FileOfflineStore(OfflineStore):
                 ] + join_keys
                 right_entity_key_columns = [c for c in right_entity_key_columns if c]
 
-                all_join_keys = list(set(all_join_keys + join_keys))
-
-                df_to_join = _read_datasource(feature_view.batch_source)
+                df_to_join = _read_datasource(
+                    feature_view.batch_source,
+                    columns=_get_source_columns(
+                        feature_view, features, created_timestamp_column
+                    ),
+                    timestamp_field=_get_source_column(feature_view, timestamp_field),
+                    timestamp_filters=_get_ttl_timestamp_filters(
+                        feature_view, entity_df_event_timestamp_range
+                    ),
+                )
 
                 df_to_join, timestamp_field = _field_mapping(
                     df_to_join,
@@ -263,25 +360,68 @@ class FileOfflineStore(OfflineStore):
                     timestamp_field,
                 )
 
+                # Keep the latest feature row of every entity row
                 df_to_join = _drop_duplicates(
                     df_to_join,
-                    all_join_keys,
+                    [_ENTITY_ROW_ID],
                     timestamp_field,
                     created_timestamp_column,
                     entity_df_event_timestamp_col,
                 )
 
-                entity_df_with_features = _drop_columns(
+                df_to_join = _drop_columns(
                     df_to_join, features, timestamp_field, created_timestamp_column
                 )
 
-                # Ensure that we delete dataframes to free up memory
-                del df_to_join
+                # Only the features are joined back to the entity rows
+                return df_to_join[
+                    [
+                        column
+                        for column in df_to_join.columns
+                        if column not in entity_columns
+                    ]
+                ].persist()
+
+            # Feature views are joined with the entity rows independently of each other
+            for df_to_join in _map_feature_views(
+                config.offline_store, join_feature_view, feature_views_to_features
+            ):
+                entity_df_with_features = dd.merge(
+                    entity_df_with_features, df_to_join, on=_ENTITY_ROW_ID, how="left"
+                ).persist()
+
+            all_join_keys = list(
+                dict.fromkeys(
+                    join_key
+                    for feature_view in feature_views_to_features
+                    for join_key in _get_join_keys(feature_view)
+                )
+            )
+            entity_df_with_features = entity_df_with_features.drop_duplicates(
+                all_join_keys + [entity_df_event_timestamp_col],
+                keep="last",
+                ignore_index=True,
+            )
 
-            return entity_df_with_features.persist()
+            return entity_df_with_features.drop(_ENTITY_ROW_ID, axis=1).persist()
+
+        def evaluate_historical_retrieval_asof():
+            return dd.from_pandas(
+                _point_in_time_join_asof(
+                    config.offline_store,
+                    entity_df,
+                    entity_df_event_timestamp_col,
+                    entity_df_event_timestamp_range,
+                    feature_views_to_features,
+                    full_feature_names,
+                ),
+                npartitions=1,
+            )
 
         job = FileRetrievalJob(
-            evaluation_function=evaluate_historical_retrieval,
+            evaluation_function=evaluate_historical_retrieval_asof
+            if config.offline_store.join_engine == "asof"
+            else evaluate_historical_retrieval,
             full_feature_names=full_feature_names,
             on_demand_feature_views=OnDemandFeatureView.get_requested_odfvs(
                 feature_refs, project, registry
@@ -312,7 +452,17 @@ class FileOfflineStore(OfflineStore):
 
         # Create lazy function that is only called from the RetrievalJob object
         def evaluate_offline_job():
-            source_df = _read_datasource(data_source)
+            ts_columns = (
+                [timestamp_field, created_timestamp_column]
+                if created_timestamp_column
+                else [timestamp_field]
+            )
+            source_df = _read_datasource(
+                data_source,
+                columns=join_key_columns + feature_name_columns + ts_columns,
+                timestamp_field=timestamp_field,
+                timestamp_filters=[(">=", start_date), ("<", end_date)],
+            )
 
             source_df = _normalize_timestamp(
                 source_df, timestamp_field, created_timestamp_column
@@ -324,11 +474,6 @@ class FileOfflineStore(OfflineStore):
                     data_source.path, set(join_key_columns), source_columns
                 )
 
-            ts_columns = (
-                [timestamp_field, created_timestamp_column]
-                if created_timestamp_column
-                else [timestamp_field]
-            )
             # try-catch block is added to deal with this issue https://github.com/dask/dask/issues/8939.
             # TODO(kevjumba): remove try catch when fix is merged upstream in Dask.
             try:
@@ -371,10 +516,42 @@ class FileOfflineStore(OfflineStore):
 
             return source_df[list(columns_to_extract)].persist()
 
+        def evaluate_offline_job_batches(batch_size: Optional[int]):
+            dataset = _read_datasource_as_dataset(data_source)
+            ts_columns = [timestamp_field]
+            if created_timestamp_column:
+                ts_columns.append(created_timestamp_column)
+            if dataset is None or not all(
+                dataset.schema.get_field_index(column) != -1
+                and pyarrow.types.is_timestamp(dataset.schema.field(column).type)
+                for column in ts_columns
+            ):
+                # Fall back to the dask implementation, which also parses other timestamp representations.
+                table = pyarrow.Table.from_pandas(evaluate_offline_job().compute())
+                return iter(table.to_batches(max_chunksize=batch_size))
+
+            source_columns = set(dataset.schema.names)
+            if not set(join_key_columns).issubset(source_columns):
+                raise FeastJoinKeysDuringMaterialization(
+                    data_source.path, set(join_key_columns), source_columns
+                )
+
+            return _pull_latest_batches_from_dataset(
+                dataset,
+                join_key_columns=list(dict.fromkeys(join_key_columns)),
+                feature_name_columns=feature_name_columns,
+                timestamp_field=timestamp_field,
+                created_timestamp_column=created_timestamp_column,
+                start_date=start_date,
+                end_date=end_date,
+                batch_size=batch_size,
+            )
+
         # When materializing a single feature view, we don't need full feature names. On demand transforms aren't materialized
         return FileRetrievalJob(
             evaluation_function=evaluate_offline_job,
             full_feature_names=False,
+            batch_evaluation_function=evaluate_offline_job_batches,
         )
 
     @staticmethod
@@ -454,6 +631,14 @@ class FileOfflineStore(OfflineStore):
                 f"The schema is expected to be {pa_schema} with the columns (in this exact order) to be {column_names}."
             )
 
+        if config.offline_store.offline_write_mode == "append":
+            _append_to_file_source(
+                feature_view,
+                table,
+                partition_by_date=config.offline_store.offline_write_partition_by_date,
+            )
+            return
+
         file_options = feature_view.batch_source.file_options
         filesystem, path = FileSource.create_filesystem_and_path(
             file_options.uri, file_options.s3_endpoint_override
@@ -471,6 +656,163 @@ class FileOfflineStore(OfflineStore):
         writer.close()
 
 
+def compact_file_source(
+    data_source: FileSource, max_file_size: int = 128 * 1024 * 1024
+) -> None:
+    """
+    Merges the small parquet files of a file source whose path is a directory, e.g. after rows are appended
+    with offline_write_batch, so that reads open fewer files. Files of different subdirectories aren't merged.
+
+    Compaction can run in the background while rows are appended. The merged files are deleted after the
+    compacted file is written, so readers may see duplicated rows while compaction runs, but never miss rows.
+
+    Args:
+        data_source: The file source.
+        max_file_size (optional): Files of at least this many bytes aren't merged, and files are merged into
+            files of about this size.
+    """
+    filesystem, path = _get_filesystem_and_path(data_source.file_options)
+
+    files_by_directory = defaultdict(list)
+    for file_info in _list_parquet_files(filesystem, path):
+        if file_info.size < max_file_size:
+            files_by_directory[posixpath.dirname(file_info.path)].append(file_info)
+
+    for directory, file_infos in files_by_directory.items():
+        file_infos.sort(key=lambda file_info: file_info.path)
+        groups: List[List[str]] = [[]]
+        group_size = 0
+        for file_info in file_infos:
+            if group_size >= max_file_size:
+                groups.append([])
+                group_size = 0
+            groups[-1].append(file_info.path)
+            group_size += file_info.size
+
+        for group in groups:
+            if len(group) < 2:
+                continue
+            tables = [
+                pyarrow.parquet.read_table(file_path, filesystem=filesystem)
+                for file_path in group
+            ]
+            schema = tables[0].schema
+            _write_parquet_file(
+                filesystem,
+                directory,
+                pyarrow.concat_tables(
+                    [
+                        table if table.schema == schema else table.cast(schema)
+                        for table in tables
+                    ]
+                ),
+            )
+            for file_path in group:
+                filesystem.delete_file(file_path)
+
+
+def _append_to_file_source(
+    feature_view: FeatureView, table: pyarrow.Table, partition_by_date: bool
+):
+    """Writes the rows of the table to new parquet files in the directory of the batch source."""
+    assert isinstance(feature_view.batch_source, FileSource)
+    file_options = feature_view.batch_source.file_options
+    filesystem, path = _get_filesystem_and_path(file_options)
+
+    if filesystem.get_file_info(path).type == pyarrow.fs.FileType.File:
+        raise ValueError(
+            f"Rows can only be appended to a file source whose path is a directory, but {file_options.uri} is a file."
+        )
+    existing_files = _list_parquet_files(filesystem, path)
+    if existing_files:
+        schema = pyarrow.parquet.read_schema(
+            existing_files[0].path, filesystem=filesystem
+        )
+        if table.schema != schema:
+            table = table.cast(schema)
+
+    timestamp_column = _get_source_column(
+        feature_view, feature_view.batch_source.timestamp_field
+    )
+    partition_by_date = partition_by_date and pyarrow.types.is_timestamp(
+        table.schema.field(timestamp_column).type
+    )
+    # Dask can't read a directory with both hive partitions and parquet files outside of them.
+    for file_info in existing_files:
+        in_date_partition = posixpath.relpath(file_info.path, path).startswith(
+            f"{DATE_PARTITION_COLUMN}="
+        )
+        if partition_by_date and not in_date_partition:
+            raise ValueError(
+                f"Rows can only be appended to {file_options.uri} by date if all its parquet files are in "
+                f"{DATE_PARTITION_COLUMN}=YYYY-MM-DD directories, but {file_info.path} isn't."
+            )
+        if in_date_partition and not partition_by_date:
+            raise ValueError(
+                f"The rows of {file_options.uri} are partitioned by date, so rows can only be appended to it "
+                f"with offline_write_partition_by_date and a timestamp column."
+            )
+
+    if not partition_by_date:
+        _write_parquet_file(filesystem, path, table)
+        return
+
+    timestamps = table.column(timestamp_column)
+    dates = pyarrow.compute.strftime(
+        timestamps.cast(pyarrow.timestamp(timestamps.type.unit, tz="UTC")),
+        format="%Y-%m-%d",
+    )
+    # Rows without event timestamp are never read by a timestamp filter, and have a partition of their own,
+    # since dask can't read files in the null partition.
+    dates = pyarrow.compute.fill_null(dates, _UNKNOWN_DATE_PARTITION)
+    for date in pyarrow.compute.unique(dates).to_pylist():
+        _write_parquet_file(
+            filesystem,
+            posixpath.join(path, f"{DATE_PARTITION_COLUMN}={date}"),
+            table.filter(pyarrow.compute.equal(dates, date)),
+        )
+
+
+def _get_filesystem_and_path(file_options) -> Tuple[pyarrow.fs.FileSystem, str]:
+    filesystem, path = FileSource.create_filesystem_and_path(
+        file_options.uri, file_options.s3_endpoint_override
+    )
+    if filesystem is None:
+        return pyarrow.fs.LocalFileSystem(), os.path.abspath(path)
+    return filesystem, path
+
+
+def _list_parquet_files(
+    filesystem: pyarrow.fs.FileSystem, path: str
+) -> List[pyarrow.fs.FileInfo]:
+    """Lists the parquet files in a directory and its subdirectories, except hidden files."""
+    if filesystem.get_file_info(path).type != pyarrow.fs.FileType.Directory:
+        return []
+    return [
+        file_info
+        for file_info in filesystem.get_file_info(
+            pyarrow.fs.FileSelector(path, recursive=True)
+        )
+        if file_info.type == pyarrow.fs.FileType.File
+        and file_info.extension == "parquet"
+        and not any(
+            part.startswith(("_", "."))
+            for part in posixpath.relpath(file_info.path, path).split("/")
+        )
+    ]
+
+
+def _write_parquet_file(
+    filesystem: pyarrow.fs.FileSystem, directory: str, table: pyarrow.Table
+):
+    filesystem.create_dir(directory, recursive=True)
+    pyarrow.parquet.write_table(
+        table,
+        posixpath.join(directory, f"{uuid.uuid4().hex}.parquet"),
+        filesystem=filesystem,
+    )
+
+
 def _get_entity_df_event_timestamp_range(
     entity_df: Union[pd.DataFrame, str],
     entity_df_event_timestamp_col: str,
@@ -492,7 +834,24 @@ def _get_entity_df_event_timestamp_range(
     )
 
 
-def _read_datasource(data_source) -> dd.DataFrame:
+def _read_datasource(
+    data_source,
+    columns: Optional[List[str]] = None,
+    timestamp_field: Optional[str] = None,
+    timestamp_filters: Optional[List[Tuple[str, datetime]]] = None,
+) -> dd.DataFrame:
+    """
+    Reads a file source with dask.
+
+    Args:
+        data_source: The file source.
+        columns (optional): The columns to read. All columns are read if any of them is missing.
+        timestamp_field (optional): The timestamp column that the timestamp filters apply to.
+        timestamp_filters (optional): Comparisons, e.g. (">=", start_date), that rows of the timestamp
+            column should satisfy. They are pushed down into the parquet reader, which skips the row
+            groups and hive partitions that can't satisfy them, but rows may still have to be filtered
+            afterwards.
+    """
     storage_options = (
         {
             "client_kwargs": {
@@ -503,12 +862,202 @@ def _read_datasource(data_source) -> dd.DataFrame:
         else None
     )
 
+    if columns is None and not timestamp_filters:
+        return dd.read_parquet(data_source.path, storage_options=storage_options)
+
+    # Only the metadata is read to decide which columns and filters the parquet reader can use.
+    filesystem, path = fsspec.core.url_to_fs(
+        data_source.path, **(storage_options or {})
+    )
+    dataset = pyarrow.parquet.ParquetDataset(path, filesystem=filesystem)
+    schema = dataset.schema
+
+    read_columns = None
+    if columns is not None and set(columns).issubset(schema.names):
+        read_columns = list(dict.fromkeys(columns))
+
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+    if (
+        timestamp_field
+        and timestamp_filters
+        and timestamp_field in schema.names
+        and pyarrow.types.is_timestamp(schema.field(timestamp_field).type)
+    ):
+        timestamp_tz = getattr(
+            schema.field(timestamp_field).type.to_pandas_dtype(), "tz", None
+        )
+        filters = [
+            (timestamp_field, op, _to_timezone(value, timestamp_tz))
+            for op, value in timestamp_filters
+        ]
+
+        # Appended rows are partitioned by their date in UTC, and timestamps in the same date partitions as
+        # the bounds of the filters may satisfy them.
+        if (
+            dataset.partitioning is not None
+            and DATE_PARTITION_COLUMN in dataset.partitioning.schema.names
+        ):
+            for op, value in timestamp_filters:
+                date = _to_timezone(value, None).strftime("%Y-%m-%d")
+                if op in (">", ">="):
+                    filters.append((DATE_PARTITION_COLUMN, ">=", date))
+                elif op in ("<", "<="):
+                    filters.append((DATE_PARTITION_COLUMN, "<=", date))
+
     return dd.read_parquet(
         data_source.path,
         storage_options=storage_options,
+        columns=read_columns,
+        filters=filters,
+    )
+
+
+def _get_source_column(feature_view: FeatureView, column: str) -> str:
+    """Returns the name in the batch source of a column of the feature view."""
+    for source_column, mapped_column in (
+        feature_view.batch_source.field_mapping or {}
+    ).items():
+        if mapped_column == column:
+            return source_column
+    return column
+
+
+def _get_source_columns(
+    feature_view: FeatureView,
+    features: List[str],
+    created_timestamp_column: Optional[str],
+) -> List[str]:
+    """Returns the columns of the batch source that are needed to join the given features."""
+    columns = [
+        entity_column.name
+        for entity_column in feature_view.entity_columns
+        if entity_column.name != DUMMY_ENTITY_ID
+    ]
+    columns += [feature_view.batch_source.timestamp_field]
+    if created_timestamp_column:
+        columns.append(created_timestamp_column)
+    columns += features
+    return [_get_source_column(feature_view, column) for column in columns]
+
+
+def _get_ttl_timestamp_filters(
+    feature_view: FeatureView,
+    entity_df_event_timestamp_range: Tuple[datetime, datetime],
+) -> List[Tuple[str, datetime]]:
+    """
+    Returns the range of event timestamps that can be joined with an entity dataframe whose event timestamps
+    are in the given range, like _filter_ttl.
+    """
+    start_date, end_date = entity_df_event_timestamp_range
+    if feature_view.ttl and feature_view.ttl.total_seconds() != 0:
+        return [(">=", start_date - feature_view.ttl), ("<=", end_date)]
+    return [("<=", end_date)]
+
+
+def _to_timezone(value: datetime, tz) -> datetime:
+    """
+    Converts a datetime to the given time zone, or to a tz-naive datetime in UTC if the time zone is None.
+    Tz-naive datetimes are assumed to be in UTC.
+    """
+    value = make_tzaware(value)
+    if tz is None:
+        return value.astimezone(pytz.utc).replace(tzinfo=None)
+    return value.astimezone(tz)
+
+
+def _read_datasource_as_dataset(
+    data_source: FileSource,
+) -> Optional[pyarrow.dataset.Dataset]:
+    """
+    Opens the parquet files of a file source as a pyarrow dataset, or returns None if the
+    file system of the source is only supported through dask.
+    """
+    if "://" in data_source.path and not data_source.path.startswith("s3://"):
+        return None
+
+    filesystem, path = FileSource.create_filesystem_and_path(
+        data_source.path, data_source.file_options.s3_endpoint_override
+    )
+    return pyarrow.dataset.dataset(
+        path, filesystem=filesystem, format="parquet", partitioning="hive"
     )
 
 
+def _pull_latest_batches_from_dataset(
+    dataset: pyarrow.dataset.Dataset,
+    join_key_columns: List[str],
+    feature_name_columns: List[str],
+    timestamp_field: str,
+    created_timestamp_column: Optional[str],
+    start_date: datetime,
+    end_date: datetime,
+    batch_size: Optional[int],
+) -> Iterator[pyarrow.RecordBatch]:
+    """
+    Yields the latest row of every entity between start_date and end_date, like pull_latest_from_table_or_query,
+    without loading all the feature columns into memory.
+
+    The dataset is scanned twice: the first scan only reads the join keys and timestamps to find the position
+    of the latest row of every entity, and the second scan reads all the columns and keeps the rows at those
+    positions. Both scans use the same filter, so they return the rows in the same order.
+    """
+    ts_columns = [timestamp_field]
+    if created_timestamp_column:
+        ts_columns.append(created_timestamp_column)
+    columns = list(dict.fromkeys(join_key_columns + feature_name_columns + ts_columns))
+
+    ts_type = dataset.schema.field(timestamp_field).type
+    ts_filter = (
+        pyarrow.dataset.field(timestamp_field) >= _timestamp_scalar(start_date, ts_type)
+    ) & (pyarrow.dataset.field(timestamp_field) < _timestamp_scalar(end_date, ts_type))
+
+    latest_positions = None
+    if join_key_columns:
+        keys_df = dataset.to_table(
+            columns=list(dict.fromkeys(join_key_columns + ts_columns)),
+            filter=ts_filter,
+        ).to_pandas()
+        keys_df = keys_df.sort_values(by=ts_columns, kind="stable")
+        latest_positions = np.sort(
+            keys_df.drop_duplicates(join_key_columns, keep="last").index.to_numpy()
+        )
+        del keys_df
+
+    scan_kwargs = {"batch_size": batch_size} if batch_size else {}
+    offset = 0
+    for batch in dataset.to_batches(columns=columns, filter=ts_filter, **scan_kwargs):
+        num_rows = batch.num_rows
+        if latest_positions is not None:
+            start, end = np.searchsorted(latest_positions, [offset, offset + num_rows])
+            batch = batch.take(pyarrow.array(latest_positions[start:end] - offset))
+        offset += num_rows
+        if batch.num_rows == 0:
+            continue
+
+        arrays = [
+            # Timestamps are returned in UTC, like _normalize_timestamp does.
+            column.cast(pyarrow.timestamp(column.type.unit, tz="UTC"))
+            if name in ts_columns
+            else column
+            for name, column in zip(batch.schema.names, batch.columns)
+        ]
+        names = list(batch.schema.names)
+        if not join_key_columns:
+            arrays.append(
+                pyarrow.array([DUMMY_ENTITY_VAL] * batch.num_rows, pyarrow.string())
+            )
+            names.append(DUMMY_ENTITY_ID)
+        yield pyarrow.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _timestamp_scalar(value: datetime, timestamp_type) -> pyarrow.Scalar:
+    if timestamp_type.tz is None:
+        return pyarrow.scalar(_to_timezone(value, None), type=timestamp_type)
+    # Arrow converts tz-aware datetimes to UTC, in which timestamps of any time zone are stored, so
+    # this also works for fixed offsets like "+02:00" which aren't in the time zone database.
+    return pyarrow.scalar(_to_timezone(value, pytz.utc), type=timestamp_type)
+
+
 def _field_mapping(
     df_to_join: dd.DataFrame,
     feature_view: FeatureView,
@@ -564,6 +1113,179 @@ def _field_mapping(
     return df_to_join.persist(), timestamp_field
 
 
+def _point_in_time_join_asof(
+    config: FileOfflineStoreConfig,
+    entity_df: pd.DataFrame,
+    entity_df_event_timestamp_col: str,
+    entity_df_event_timestamp_range: Tuple[datetime, datetime],
+    feature_views_to_features: Dict[FeatureView, List[str]],
+    full_feature_names: bool,
+) -> pd.DataFrame:
+    """
+    Joins the features of every feature view with the entity dataframe, like the dask implementation of
+    get_historical_features. The entity dataframe is sorted by event timestamp once, and every feature view
+    is joined with pandas.merge_asof, which finds the latest feature row of each entity row within the ttl
+    of the feature view without merging all the feature rows of an entity with all its entity rows.
+    """
+    result = entity_df.copy()
+    # Make sure all event timestamps are tz-aware. We default tz-naive timestamps to UTC.
+    result[entity_df_event_timestamp_col] = pd.to_datetime(
+        result[entity_df_event_timestamp_col], utc=True
+    )
+    result = result.sort_values(entity_df_event_timestamp_col, kind="stable")
+    result = result.reset_index(drop=True)
+
+    def join_feature_view(feature_view: FeatureView, features: List[str]):
+        joined = _merge_asof(
+            result,
+            feature_view,
+            features,
+            _get_join_keys(feature_view),
+            entity_df_event_timestamp_col,
+            entity_df_event_timestamp_range,
+            full_feature_names,
+        )
+        # merge_asof keeps the order of the entity rows, so only the features need to be kept.
+        return joined[[c for c in joined.columns if c not in result.columns]]
+
+    # Feature views are joined with the entity rows independently of each other
+    result = pd.concat(
+        [result]
+        + _map_feature_views(config, join_feature_view, feature_views_to_features),
+        axis=1,
+    )
+
+    all_join_keys = list(
+        dict.fromkeys(
+            join_key
+            for feature_view in feature_views_to_features
+            for join_key in _get_join_keys(feature_view)
+        )
+    )
+    return result.drop_duplicates(
+        all_join_keys + [entity_df_event_timestamp_col], keep="last"
+    ).reset_index(drop=True)
+
+
+def _get_join_keys(feature_view: FeatureView) -> List[str]:
+    return [
+        feature_view.projection.join_key_map.get(entity_column.name, entity_column.name)
+        for entity_column in feature_view.entity_columns
+    ]
+
+
+def _map_feature_views(
+    config: FileOfflineStoreConfig,
+    join_feature_view: Callable[[FeatureView, List[str]], _T],
+    feature_views_to_features: Dict[FeatureView, List[str]],
+) -> List[_T]:
+    """
+    Calls `join_feature_view` with every feature view and its requested features, in a thread pool of
+    at most `config.max_join_workers` threads. The results are in the order of the feature views.
+    """
+    max_workers = min(
+        config.max_join_workers or os.cpu_count() or 1, len(feature_views_to_features)
+    )
+    if max_workers <= 1:
+        return [
+            join_feature_view(feature_view, features)
+            for feature_view, features in feature_views_to_features.items()
+        ]
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="feast_historical_retrieval"
+    ) as executor:
+        return list(
+            executor.map(
+                lambda item: join_feature_view(*item),
+                feature_views_to_features.items(),
+            )
+        )
+
+
+def _merge_asof(
+    entity_df_with_features: pd.DataFrame,
+    feature_view: FeatureView,
+    features: List[str],
+    join_keys: List[str],
+    entity_df_event_timestamp_col: str,
+    entity_df_event_timestamp_range: Tuple[datetime, datetime],
+    full_feature_names: bool,
+) -> pd.DataFrame:
+    batch_source = feature_view.batch_source
+    timestamp_field = batch_source.timestamp_field
+    created_timestamp_column = batch_source.created_timestamp_column
+
+    df_to_join = _read_datasource(
+        batch_source,
+        columns=_get_source_columns(feature_view, features, created_timestamp_column),
+        timestamp_field=_get_source_column(feature_view, timestamp_field),
+        timestamp_filters=_get_ttl_timestamp_filters(
+            feature_view, entity_df_event_timestamp_range
+        ),
+    ).compute()
+
+    # Rename columns by the field mapping and the join key map, and prefix feature names if needed
+    if batch_source.field_mapping:
+        df_to_join = df_to_join.rename(columns=batch_source.field_mapping)
+    if feature_view.projection.join_key_map:
+        df_to_join = df_to_join.rename(columns=feature_view.projection.join_key_map)
+    feature_names = [
+        f"{feature_view.projection.name_to_use()}__{feature}"
+        if full_feature_names
+        else feature
+        for feature in features
+    ]
+    df_to_join = df_to_join.rename(columns=dict(zip(features, feature_names)))
+
+    timestamp_columns = [timestamp_field]
+    if created_timestamp_column:
+        timestamp_columns.append(created_timestamp_column)
+    df_to_join = df_to_join[
+        list(dict.fromkeys(timestamp_columns + join_keys + feature_names))
+    ]
+
+    # Make sure to not have duplicated columns
+    if timestamp_field == entity_df_event_timestamp_col:
+        df_to_join = df_to_join.rename(
+            columns={timestamp_field: f"__{timestamp_field}"}
+        )
+        timestamp_columns[0] = timestamp_field = f"__{timestamp_field}"
+
+    for column in timestamp_columns:
+        df_to_join[column] = pd.to_datetime(df_to_join[column], utc=True)
+    df_to_join = df_to_join[df_to_join[timestamp_field].notna()]
+    # The last feature row with the latest timestamp is joined, so ties are broken by the created timestamp.
+    df_to_join = df_to_join.sort_values(timestamp_columns, kind="stable")
+
+    for join_key in join_keys:
+        if df_to_join[join_key].dtype != entity_df_with_features[join_key].dtype:
+            df_to_join[join_key] = df_to_join[join_key].astype(
+                entity_df_with_features[join_key].dtype
+            )
+
+    ttl = (
+        feature_view.ttl
+        if feature_view.ttl and feature_view.ttl.total_seconds() != 0
+        else None
+    )
+    entity_df_with_features = pd.merge_asof(
+        entity_df_with_features,
+        df_to_join,
+        left_on=entity_df_event_timestamp_col,
+        right_on=timestamp_field,
+        by=join_keys or None,
+        tolerance=ttl,
+        allow_exact_matches=True,
+        direction="backward",
+        suffixes=("", "__"),
+    )
+
+    return entity_df_with_features.drop(
+        columns=[column for column in timestamp_columns if column not in features]
+    )
+
+
 def _merge(
     entity_df_with_features: dd.DataFrame,
     df_to_join: dd.DataFrame,
@@ -572,8 +1294,9 @@ def _merge(
     # tmp join keys needed for cross join with null join table view
     tmp_join_keys = []
     if not join_keys:
-        entity_df_with_features["__tmp"] = 1
-        df_to_join["__tmp"] = 1
+        # The entity dataframe is shared by the feature views, so it isn't modified in place
+        entity_df_with_features = entity_df_with_features.assign(__tmp=1)
+        df_to_join = df_to_join.assign(__tmp=1)
         tmp_join_keys = ["__tmp"]
 
     # Get only data with requested entities
@@ -642,6 +1365,15 @@ def _filter_ttl(
     entity_df_event_timestamp_col: str,
     timestamp_field: str,
 ) -> dd.DataFrame:
+    # The feature timestamps of a partition lose their time zone if none of its entity rows has a match,
+    # which is common when the entity dataframe is retrieved in chunks.
+    df_to_join = df_to_join.map_partitions(
+        _localize_unmatched_timestamps,
+        timestamp_field,
+        entity_df_event_timestamp_col,
+        meta=df_to_join._meta,
+    )
+
     # Filter rows by defined timestamp tolerance
     if feature_view.ttl and feature_view.ttl.total_seconds() != 0:
         df_to_join = df_to_join[
@@ -672,6 +1404,19 @@ def _filter_ttl(
     return df_to_join
 
 
+def _localize_unmatched_timestamps(
+    df: pd.DataFrame, timestamp_field: str, entity_df_event_timestamp_col: str
+) -> pd.DataFrame:
+    if isinstance(
+        df[entity_df_event_timestamp_col].dtype, pd.DatetimeTZDtype
+    ) and not isinstance(df[timestamp_field].dtype, pd.DatetimeTZDtype):
+        # Only the missing timestamps of unmatched rows are left, which can be in UTC like the others.
+        df = df.assign(
+            **{timestamp_field: df[timestamp_field].dt.tz_localize(pytz.utc)}
+        )
+    return df
+
+
 def _drop_duplicates(
     df_to_join: dd.DataFrame,
     all_join_keys: List[str],
@@ -681,29 +1426,23 @@ def _drop_duplicates(
 ) -> dd.DataFrame:
     column_order = df_to_join.columns
 
+    # The latest row is kept, and rows with the same event timestamp are ordered by their created timestamp.
+    # Both columns are sorted at once, because sorts of dask dataframes aren't stable.
+    sort_columns = [timestamp_field]
+    if created_timestamp_column:
+        sort_columns.append(created_timestamp_column)
+
     # try-catch block is added to deal with this issue https://github.com/dask/dask/issues/8939.
     # TODO(kevjumba): remove try catch when fix is merged upstream in Dask.
     try:
-        if created_timestamp_column:
-            df_to_join = df_to_join.sort_values(
-                by=created_timestamp_column, na_position="first"
-            )
-            df_to_join = df_to_join.persist()
-
-        df_to_join = df_to_join.sort_values(by=timestamp_field, na_position="first")
+        df_to_join = df_to_join.sort_values(by=sort_columns, na_position="first")
         df_to_join = df_to_join.persist()
 
     except ZeroDivisionError:
         # Use 1 partition to get around case where everything in timestamp column is the same so the partition algorithm doesn't
         # try to divide by zero.
-        if created_timestamp_column:
-            df_to_join = df_to_join[column_order].sort_values(
-                by=created_timestamp_column, na_position="first", npartitions=1
-            )
-            df_to_join = df_to_join.persist()
-
         df_to_join = df_to_join[column_order].sort_values(
-            by=timestamp_field, na_position="first", npartitions=1
+            by=sort_columns, na_position="first", npartitions=1
         )
         df_to_join = df_to_join.persist()
 
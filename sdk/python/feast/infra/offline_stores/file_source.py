@@ -20,6 +20,10 @@ from feast.repo_config import RepoConfig
 from feast.saved_dataset import SavedDatasetStorage
 from feast.value_type import ValueType
 
+# The hive partition column of the date directories that the file offline store appends rows to, which
+# isn't a column of the source.
+DATE_PARTITION_COLUMN = "date"
+
 
 @typechecked
 class FileSource(DataSource):
@@ -158,7 +162,8 @@ class FileSource(DataSource):
         # Adding support for different file format path
         # based on S3 filesystem
         if filesystem is None:
-            schema = ParquetDataset(path, use_legacy_dataset=False).schema
+            dataset = ParquetDataset(path, use_legacy_dataset=False)
+            schema = dataset.schema
             if hasattr(schema, "names") and hasattr(schema, "types"):
                 # Newer versions of pyarrow doesn't have this method,
                 # but this field is good enough.
@@ -166,9 +171,16 @@ class FileSource(DataSource):
             else:
                 schema = schema.to_arrow_schema()
         else:
-            schema = ParquetDataset(path, filesystem=filesystem).schema
-
-        return zip(schema.names, map(str, schema.types))
+            dataset = ParquetDataset(path, filesystem=filesystem)
+            schema = dataset.schema
+
+        partitioning = getattr(dataset, "partitioning", None)
+        partition_columns = partitioning.schema.names if partitioning else []
+        return [
+            (name, str(type_))
+            for name, type_ in zip(schema.names, schema.types)
+            if name != DATE_PARTITION_COLUMN or name not in partition_columns
+        ]
 
     @staticmethod
     def create_filesystem_and_path(
@@ -11,14 +11,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import itertools
+import os
+import tempfile
 import warnings
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 import pyarrow
+import pyarrow.feather
+import pyarrow.parquet
 
 from feast import flags_helper
 from feast.data_source import DataSource
@@ -146,6 +162,27 @@ class RetrievalJob(ABC):
 
         return pyarrow.Table.from_pandas(features_df)
 
+    def to_arrow_batches(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Executes the underlying query and returns the result as an iterator of arrow record batches, so
+        that results which don't fit in memory can be processed incrementally.
+
+        On demand transformations will be executed, in which case the whole result is loaded first.
+
+        Args:
+            batch_size (optional): The maximum number of rows of each record batch.
+            timeout (optional): The query timeout if applicable.
+        """
+        if self.on_demand_feature_views:
+            return iter(
+                self.to_arrow(timeout=timeout).to_batches(max_chunksize=batch_size)
+            )
+        return self._to_arrow_batches_internal(batch_size=batch_size, timeout=timeout)
+
     def to_sql(self) -> str:
         """
         Return RetrievalJob generated SQL statement if applicable.
@@ -176,6 +213,24 @@ class RetrievalJob(ABC):
         """
         pass
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Executes the underlying query and returns the result as an iterator of arrow record batches with
+        at most `batch_size` rows each.
+
+        Does not handle on demand transformations. By default, the whole result is loaded with
+        `_to_arrow_internal`; offline stores that can fetch results incrementally should override this.
+        """
+        return iter(
+            self._to_arrow_internal(timeout=timeout).to_batches(
+                max_chunksize=batch_size
+            )
+        )
+
     @property
     @abstractmethod
     def full_feature_names(self) -> bool:
@@ -212,6 +267,29 @@ class RetrievalJob(ABC):
         """Returns metadata about the retrieval job."""
         pass
 
+    @classmethod
+    def _persist_tables(
+        cls,
+        schema: pyarrow.Schema,
+        tables: Iterator[pyarrow.Table],
+        storage: SavedDatasetStorage,
+        allow_overwrite: bool = False,
+    ):
+        """
+        Persists tables with the same schema at the specified destination, one table at a time. This is
+        how the result of a ChunkedRetrievalJob is persisted, with the class of the retrieval jobs of its
+        chunks, since the result doesn't have to fit in memory.
+
+        Args:
+            schema: The schema of the tables.
+            tables: The tables to persist.
+            storage: The saved dataset storage object specifying where the tables should be persisted.
+            allow_overwrite: If True, a pre-existing location (e.g. table or file) can be overwritten.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} does not support persisting the result of a chunked retrieval."
+        )
+
     def supports_remote_storage_export(self) -> bool:
         """Returns True if the RetrievalJob supports `to_remote_storage`."""
         return False
@@ -229,6 +307,160 @@ class RetrievalJob(ABC):
         raise NotImplementedError()
 
 
+class ChunkedRetrievalJob(RetrievalJob):
+    """
+    A RetrievalJob that retrieves features for an entity dataframe in chunks, with one retrieval job per
+    chunk. The retrieval jobs are created and executed one at a time, so that `to_arrow_batches` and
+    `persist` only hold the result of a single chunk in memory.
+    """
+
+    def __init__(
+        self,
+        create_retrieval_jobs: Callable[[], Iterator[RetrievalJob]],
+        full_feature_names: bool,
+        metadata: Optional[RetrievalMetadata] = None,
+    ):
+        """
+        Creates a ChunkedRetrievalJob.
+
+        Args:
+            create_retrieval_jobs: A function that returns an iterator over the retrieval jobs of the
+                chunks. It is called every time the result is computed.
+            full_feature_names: Whether the retrieval jobs apply full feature names.
+            metadata (optional): Metadata about the retrieval of all the chunks.
+        """
+        self._create_retrieval_jobs = create_retrieval_jobs
+        self._full_feature_names = full_feature_names
+        self._metadata = metadata
+
+    @property
+    def full_feature_names(self) -> bool:
+        return self._full_feature_names
+
+    @property
+    def on_demand_feature_views(self) -> List[OnDemandFeatureView]:
+        # On demand transformations are executed by the retrieval job of every chunk.
+        return []
+
+    def _to_df_internal(self, timeout: Optional[int] = None) -> pd.DataFrame:
+        return self._to_arrow_internal(timeout=timeout).to_pandas()
+
+    def _to_arrow_internal(self, timeout: Optional[int] = None) -> pyarrow.Table:
+        tables = [
+            job.to_arrow(timeout=timeout) for job in self._create_retrieval_jobs()
+        ]
+        if not tables:
+            return pyarrow.table({})
+        schema = _unify_chunk_schemas([table.schema for table in tables])
+        return pyarrow.concat_tables(
+            [table.select(schema.names).cast(schema) for table in tables]
+        )
+
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        retrieval_jobs = self._create_retrieval_jobs()
+        with self._stage_chunks(retrieval_jobs, timeout) as (schema, chunk_paths):
+            for table in _read_staged_chunks(schema, chunk_paths):
+                yield from table.to_batches(max_chunksize=batch_size)
+
+    @contextmanager
+    def _stage_chunks(
+        self, retrieval_jobs: Iterator[RetrievalJob], timeout: Optional[int] = None
+    ) -> Iterator[Tuple[pyarrow.Schema, List[str]]]:
+        """
+        Writes the result of every chunk to a local Arrow file, and yields the schema that all of them can
+        be cast to together with the paths of the files. The chunks are staged, rather than streamed, so
+        that the result has a single schema, which is only known once all the chunks are retrieved.
+        """
+        with tempfile.TemporaryDirectory() as staging_dir:
+            chunk_paths: List[str] = []
+            schemas: List[pyarrow.Schema] = []
+            for job in retrieval_jobs:
+                table = job.to_arrow(timeout=timeout)
+                chunk_path = os.path.join(staging_dir, f"{len(chunk_paths)}.arrow")
+                pyarrow.feather.write_feather(
+                    table, chunk_path, compression="uncompressed"
+                )
+                chunk_paths.append(chunk_path)
+                schemas.append(table.schema)
+                del table
+            yield _unify_chunk_schemas(schemas), chunk_paths
+
+    def persist(
+        self,
+        storage: SavedDatasetStorage,
+        allow_overwrite: bool = False,
+        timeout: Optional[int] = None,
+    ):
+        """
+        Persists the result one chunk at a time, with the `_persist_tables` method of the class of the
+        retrieval jobs of the chunks.
+        """
+        retrieval_jobs = self._create_retrieval_jobs()
+        first_job = next(retrieval_jobs, None)
+        if first_job is None:
+            return
+
+        # The chunks are persisted with a single schema, which is only known once all of them are retrieved.
+        with self._stage_chunks(
+            itertools.chain([first_job], retrieval_jobs), timeout=timeout
+        ) as (schema, chunk_paths):
+            type(first_job)._persist_tables(
+                schema,
+                _read_staged_chunks(schema, chunk_paths),
+                storage,
+                allow_overwrite=allow_overwrite,
+            )
+
+    @property
+    def metadata(self) -> Optional[RetrievalMetadata]:
+        return self._metadata
+
+
+def _read_staged_chunks(
+    schema: pyarrow.Schema, chunk_paths: List[str]
+) -> Iterator[pyarrow.Table]:
+    """Reads the chunks staged by `ChunkedRetrievalJob._stage_chunks` one at a time, cast to the schema."""
+    for chunk_path in chunk_paths:
+        table = pyarrow.feather.read_table(chunk_path)
+        yield table.select(schema.names).cast(schema)
+
+
+def _unify_chunk_schemas(schemas: List[pyarrow.Schema]) -> pyarrow.Schema:
+    """
+    Returns the schema that the results of all the chunks of a ChunkedRetrievalJob can be cast to. A column
+    can have different types in different chunks: it has the null type in a chunk where it only contains
+    nulls, and an integer feature is floating point in a chunk where some entity row has no match, since
+    pandas represents the missing values as NaN.
+    """
+    field_types: Dict[str, List[pyarrow.DataType]] = {}
+    for schema in schemas:
+        for field in schema:
+            types = field_types.setdefault(field.name, [])
+            if not pyarrow.types.is_null(field.type) and field.type not in types:
+                types.append(field.type)
+
+    fields = []
+    for name, types in field_types.items():
+        if not types:
+            fields.append(pyarrow.field(name, pyarrow.null()))
+        elif len(types) == 1:
+            fields.append(pyarrow.field(name, types[0]))
+        elif all(
+            pyarrow.types.is_integer(type_) or pyarrow.types.is_floating(type_)
+            for type_ in types
+        ):
+            fields.append(pyarrow.field(name, pyarrow.float64()))
+        else:
+            # Raises an error that names the column and its incompatible types.
+            pyarrow.unify_schemas(schemas)
+            fields.append(pyarrow.field(name, types[0]))
+    return pyarrow.schema(fields, metadata=schemas[0].metadata if schemas else None)
+
+
 class OfflineStore(ABC):
     """
     An offline store defines the interface that Feast uses to interact with the storage and compute system that
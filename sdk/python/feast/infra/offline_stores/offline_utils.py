@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, KeysView, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, KeysView, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -78,6 +78,29 @@ def get_entity_df_timestamp_bounds(
     return event_timestamp_series.min(), event_timestamp_series.max()
 
 
+def split_entity_df(
+    entity_df: pd.DataFrame, event_timestamp_col: str, chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Splits an entity dataframe into chunks of consecutive event timestamps, each with about `chunk_size`
+    rows. Rows with the same event timestamp are always in the same chunk, so that a chunk can be joined
+    with feature data independently of the others, and only needs feature data of a limited time range.
+    """
+    event_timestamps = pd.to_datetime(entity_df[event_timestamp_col], utc=True)
+    order = np.argsort(event_timestamps.values, kind="stable")
+    sorted_timestamps = event_timestamps.values[order]
+
+    start = 0
+    while start < len(order):
+        end = start + chunk_size
+        if end < len(order):
+            end = int(
+                np.searchsorted(sorted_timestamps, sorted_timestamps[end - 1], "right")
+            )
+        yield entity_df.iloc[order[start:end]]
+        start = end
+
+
 @dataclass(frozen=True)
 class FeatureViewQueryContext:
     """Context object used to template a BigQuery and Redshift point-in-time SQL query"""
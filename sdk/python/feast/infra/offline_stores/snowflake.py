@@ -454,6 +454,17 @@ class SnowflakeRetrievalJob(RetrievalJob):
                 pd.DataFrame(columns=[md.name for md in empty_result.description])
             )
 
+    def _to_arrow_batches_internal(
+        self,
+        batch_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> Iterator[pyarrow.RecordBatch]:
+        # The result chunks are downloaded one at a time.
+        for table in execute_snowflake_statement(
+            self.snowflake_conn, self.to_sql()
+        ).fetch_arrow_batches():
+            yield from table.to_batches(max_chunksize=batch_size)
+
     def to_sql(self) -> str:
         """
         Returns the SQL query that will be executed in Snowflake to build the historical feature table.
@@ -486,19 +497,6 @@ class SnowflakeRetrievalJob(RetrievalJob):
 
         return None
 
-    def to_arrow_batches(self) -> Iterator[pyarrow.Table]:
-
-        table_name = "temp_arrow_batches_" + uuid.uuid4().hex
-
-        self.to_snowflake(table_name=table_name, allow_overwrite=True, temporary=True)
-
-        query = f'SELECT * FROM "{table_name}"'
-        arrow_batches = execute_snowflake_statement(
-            self.snowflake_conn, query
-        ).fetch_arrow_batches()
-
-        return arrow_batches
-
     def to_pandas_batches(self) -> Iterator[pd.DataFrame]:
 
         table_name = "temp_pandas_batches_" + uuid.uuid4().hex
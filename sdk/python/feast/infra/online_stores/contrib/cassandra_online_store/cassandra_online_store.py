@@ -20,24 +20,23 @@ Cassandra/Astra DB online store for Feast.
 
 import logging
 from datetime import datetime
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.cluster import (
-    EXEC_PROFILE_DEFAULT,
-    Cluster,
-    ExecutionProfile,
-    ResultSet,
-    Session,
-)
+from cassandra.cluster import EXEC_PROFILE_DEFAULT, Cluster, ExecutionProfile, Session
 from cassandra.concurrent import execute_concurrent_with_args
 from cassandra.policies import DCAwareRoundRobinPolicy, TokenAwarePolicy
+from cassandra.pool import Host
 from cassandra.query import PreparedStatement
-from pydantic import StrictFloat, StrictInt, StrictStr
+from pydantic import StrictBool, StrictFloat, StrictInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, RepoConfig
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import serialize_entity_keys
+from feast.infra.online_stores.helpers import (
+    _pack_feature_values,
+    _unpack_feature_values,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -70,8 +69,22 @@ INSERT_CQL_4_TEMPLATE = (
     " (?, ?, ?, ?);"
 )
 
+INSERT_WIDE_CQL_TEMPLATE = (
+    "INSERT INTO {fqtable} (entity_key, value, event_ts) VALUES (?, ?, ?);"
+)
+
 SELECT_CQL_TEMPLATE = "SELECT {columns} FROM {fqtable} WHERE entity_key = ?;"
 
+SELECT_FEATURES_CQL_TEMPLATE = (
+    "SELECT {columns} FROM {fqtable} WHERE entity_key = ? AND feature_name IN ?;"
+)
+
+SELECT_IN_CQL_TEMPLATE = "SELECT {columns} FROM {fqtable} WHERE entity_key IN ?;"
+
+SELECT_FEATURES_IN_CQL_TEMPLATE = (
+    "SELECT {columns} FROM {fqtable} WHERE entity_key IN ? AND feature_name IN ?;"
+)
+
 CREATE_TABLE_CQL_TEMPLATE = """
     CREATE TABLE IF NOT EXISTS {fqtable} (
         entity_key      TEXT,
@@ -83,16 +96,31 @@ CREATE_TABLE_CQL_TEMPLATE = """
     ) WITH CLUSTERING ORDER BY (feature_name ASC);
 """
 
+CREATE_WIDE_TABLE_CQL_TEMPLATE = """
+    CREATE TABLE IF NOT EXISTS {fqtable} (
+        entity_key      BLOB,
+        value           BLOB,
+        event_ts        TIMESTAMP,
+        created_ts      TIMESTAMP,
+        PRIMARY KEY (entity_key)
+    );
+"""
+
 DROP_TABLE_CQL_TEMPLATE = "DROP TABLE IF EXISTS {fqtable};"
 
 # op_name -> (cql template string, prepare boolean)
 CQL_TEMPLATE_MAP = {
     # Queries/DML, statements to be prepared
     "insert4": (INSERT_CQL_4_TEMPLATE, True),
+    "insert_wide": (INSERT_WIDE_CQL_TEMPLATE, True),
     "select": (SELECT_CQL_TEMPLATE, True),
+    "select_features": (SELECT_FEATURES_CQL_TEMPLATE, True),
+    "select_in": (SELECT_IN_CQL_TEMPLATE, True),
+    "select_features_in": (SELECT_FEATURES_IN_CQL_TEMPLATE, True),
     # DDL, do not prepare these
     "drop": (DROP_TABLE_CQL_TEMPLATE, False),
     "create": (CREATE_TABLE_CQL_TEMPLATE, False),
+    "create_wide": (CREATE_WIDE_TABLE_CQL_TEMPLATE, False),
 }
 
 # Logger
@@ -183,6 +211,23 @@ class CassandraOnlineStoreConfig(FeastConfigBaseModel):
     Default: 100.
     """
 
+    read_batch_size: Optional[StrictInt] = None
+    """
+    If set, the partitions of up to this many entity keys are read with a single
+    `entity_key IN ?` query. Entity keys are grouped by a replica that owns their
+    partition, and the query of every group is sent to that replica.
+    Default: None, that is one query per partition.
+    """
+
+    wide_rows: StrictBool = False
+    """
+    If True, tables have one row per entity with all feature values packed in a
+    single blob, instead of one row per entity and feature. Every write replaces
+    all the feature values of an entity. Tables with wide rows have a different
+    name, so changing this setting requires materializing the data again.
+    Default: False.
+    """
+
 
 class CassandraOnlineStore(OnlineStore):
     """
@@ -335,25 +380,30 @@ class CassandraOnlineStore(OnlineStore):
                       display progress.
         """
         project = config.project
+        wide_rows = config.online_store.wide_rows
+        entity_key_bins = serialize_entity_keys(
+            [entity_key for entity_key, _, _, _ in data],
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
 
-        def unroll_insertion_tuples() -> Iterable[Tuple[str, bytes, str, datetime]]:
+        def unroll_insertion_tuples() -> Iterable[Tuple[Any, ...]]:
             """
             We craft an iterable over all rows to be inserted (entities->features),
             but this way we can call `progress` after each entity is done.
             """
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=config.entity_key_serialization_version,
-                ).hex()
-                for feature_name, val in values.items():
-                    params: Tuple[str, bytes, str, datetime] = (
-                        feature_name,
-                        val.SerializeToString(),
-                        entity_key_bin,
-                        timestamp,
-                    )
-                    yield params
+            for entity_key_bin, (_, values, timestamp, _) in zip(entity_key_bins, data):
+                if wide_rows:
+                    yield entity_key_bin, _pack_feature_values(values), timestamp
+                else:
+                    entity_key_hex = entity_key_bin.hex()
+                    for feature_name, val in values.items():
+                        params: Tuple[str, bytes, str, datetime] = (
+                            feature_name,
+                            val.SerializeToString(),
+                            entity_key_hex,
+                            timestamp,
+                        )
+                        yield params
                 # this happens N-1 times, will be corrected outside:
                 if progress:
                     progress(1)
@@ -386,41 +436,55 @@ class CassandraOnlineStore(OnlineStore):
             table: Feast FeatureView.
             entity_keys: a list of entity keys that should be read
                          from the FeatureStore.
+            requested_features: the features to read, or None to read
+                                all the features of the feature view.
         """
         project = config.project
+        wide_rows = config.online_store.wide_rows
 
         result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
 
-        entity_key_bins = [
-            serialize_entity_key(
-                entity_key,
+        entity_key_bins: List[Union[bytes, str]] = list(
+            serialize_entity_keys(
+                entity_keys,
                 entity_key_serialization_version=config.entity_key_serialization_version,
-            ).hex()
-            for entity_key in entity_keys
-        ]
+            )
+        )
+        if not wide_rows:
+            entity_key_bins = [
+                entity_key_bin.hex()  # type: ignore
+                for entity_key_bin in entity_key_bins
+            ]
 
         with tracing_span(name="remote_call"):
-            feature_rows_sequence = self._read_rows_by_entity_keys(
+            feature_rows_by_entity_key = self._read_rows_by_entity_keys(
                 config,
                 project,
                 table,
-                entity_key_bins,
-                columns=["feature_name", "value", "event_ts"],
+                list(dict.fromkeys(entity_key_bins)),
+                columns=["entity_key", "value", "event_ts"]
+                if wide_rows
+                else ["entity_key", "feature_name", "value", "event_ts"],
+                requested_features=None if wide_rows else requested_features,
             )
 
-        for entity_key_bin, feature_rows in zip(entity_key_bins, feature_rows_sequence):
-            res = {}
+        for entity_key_bin in entity_key_bins:
+            res: Dict[str, ValueProto] = {}
             res_ts = None
-            if feature_rows:
-                for feature_row in feature_rows:
-                    if (
-                        requested_features is None
-                        or feature_row.feature_name in requested_features
-                    ):
-                        val = ValueProto()
-                        val.ParseFromString(feature_row.value)
-                        res[feature_row.feature_name] = val
-                        res_ts = feature_row.event_ts
+            for feature_row in feature_rows_by_entity_key.get(entity_key_bin, []):
+                if wide_rows:
+                    res = _unpack_feature_values(feature_row.value)
+                    if requested_features is not None:
+                        res = {
+                            feature_name: val
+                            for feature_name, val in res.items()
+                            if feature_name in requested_features
+                        }
+                else:
+                    val = ValueProto()
+                    val.ParseFromString(feature_row.value)
+                    res[feature_row.feature_name] = val
+                res_ts = feature_row.event_ts
             if not res:
                 result.append((None, None))
             else:
@@ -475,11 +539,15 @@ class CassandraOnlineStore(OnlineStore):
                 self._drop_table(config, project, table)
 
     @staticmethod
-    def _fq_table_name(keyspace: str, project: str, table: FeatureView) -> str:
+    def _fq_table_name(
+        keyspace: str, project: str, table: FeatureView, wide_rows: bool = False
+    ) -> str:
         """
         Generate a fully-qualified table name,
         including quotes and keyspace.
         """
+        if wide_rows:
+            return f'"{keyspace}"."{project}_{table.name}_wide"'
         return f'"{keyspace}"."{project}_{table.name}"'
 
     def _write_rows_concurrently(
@@ -487,12 +555,17 @@ class CassandraOnlineStore(OnlineStore):
         config: RepoConfig,
         project: str,
         table: FeatureView,
-        rows: Iterable[Tuple[str, bytes, str, datetime]],
+        rows: Iterable[Tuple[Any, ...]],
     ):
         session: Session = self._get_session(config)
         keyspace: str = self._keyspace
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
-        insert_cql = self._get_cql_statement(config, "insert4", fqtable=fqtable)
+        wide_rows = config.online_store.wide_rows
+        fqtable = CassandraOnlineStore._fq_table_name(
+            keyspace, project, table, wide_rows
+        )
+        insert_cql = self._get_cql_statement(
+            config, "insert_wide" if wide_rows else "insert4", fqtable=fqtable
+        )
         #
         execute_concurrent_with_args(
             session,
@@ -506,41 +579,135 @@ class CassandraOnlineStore(OnlineStore):
         config: RepoConfig,
         project: str,
         table: FeatureView,
-        entity_key_bins: List[str],
+        entity_key_bins: Sequence[Union[bytes, str]],
         columns: Optional[List[str]] = None,
-    ) -> ResultSet:
+        requested_features: Optional[List[str]] = None,
+    ) -> Dict[Union[bytes, str], List[Any]]:
         """
         Handle the CQL (low-level) reading of feature values from a table.
+
+        Rows are returned by entity key, so the `entity_key` column must be
+        among the requested columns. If features are requested, only their
+        rows are read.
         """
         session: Session = self._get_session(config)
         keyspace: str = self._keyspace
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
+        fqtable = CassandraOnlineStore._fq_table_name(
+            keyspace, project, table, config.online_store.wide_rows
+        )
         projection_columns = "*" if columns is None else ", ".join(columns)
+        read_batch_size = config.online_store.read_batch_size
+        op_name = "select_features" if requested_features else "select"
+        if read_batch_size:
+            op_name += "_in"
         select_cql = self._get_cql_statement(
             config,
-            "select",
+            op_name,
             fqtable=fqtable,
             columns=projection_columns,
         )
-        retrieval_results = execute_concurrent_with_args(
-            session,
-            select_cql,
-            ((entity_key_bin,) for entity_key_bin in entity_key_bins),
-            concurrency=config.online_store.read_concurrency,
-        )
-        # execute_concurrent_with_args return a sequence
+
+        if read_batch_size:
+            retrieval_results = self._execute_concurrent_on_replicas(
+                session,
+                select_cql,
+                [
+                    (replica, (entity_key_bin_batch, requested_features))
+                    if requested_features
+                    else (replica, (entity_key_bin_batch,))
+                    for replica, entity_key_bin_batch in self._group_by_replica(
+                        session, entity_key_bins, read_batch_size
+                    )
+                ],
+                concurrency=config.online_store.read_concurrency,
+            )
+        else:
+            retrieval_results = execute_concurrent_with_args(
+                session,
+                select_cql,
+                (
+                    (entity_key_bin, requested_features)
+                    if requested_features
+                    else (entity_key_bin,)
+                    for entity_key_bin in entity_key_bins
+                ),
+                concurrency=config.online_store.read_concurrency,
+            )
+        # both return a sequence
         # of (success, result_or_exception) pairs:
-        returned_sequence = []
+        rows_by_entity_key: Dict[Union[bytes, str], List[Any]] = {}
         for success, result_or_exception in retrieval_results:
             if success:
-                returned_sequence.append(result_or_exception)
+                for row in result_or_exception:
+                    rows_by_entity_key.setdefault(row.entity_key, []).append(row)
             else:
                 # an exception
                 logger.error(
                     f"Cassandra online store exception during concurrent fetching: {str(result_or_exception)}"
                 )
-                returned_sequence.append(None)
-        return returned_sequence
+        return rows_by_entity_key
+
+    def _group_by_replica(
+        self,
+        session: Session,
+        entity_key_bins: Sequence[Union[bytes, str]],
+        batch_size: int,
+    ) -> List[Tuple[Optional[Host], List[Union[bytes, str]]]]:
+        """
+        Group entity keys by the first replica of their partition that the
+        session is connected to, in batches of at most `batch_size` keys.
+        Entity keys without a known replica are grouped together.
+        """
+        metadata = session.cluster.metadata
+        connected_hosts = set(session.get_pool_state().keys())
+        entity_key_bins_by_replica: Dict[Optional[Host], List[Union[bytes, str]]] = {}
+        for entity_key_bin in entity_key_bins:
+            # The routing key of a single-column partition key is its serialized value.
+            routing_key = (
+                entity_key_bin.encode("utf8")
+                if isinstance(entity_key_bin, str)
+                else entity_key_bin
+            )
+            replica = next(
+                (
+                    host
+                    for host in metadata.get_replicas(self._keyspace, routing_key)
+                    if host in connected_hosts
+                ),
+                None,
+            )
+            entity_key_bins_by_replica.setdefault(replica, []).append(entity_key_bin)
+        return [
+            (replica, replica_entity_key_bins[i : i + batch_size])
+            for replica, replica_entity_key_bins in entity_key_bins_by_replica.items()
+            for i in range(0, len(replica_entity_key_bins), batch_size)
+        ]
+
+    @staticmethod
+    def _execute_concurrent_on_replicas(
+        session: Session,
+        statement: PreparedStatement,
+        hosts_and_parameters: List[Tuple[Optional[Host], Tuple[Any, ...]]],
+        concurrency: int,
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Like `execute_concurrent_with_args` with `raise_on_first_error=False`, but
+        every execution is sent to the given host, or according to the
+        load-balancing policy if it is None. Failed executions yield a
+        (False, exception) pair.
+        """
+        results: List[Tuple[bool, Any]] = []
+        for i in range(0, len(hosts_and_parameters), concurrency):
+            futures = [
+                session.execute_async(statement, parameters, host=host)
+                for host, parameters in hosts_and_parameters[i : i + concurrency]
+            ]
+            for future in futures:
+                try:
+                    results.append((True, future.result()))
+                except Exception as e:
+                    results.append((False, e))
+        return results
 
     def _drop_table(
         self,
@@ -551,7 +718,9 @@ class CassandraOnlineStore(OnlineStore):
         """Handle the CQL (low-level) deletion of a table."""
         session: Session = self._get_session(config)
         keyspace: str = self._keyspace
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
+        fqtable = CassandraOnlineStore._fq_table_name(
+            keyspace, project, table, config.online_store.wide_rows
+        )
         drop_cql = self._get_cql_statement(config, "drop", fqtable)
         logger.info(f"Deleting table {fqtable}.")
         session.execute(drop_cql)
@@ -560,8 +729,13 @@ class CassandraOnlineStore(OnlineStore):
         """Handle the CQL (low-level) creation of a table."""
         session: Session = self._get_session(config)
         keyspace: str = self._keyspace
-        fqtable = CassandraOnlineStore._fq_table_name(keyspace, project, table)
-        create_cql = self._get_cql_statement(config, "create", fqtable)
+        wide_rows = config.online_store.wide_rows
+        fqtable = CassandraOnlineStore._fq_table_name(
+            keyspace, project, table, wide_rows
+        )
+        create_cql = self._get_cql_statement(
+            config, "create_wide" if wide_rows else "create", fqtable
+        )
         logger.info(f"Creating table {fqtable}.")
         session.execute(create_cql)
 
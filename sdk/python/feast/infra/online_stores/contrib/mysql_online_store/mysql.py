@@ -1,16 +1,17 @@
 from __future__ import absolute_import
 
+import threading
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 import pymysql
 import pytz
-from pydantic import StrictStr
+from pydantic import PositiveInt, StrictStr
 from pymysql.connections import Connection
 from pymysql.cursors import Cursor
 
 from feast import Entity, FeatureView, RepoConfig
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import serialize_entity_keys
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -30,23 +31,35 @@ class MySQLOnlineStoreConfig(FeastConfigBaseModel):
     password: Optional[StrictStr] = None
     database: Optional[StrictStr] = None
     port: Optional[int] = None
+    batch_size: PositiveInt = 100
+    """ (optional) The maximum number of entity keys that are read or written with a single statement."""
 
 
 class MySQLOnlineStore(OnlineStore):
     """
     An online store implementation that uses MySQL.
     NOTE: The class *must* end with the `OnlineStore` suffix.
+
+    Attributes:
+        _conns: Thread-local MySQL connections.
     """
 
-    _conn: Optional[Connection] = None
+    _conns: threading.local
 
-    def _get_conn(self, config: RepoConfig) -> Connection:
+    def __init__(self):
+        super().__init__()
+        self._conns = threading.local()
 
+    def _get_conn(self, config: RepoConfig) -> Connection:
+        """
+        Returns the connection of the current thread, since a MySQL connection can't be shared by threads.
+        """
         online_store_config = config.online_store
         assert isinstance(online_store_config, MySQLOnlineStoreConfig)
 
-        if not self._conn:
-            self._conn = pymysql.connect(
+        conn = getattr(self._conns, "conn", None)
+        if conn is None:
+            conn = pymysql.connect(
                 host=online_store_config.host or "127.0.0.1",
                 user=online_store_config.user or "test",
                 password=online_store_config.password or "test",
@@ -54,7 +67,8 @@ class MySQLOnlineStore(OnlineStore):
                 port=online_store_config.port or 3306,
                 autocommit=True,
             )
-        return self._conn
+            self._conns.conn = conn
+        return conn
 
     def online_write_batch(
         self,
@@ -68,60 +82,47 @@ class MySQLOnlineStore(OnlineStore):
 
         conn = self._get_conn(config)
         cur = conn.cursor()
+        batch_size = config.online_store.batch_size
 
-        project = config.project
-
-        for entity_key, values, timestamp, created_ts in data:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
+        # The rows of several entities are upserted with a single multi-row INSERT statement.
+        insert = f"""
+            INSERT INTO {_table_id(config.project, table)}
+            (entity_key, feature_name, value, event_ts, created_ts)
+            VALUES (%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+            value = VALUES(value),
+            event_ts = VALUES(event_ts),
+            created_ts = VALUES(created_ts)
+            """
+        for i in range(0, len(data), batch_size):
+            batch = data[i : i + batch_size]
+            entity_key_bins = serialize_entity_keys(
+                [entity_key for entity_key, _, _, _ in batch],
                 entity_key_serialization_version=2,
-            ).hex()
-            timestamp = _to_naive_utc(timestamp)
-            if created_ts is not None:
-                created_ts = _to_naive_utc(created_ts)
-
-            for feature_name, val in values.items():
-                self.write_to_table(
-                    created_ts,
-                    cur,
-                    entity_key_bin,
-                    feature_name,
-                    project,
-                    table,
-                    timestamp,
-                    val,
-                )
+            )
+            rows = []
+            for entity_key_bin, (_, values, timestamp, created_ts) in zip(
+                entity_key_bins, batch
+            ):
+                entity_key_hex = entity_key_bin.hex()
+                timestamp = _to_naive_utc(timestamp)
+                if created_ts is not None:
+                    created_ts = _to_naive_utc(created_ts)
+                for feature_name, val in values.items():
+                    rows.append(
+                        (
+                            entity_key_hex,
+                            feature_name,
+                            val.SerializeToString(),
+                            timestamp,
+                            created_ts,
+                        )
+                    )
+            if rows:
+                cur.executemany(insert, rows)
             conn.commit()
             if progress:
-                progress(1)
-
-    @staticmethod
-    def write_to_table(
-        created_ts, cur, entity_key_bin, feature_name, project, table, timestamp, val
-    ) -> None:
-        cur.execute(
-            f"""
-            INSERT INTO {_table_id(project, table)}
-            (entity_key, feature_name, value, event_ts, created_ts)
-            values (%s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-            value = %s,
-            event_ts = %s,
-            created_ts = %s;
-            """,
-            (
-                # Insert
-                entity_key_bin,
-                feature_name,
-                val.SerializeToString(),
-                timestamp,
-                created_ts,
-                # Update on duplicate key
-                val.SerializeToString(),
-                timestamp,
-                created_ts,
-            ),
-        )
+                progress(len(batch))
 
     def online_read(
         self,
@@ -132,35 +133,51 @@ class MySQLOnlineStore(OnlineStore):
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
         conn = self._get_conn(config)
         cur = conn.cursor()
+        batch_size = config.online_store.batch_size
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, Any]]]] = []
-
-        project = config.project
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
+        entity_key_hexes = [
+            entity_key_bin.hex()
+            for entity_key_bin in serialize_entity_keys(
+                entity_keys,
                 entity_key_serialization_version=2,
-            ).hex()
+            )
+        ]
 
-            cur.execute(
-                f"SELECT feature_name, value, event_ts FROM {_table_id(project, table)} WHERE entity_key = %s",
-                (entity_key_bin,),
+        select = f"SELECT entity_key, feature_name, value, event_ts FROM {_table_id(config.project, table)}"
+        feature_filter = ""
+        if requested_features:
+            feature_filter = (
+                f" AND feature_name IN ({', '.join(['%s'] * len(requested_features))})"
             )
 
-            res = {}
-            res_ts: Optional[datetime] = None
-            records = cur.fetchall()
-            if records:
-                for feature_name, val_bin, ts in records:
-                    val = ValueProto()
-                    val.ParseFromString(val_bin)
-                    res[feature_name] = val
-                    res_ts = ts
-
-            if not res:
+        # The entity keys are read in batches, with one query per batch.
+        records: Dict[str, Tuple[Optional[datetime], Dict[str, ValueProto]]] = {}
+        unique_entity_key_hexes = list(dict.fromkeys(entity_key_hexes))
+        for i in range(0, len(unique_entity_key_hexes), batch_size):
+            batch = unique_entity_key_hexes[i : i + batch_size]
+            cur.execute(
+                f"{select} WHERE entity_key IN ({', '.join(['%s'] * len(batch))}){feature_filter}",
+                (*batch, *(requested_features or [])),
+            )
+            for entity_key_hex, feature_name, val_bin, ts in cur.fetchall():
+                val = ValueProto()
+                val.ParseFromString(val_bin)
+                _, res = records.get(entity_key_hex, (None, {}))
+                res[feature_name] = val
+                records[entity_key_hex] = (ts, res)
+
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        returned_entity_key_hexes: Set[str] = set()
+        for entity_key_hex in entity_key_hexes:
+            if entity_key_hex not in records:
                 result.append((None, None))
-            else:
-                result.append((res_ts, res))
+                continue
+            ts, res = records[entity_key_hex]
+            if entity_key_hex in returned_entity_key_hexes:
+                # Repeated entity keys get their own copy of the values.
+                res = dict(res)
+            returned_entity_key_hexes.add(entity_key_hex)
+            result.append((ts, res))
         return result
 
     def update(
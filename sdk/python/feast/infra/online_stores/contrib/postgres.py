@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 from collections import defaultdict
@@ -13,9 +14,14 @@ from pydantic.schema import Literal
 
 from feast import Entity
 from feast.feature_view import FeatureView
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import serialize_entity_key, serialize_entity_keys
 from feast.infra.online_stores.online_store import OnlineStore
-from feast.infra.utils.postgres.connection_utils import _get_conn, _get_connection_pool
+from feast.infra.utils.postgres.connection_utils import (
+    AsyncConnectionPool,
+    _get_conn,
+    _get_connection_pool,
+    wait_async,
+)
 from feast.infra.utils.postgres.postgres_config import ConnectionType, PostgreSQLConfig
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
@@ -30,6 +36,7 @@ class PostgreSQLOnlineStoreConfig(PostgreSQLConfig):
 class PostgreSQLOnlineStore(OnlineStore):
     _conn: Optional[psycopg2._psycopg.connection] = None
     _conn_pool: Optional[SimpleConnectionPool] = None
+    _async_conn_pool: Optional[AsyncConnectionPool] = None
 
     @contextlib.contextmanager
     def _get_conn(self, config: RepoConfig):
@@ -110,68 +117,50 @@ class PostgreSQLOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-
-        project = config.project
+        # Collecting all the keys to a list allows us to make fewer round trips
+        # to PostgreSQL
+        keys = serialize_entity_keys(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
+        query, params = _online_read_query(config, table, keys, requested_features)
         with self._get_conn(config) as conn, conn.cursor() as cur:
-            # Collecting all the keys to a list allows us to make fewer round trips
-            # to PostgreSQL
-            keys = []
-            for entity_key in entity_keys:
-                keys.append(
-                    serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=config.entity_key_serialization_version,
-                    )
-                )
-
-            if not requested_features:
-                cur.execute(
-                    sql.SQL(
-                        """
-                        SELECT entity_key, feature_name, value, event_ts
-                        FROM {} WHERE entity_key = ANY(%s);
-                        """
-                    ).format(
-                        sql.Identifier(_table_id(project, table)),
-                    ),
-                    (keys,),
-                )
-            else:
-                cur.execute(
-                    sql.SQL(
-                        """
-                        SELECT entity_key, feature_name, value, event_ts
-                        FROM {} WHERE entity_key = ANY(%s) and feature_name = ANY(%s);
-                        """
-                    ).format(
-                        sql.Identifier(_table_id(project, table)),
-                    ),
-                    (keys, requested_features),
-                )
-
+            cur.execute(query, params)
             rows = cur.fetchall()
+        return _online_read_result(keys, rows)
 
-            # Since we don't know the order returned from PostgreSQL we'll need
-            # to construct a dict to be able to quickly look up the correct row
-            # when we iterate through the keys since they are in the correct order
-            values_dict = defaultdict(list)
-            for row in rows if rows is not None else []:
-                values_dict[row[0].tobytes()].append(row[1:])
-
-            for key in keys:
-                if key in values_dict:
-                    value = values_dict[key]
-                    res = {}
-                    for feature_name, value_bin, event_ts in value:
-                        val = ValueProto()
-                        val.ParseFromString(bytes(value_bin))
-                        res[feature_name] = val
-                    result.append((event_ts, res))
-                else:
-                    result.append((None, None))
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        assert config.online_store.type == "postgres"
+        if (
+            not self._async_conn_pool
+            or self._async_conn_pool.loop is not asyncio.get_running_loop()
+        ):
+            # The pool is bound to the event loop it was created in, so a new one is created when the loop
+            # changes, e.g. with consecutive `asyncio.run` calls.
+            if self._async_conn_pool:
+                self._async_conn_pool.close()
+            self._async_conn_pool = AsyncConnectionPool(config.online_store)
 
-        return result
+        keys = serialize_entity_keys(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
+        query, params = _online_read_query(config, table, keys, requested_features)
+        async with self._async_conn_pool.connection() as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute(query, params)
+                await wait_async(conn)
+                rows = cur.fetchall()
+            finally:
+                cur.close()
+        return _online_read_result(keys, rows)
 
     @log_exceptions_and_usage(online_store="postgres")
     def update(
@@ -252,6 +241,62 @@ class PostgreSQLOnlineStore(OnlineStore):
             raise
 
 
+def _online_read_query(
+    config: RepoConfig,
+    table: FeatureView,
+    keys: List[bytes],
+    requested_features: Optional[List[str]],
+) -> Tuple[sql.Composed, Tuple[Any, ...]]:
+    if not requested_features:
+        return (
+            sql.SQL(
+                """
+                SELECT entity_key, feature_name, value, event_ts
+                FROM {} WHERE entity_key = ANY(%s);
+                """
+            ).format(
+                sql.Identifier(_table_id(config.project, table)),
+            ),
+            (keys,),
+        )
+    return (
+        sql.SQL(
+            """
+            SELECT entity_key, feature_name, value, event_ts
+            FROM {} WHERE entity_key = ANY(%s) and feature_name = ANY(%s);
+            """
+        ).format(
+            sql.Identifier(_table_id(config.project, table)),
+        ),
+        (keys, requested_features),
+    )
+
+
+def _online_read_result(
+    keys: List[bytes], rows: Optional[List[Tuple[Any, ...]]]
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    # Since we don't know the order returned from PostgreSQL we'll need
+    # to construct a dict to be able to quickly look up the correct row
+    # when we iterate through the keys since they are in the correct order
+    values_dict = defaultdict(list)
+    for row in rows if rows is not None else []:
+        values_dict[row[0].tobytes()].append(row[1:])
+
+    result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    for key in keys:
+        if key in values_dict:
+            value = values_dict[key]
+            res = {}
+            for feature_name, value_bin, event_ts in value:
+                val = ValueProto()
+                val.ParseFromString(bytes(value_bin))
+                res[feature_name] = val
+            result.append((event_ts, res))
+        else:
+            result.append((None, None))
+    return result
+
+
 def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
@@ -11,15 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import itertools
+import asyncio
+import contextlib
 import logging
+import random
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import StrictBool, StrictStr
+from pydantic import StrictBool, StrictInt, StrictStr
 from pydantic.typing import Literal, Union
 
 from feast import Entity, FeatureView, utils
+from feast.errors import DynamoDBUnprocessedKeysError
 from feast.infra.infra_object import DYNAMODB_INFRA_OBJECT_CLASS_TYPE, InfraObject
 from feast.infra.online_stores.helpers import compute_entity_id
 from feast.infra.online_stores.online_store import OnlineStore
@@ -66,6 +72,18 @@ class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     consistent_reads: StrictBool = False
     """Whether to read from Dynamodb by forcing consistent reads"""
 
+    max_read_workers: StrictInt = 10
+    """Maximum number of BatchGetItem calls that are sent concurrently."""
+
+    max_read_retries: StrictInt = 8
+    """Number of times that the unprocessed keys of a BatchGetItem call are retried."""
+
+    read_retry_backoff_ms: StrictInt = 25
+    """Maximum backoff before the first retry of unprocessed keys, doubled for every following retry."""
+
+    read_timeout_secs: Optional[float] = None
+    """Deadline of an online read, after which it fails with a TimeoutError. By default there is no deadline."""
+
 
 class DynamoDBOnlineStore(OnlineStore):
     """
@@ -74,10 +92,17 @@ class DynamoDBOnlineStore(OnlineStore):
     Attributes:
         _dynamodb_client: Boto3 DynamoDB client.
         _dynamodb_resource: Boto3 DynamoDB resource.
+        _read_executor: Executor that sends the BatchGetItem calls of online reads.
+        _aiodynamodb_client: Aiobotocore DynamoDB client, used by asynchronous reads.
+        _aiodynamodb_client_loop: Event loop that `_aiodynamodb_client` was created in.
     """
 
     _dynamodb_client = None
     _dynamodb_resource = None
+    _read_executor: Optional[ThreadPoolExecutor] = None
+    _aiodynamodb_client = None
+    _aiodynamodb_exit_stack: Optional[contextlib.AsyncExitStack] = None
+    _aiodynamodb_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @log_exceptions_and_usage(online_store="dynamodb")
     def update(
@@ -212,69 +237,77 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_resource = self._get_dynamodb_resource(
+        # Unlike resources, clients can be shared by threads.
+        dynamodb_client = self._get_dynamodb_client(
             online_config.region, online_config.endpoint_url
         )
-        table_instance = dynamodb_resource.Table(
-            _get_table_name(online_config, config, table)
-        )
+        table_name = _get_table_name(online_config, config, table)
+        deadline = _get_read_deadline(online_config)
+        entity_idxs, batches = _get_entity_id_batches(config, entity_keys)
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
-        entity_ids = [
-            compute_entity_id(
-                entity_key,
-                entity_key_serialization_version=config.entity_key_serialization_version,
+        def read_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            return _batch_get_items(
+                dynamodb_client, table_name, batch, online_config, deadline
             )
-            for entity_key in entity_keys
-        ]
-        batch_size = online_config.batch_size
-        entity_ids_iter = iter(entity_ids)
-        while True:
-            batch = list(itertools.islice(entity_ids_iter, batch_size))
-            batch_result: List[
-                Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]
-            ] = []
-            # No more items to insert
-            if len(batch) == 0:
-                break
-            batch_entity_ids = {
-                table_instance.name: {
-                    "Keys": [{"entity_id": entity_id} for entity_id in batch],
-                    "ConsistentRead": online_config.consistent_reads,
-                }
-            }
-            with tracing_span(name="remote_call"):
-                response = dynamodb_resource.batch_get_item(
-                    RequestItems=batch_entity_ids,
-                )
-            response = response.get("Responses")
-            table_responses = response.get(table_instance.name)
-            if table_responses:
-                table_responses = self._sort_dynamodb_response(
-                    table_responses, entity_ids
+
+        batch_items: List[List[Dict[str, Any]]]
+        if len(batches) <= 1 or online_config.max_read_workers <= 1:
+            batch_items = [read_batch(batch) for batch in batches]
+        else:
+            executor = self._get_read_executor(online_config.max_read_workers)
+            futures = [executor.submit(read_batch, batch) for batch in batches]
+            _, not_done = wait(
+                futures,
+                timeout=None if deadline is None else deadline - time.monotonic(),
+            )
+            if not_done:
+                for future in not_done:
+                    future.cancel()
+                raise _read_timeout_error(table_name, online_config)
+            batch_items = [future.result() for future in futures]
+        return _get_read_result(len(entity_keys), entity_idxs, batch_items)
+
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Retrieve feature values from the online DynamoDB store asynchronously, with aiobotocore.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            table: Feast FeatureView.
+            entity_keys: a list of entity keys that should be read from the FeatureStore.
+        """
+        online_config = config.online_store
+        assert isinstance(online_config, DynamoDBOnlineStoreConfig)
+        dynamodb_client = await self._get_aiodynamodb_client(
+            online_config.region, online_config.endpoint_url
+        )
+        table_name = _get_table_name(online_config, config, table)
+        deadline = _get_read_deadline(online_config)
+        entity_idxs, batches = _get_entity_id_batches(config, entity_keys)
+
+        semaphore = asyncio.Semaphore(max(online_config.max_read_workers, 1))
+
+        async def read_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await _batch_get_items_async(
+                    dynamodb_client, table_name, batch, online_config, deadline
                 )
-                entity_idx = 0
-                for tbl_res in table_responses:
-                    entity_id = tbl_res["entity_id"]
-                    while entity_id != batch[entity_idx]:
-                        batch_result.append((None, None))
-                        entity_idx += 1
-                    res = {}
-                    for feature_name, value_bin in tbl_res["values"].items():
-                        val = ValueProto()
-                        val.ParseFromString(value_bin.value)
-                        res[feature_name] = val
-                    batch_result.append(
-                        (datetime.fromisoformat(tbl_res["event_ts"]), res)
-                    )
-                    entity_idx += 1
 
-            # Not all entities in a batch may have responses
-            # Pad with remaining values in batch that were not found
-            batch_size_nones = ((None, None),) * (len(batch) - len(batch_result))
-            batch_result.extend(batch_size_nones)
-            result.extend(batch_result)
-        return result
+        read_batches = asyncio.gather(*[read_batch(batch) for batch in batches])
+        try:
+            batch_items = await asyncio.wait_for(
+                read_batches,
+                timeout=None if deadline is None else deadline - time.monotonic(),
+            )
+        except asyncio.TimeoutError:
+            raise _read_timeout_error(table_name, online_config)
+        return _get_read_result(len(entity_keys), entity_idxs, batch_items)
 
     def _get_dynamodb_client(self, region: str, endpoint_url: Optional[str] = None):
         if self._dynamodb_client is None:
@@ -288,19 +321,45 @@ class DynamoDBOnlineStore(OnlineStore):
             )
         return self._dynamodb_resource
 
-    def _sort_dynamodb_response(self, responses: list, order: list):
-        """DynamoDB Batch Get Item doesn't return items in a particular order."""
-        # Assign an index to order
-        order_with_index = {value: idx for idx, value in enumerate(order)}
-        # Sort table responses by index
-        table_responses_ordered = [
-            (order_with_index[tbl_res["entity_id"]], tbl_res) for tbl_res in responses
-        ]
-        table_responses_ordered = sorted(
-            table_responses_ordered, key=lambda tup: tup[0]
-        )
-        _, table_responses_ordered = zip(*table_responses_ordered)
-        return table_responses_ordered
+    async def _get_aiodynamodb_client(
+        self, region: str, endpoint_url: Optional[str] = None
+    ):
+        # The client is bound to the event loop it was created in, so a new one is created when the loop
+        # changes, e.g. with consecutive `asyncio.run` calls. The previous client can't be closed, as its
+        # loop may no longer run.
+        loop = asyncio.get_running_loop()
+        if (
+            self._aiodynamodb_client is None
+            or self._aiodynamodb_client_loop is not loop
+        ):
+            try:
+                from aiobotocore.session import get_session
+            except ImportError as e:
+                from feast.errors import FeastExtrasDependencyImportError
+
+                raise FeastExtrasDependencyImportError("aws", str(e))
+
+            # The client stays open as long as the event loop doesn't change.
+            self._aiodynamodb_client_loop = loop
+            self._aiodynamodb_exit_stack = contextlib.AsyncExitStack()
+            self._aiodynamodb_client = (
+                await self._aiodynamodb_exit_stack.enter_async_context(
+                    get_session().create_client(
+                        "dynamodb",
+                        region_name=region,
+                        endpoint_url=endpoint_url,
+                        config=Config(user_agent=get_user_agent()),
+                    )
+                )
+            )
+        return self._aiodynamodb_client
+
+    def _get_read_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        if self._read_executor is None:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="feast_dynamodb_read"
+            )
+        return self._read_executor
 
     @log_exceptions_and_usage(online_store="dynamodb")
     def _write_batch_non_duplicates(
@@ -333,6 +392,149 @@ class DynamoDBOnlineStore(OnlineStore):
                     progress(1)
 
 
+def _get_read_deadline(online_config: DynamoDBOnlineStoreConfig) -> Optional[float]:
+    if online_config.read_timeout_secs is None:
+        return None
+    return time.monotonic() + online_config.read_timeout_secs
+
+
+def _get_entity_id_batches(
+    config: RepoConfig, entity_keys: List[EntityKeyProto]
+) -> Tuple[Dict[str, List[int]], List[List[str]]]:
+    """
+    Returns the positions of every entity id in the result, and the batches of entity ids to read. Duplicate
+    entity ids are only read once.
+    """
+    online_config = config.online_store
+    entity_idxs: Dict[str, List[int]] = defaultdict(list)
+    for idx, entity_key in enumerate(entity_keys):
+        entity_id = compute_entity_id(
+            entity_key,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
+        entity_idxs[entity_id].append(idx)
+    entity_ids = list(entity_idxs)
+    batch_size = online_config.batch_size
+    batches = [
+        entity_ids[i : i + batch_size] for i in range(0, len(entity_ids), batch_size)
+    ]
+    return entity_idxs, batches
+
+
+def _get_read_result(
+    num_entity_keys: int,
+    entity_idxs: Dict[str, List[int]],
+    batch_items: List[List[Dict[str, Any]]],
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = [
+        (None, None)
+    ] * num_entity_keys
+    for items in batch_items:
+        for item in items:
+            values = {}
+            for feature_name, value_bin in item["values"]["M"].items():
+                val = ValueProto()
+                val.ParseFromString(value_bin["B"])
+                values[feature_name] = val
+            event_ts = datetime.fromisoformat(item["event_ts"]["S"])
+            idxs = entity_idxs[item["entity_id"]["S"]]
+            result[idxs[0]] = (event_ts, values)
+            for idx in idxs[1:]:
+                result[idx] = (event_ts, dict(values))
+    return result
+
+
+def _batch_get_request_items(
+    table_name: str, entity_ids: List[str], online_config: DynamoDBOnlineStoreConfig
+) -> Dict[str, Any]:
+    return {
+        table_name: {
+            "Keys": [{"entity_id": {"S": entity_id}} for entity_id in entity_ids],
+            "ConsistentRead": online_config.consistent_reads,
+        }
+    }
+
+
+def _get_read_retry_backoff(
+    table_name: str,
+    online_config: DynamoDBOnlineStoreConfig,
+    attempt: int,
+    deadline: Optional[float],
+) -> float:
+    """
+    Returns the backoff before retrying unprocessed keys, which grows exponentially with jitter. Raises a
+    TimeoutError if the deadline would be exceeded.
+    """
+    backoff = random.uniform(
+        0, online_config.read_retry_backoff_ms / 1000 * 2 ** (attempt - 1)
+    )
+    if deadline is not None and time.monotonic() + backoff >= deadline:
+        raise _read_timeout_error(table_name, online_config)
+    return backoff
+
+
+def _batch_get_items(
+    dynamodb_client,
+    table_name: str,
+    entity_ids: List[str],
+    online_config: DynamoDBOnlineStoreConfig,
+    deadline: Optional[float],
+) -> List[Dict[str, Any]]:
+    """
+    Reads the items of the given entity ids with BatchGetItem. Unprocessed keys, e.g. because of throttling,
+    are retried with exponential backoff and jitter, as long as the deadline isn't exceeded.
+    """
+    request_items = _batch_get_request_items(table_name, entity_ids, online_config)
+    items: List[Dict[str, Any]] = []
+    for attempt in range(online_config.max_read_retries + 1):
+        if attempt > 0:
+            time.sleep(
+                _get_read_retry_backoff(table_name, online_config, attempt, deadline)
+            )
+        with tracing_span(name="remote_call"):
+            response = dynamodb_client.batch_get_item(RequestItems=request_items)
+        items.extend(response["Responses"].get(table_name, []))
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return items
+    raise DynamoDBUnprocessedKeysError(
+        table_name, len(request_items[table_name]["Keys"])
+    )
+
+
+async def _batch_get_items_async(
+    dynamodb_client,
+    table_name: str,
+    entity_ids: List[str],
+    online_config: DynamoDBOnlineStoreConfig,
+    deadline: Optional[float],
+) -> List[Dict[str, Any]]:
+    """Like `_batch_get_items`, with an aiobotocore client."""
+    request_items = _batch_get_request_items(table_name, entity_ids, online_config)
+    items: List[Dict[str, Any]] = []
+    for attempt in range(online_config.max_read_retries + 1):
+        if attempt > 0:
+            await asyncio.sleep(
+                _get_read_retry_backoff(table_name, online_config, attempt, deadline)
+            )
+        response = await dynamodb_client.batch_get_item(RequestItems=request_items)
+        items.extend(response["Responses"].get(table_name, []))
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return items
+    raise DynamoDBUnprocessedKeysError(
+        table_name, len(request_items[table_name]["Keys"])
+    )
+
+
+def _read_timeout_error(
+    table_name: str, online_config: DynamoDBOnlineStoreConfig
+) -> TimeoutError:
+    return TimeoutError(
+        f"Reading from DynamoDB table {table_name} took longer than {online_config.read_timeout_secs} seconds."
+    )
+
+
 def _initialize_dynamodb_client(region: str, endpoint_url: Optional[str] = None):
     return boto3.client(
         "dynamodb",
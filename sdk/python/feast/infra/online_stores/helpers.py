@@ -1,5 +1,5 @@
 import struct
-from typing import Any, List
+from typing import Any, Dict, List
 
 import mmh3
 
@@ -10,6 +10,7 @@ from feast.infra.key_encoding_utils import (
 )
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 
 
 def get_online_store_from_config(online_store_config: Any) -> OnlineStore:
@@ -62,3 +63,36 @@ def compute_entity_id(
             entity_key_serialization_version=entity_key_serialization_version,
         )
     ).hex()
+
+
+def _pack_feature_values(values: Dict[str, ValueProto]) -> bytes:
+    """
+    Packs feature values into a single blob: the name and serialized value of every feature, each
+    prefixed with its length.
+    """
+    output: List[bytes] = []
+    for feature_name, val in values.items():
+        name_bin = feature_name.encode("utf8")
+        val_bin = val.SerializeToString()
+        output.append(struct.pack("<I", len(name_bin)))
+        output.append(name_bin)
+        output.append(struct.pack("<I", len(val_bin)))
+        output.append(val_bin)
+    return b"".join(output)
+
+
+def _unpack_feature_values(packed: bytes) -> Dict[str, ValueProto]:
+    values: Dict[str, ValueProto] = {}
+    offset = 0
+    while offset < len(packed):
+        (name_length,) = struct.unpack_from("<I", packed, offset)
+        offset += 4
+        feature_name = packed[offset : offset + name_length].decode("utf8")
+        offset += name_length
+        (val_length,) = struct.unpack_from("<I", packed, offset)
+        offset += 4
+        val = ValueProto()
+        val.ParseFromString(packed[offset : offset + val_length])
+        offset += val_length
+        values[feature_name] = val
+    return values
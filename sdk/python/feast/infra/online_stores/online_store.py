@@ -80,6 +80,83 @@ class OnlineStore(ABC):
         """
         pass
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys asynchronously, like `online_read`.
+
+        Online stores that support asynchronous reads should override this method with an implementation
+        that doesn't block the event loop.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+
+        Raises:
+            NotImplementedError: The online store doesn't support asynchronous reads.
+        """
+        raise NotImplementedError(
+            f"Online store {self.__class__.__name__} does not support asynchronous reads."
+        )
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values of several feature views for the same entity keys at once.
+
+        Online stores that store the features of all feature views of an entity together should override
+        this method, so that the feature views are read with a single lookup per entity key.
+
+        Args:
+            config: The config for the current feature store.
+            tables: The feature views whose feature values should be read, each with the list of features
+                that should be read. All feature views have the join keys of `entity_keys`.
+            entity_keys: The list of entity keys for which feature values should be read.
+
+        Returns:
+            One list per feature view, in the same order as `tables`, like the result of `online_read`.
+
+        Raises:
+            NotImplementedError: The online store doesn't support reading several feature views at once.
+        """
+        raise NotImplementedError(
+            f"Online store {self.__class__.__name__} does not support reading several feature views at once."
+        )
+
+    async def online_read_many_async(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values of several feature views asynchronously, like `online_read_many`.
+
+        Raises:
+            NotImplementedError: The online store doesn't support reading several feature views at once
+                asynchronously.
+        """
+        raise NotImplementedError(
+            f"Online store {self.__class__.__name__} does not support reading several feature views at once "
+            "asynchronously."
+        )
+
     @abstractmethod
     def update(
         self,
@@ -11,10 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import json
 import logging
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     ByteString,
@@ -33,6 +35,7 @@ from pydantic import StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, RepoConfig, utils
+from feast.infra.key_encoding_utils import serialize_entity_keys
 from feast.infra.online_stores.helpers import _mmh3, _redis_key, _redis_key_prefix
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
@@ -42,6 +45,7 @@ from feast.usage import log_exceptions_and_usage, tracing_span
 
 try:
     from redis import Redis
+    from redis import asyncio as redis_asyncio
     from redis.cluster import ClusterNode, RedisCluster
     from redis.sentinel import Sentinel
 except ImportError as e:
@@ -87,9 +91,15 @@ class RedisOnlineStore(OnlineStore):
 
     Attributes:
         _client: Redis connection.
+        _client_async: Asyncio Redis connection, used by asynchronous reads.
+        _client_async_loop: Event loop that `_client_async` was created in.
     """
 
     _client: Optional[Union[Redis, RedisCluster]] = None
+    _client_async: Optional[
+        Union[redis_asyncio.Redis, redis_asyncio.RedisCluster]
+    ] = None
+    _client_async_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def delete_entity_values(self, config: RepoConfig, join_keys: List[str]):
         client = self._get_client(config.online_store)
@@ -198,6 +208,38 @@ class RedisOnlineStore(OnlineStore):
                 self._client = Redis(**kwargs)
         return self._client
 
+    def _get_client_async(self, online_store_config: RedisOnlineStoreConfig):
+        """
+        Creates the asyncio RedisCluster or Redis client depending on configuration.
+        The client is bound to the running event loop, so a new one is created when the loop changes,
+        e.g. with consecutive `asyncio.run` calls.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._client_async or self._client_async_loop is not loop:
+            self._client_async_loop = loop
+            startup_nodes, kwargs = self._parse_connection_string(
+                online_store_config.connection_string
+            )
+            if online_store_config.redis_type == RedisType.redis_cluster:
+                kwargs["startup_nodes"] = [
+                    redis_asyncio.cluster.ClusterNode(**node) for node in startup_nodes
+                ]
+                self._client_async = redis_asyncio.RedisCluster(**kwargs)
+            elif online_store_config.redis_type == RedisType.redis_sentinel:
+                sentinel_hosts = []
+
+                for item in startup_nodes:
+                    sentinel_hosts.append((item["host"], int(item["port"])))
+
+                sentinel = redis_asyncio.sentinel.Sentinel(sentinel_hosts, **kwargs)
+                master = sentinel.master_for(online_store_config.sentinel_master)
+                self._client_async = master
+            else:
+                kwargs["host"] = startup_nodes[0]["host"]
+                kwargs["port"] = startup_nodes[0]["port"]
+                self._client_async = redis_asyncio.Redis(**kwargs)
+        return self._client_async
+
     @log_exceptions_and_usage(online_store="redis")
     def online_write_batch(
         self,
@@ -251,11 +293,11 @@ class RedisOnlineStore(OnlineStore):
 
                 ts = Timestamp()
                 ts.seconds = event_time_seconds
-                entity_hset = dict()
+                entity_hset: Dict[Union[bytes, str], bytes] = dict()
                 entity_hset[ts_key] = ts.SerializeToString()
 
                 for feature_name, val in values.items():
-                    f_key = _mmh3(f"{feature_view}:{feature_name}")
+                    f_key = _hset_key(feature_view, feature_name)
                     entity_hset[f_key] = val.SerializeToString()
 
                 pipe.hset(redis_key_bin, mapping=entity_hset)
@@ -276,66 +318,160 @@ class RedisOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        online_store_config = config.online_store
-        assert isinstance(online_store_config, RedisOnlineStoreConfig)
+        return self._online_read_many(
+            config, [(table, requested_features)], entity_keys
+        )[0]
 
-        client = self._get_client(online_store_config)
-        feature_view = table.name
-        project = config.project
+    @log_exceptions_and_usage(online_store="redis")
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        # The feature views of an entity are stored in the same hash, so they are read with a single
+        # HMGET per entity key.
+        return self._online_read_many(config, tables, entity_keys)
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        result = await self.online_read_many_async(
+            config, [(table, requested_features)], entity_keys
+        )
+        return result[0]
 
-        if not requested_features:
-            requested_features = [f.name for f in table.features]
+    async def online_read_many_async(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
-        hset_keys = [_mmh3(f"{feature_view}:{k}") for k in requested_features]
+        client = self._get_client_async(online_store_config)
+        keys, hset_keys, tables_requested_features = self._prepare_read(
+            config, tables, entity_keys
+        )
+        async with client.pipeline(transaction=False) as pipe:
+            for redis_key_bin in keys:
+                pipe.hmget(redis_key_bin, hset_keys)
+            redis_values = await pipe.execute()
+        return self._get_features_for_tables(redis_values, tables_requested_features)
 
-        ts_key = f"_ts:{feature_view}"
-        hset_keys.append(ts_key)
-        requested_features.append(ts_key)
+    def _online_read_many(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
-        keys = []
-        for entity_key in entity_keys:
-            redis_key_bin = _redis_key(
-                project,
-                entity_key,
-                entity_key_serialization_version=config.entity_key_serialization_version,
-            )
-            keys.append(redis_key_bin)
+        client = self._get_client(online_store_config)
+        keys, hset_keys, tables_requested_features = self._prepare_read(
+            config, tables, entity_keys
+        )
         with client.pipeline(transaction=False) as pipe:
             for redis_key_bin in keys:
                 pipe.hmget(redis_key_bin, hset_keys)
             with tracing_span(name="remote_call"):
                 redis_values = pipe.execute()
-        for values in redis_values:
-            features = self._get_features_for_entity(
-                values, feature_view, requested_features
+        return self._get_features_for_tables(redis_values, tables_requested_features)
+
+    def _prepare_read(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> Tuple[List[bytes], List[Union[bytes, str]], List[List[str]]]:
+        """
+        Returns the Redis keys of the entity keys, the hash fields to read from every key, and the names of
+        the features to read from each feature view. The fields of each feature view are its features,
+        followed by its timestamp.
+        """
+        hset_keys: List[Union[bytes, str]] = []
+        tables_requested_features = []
+        for table, requested_features in tables:
+            if not requested_features:
+                requested_features = [f.name for f in table.features]
+            hset_keys.extend(_hset_keys(table.name, tuple(requested_features)))
+            tables_requested_features.append(requested_features)
+
+        project_bin = config.project.encode("utf-8")
+        keys = [
+            entity_key_bin + project_bin
+            for entity_key_bin in serialize_entity_keys(
+                entity_keys,
+                entity_key_serialization_version=config.entity_key_serialization_version,
             )
-            result.append(features)
-        return result
+        ]
+        return keys, hset_keys, tables_requested_features
+
+    def _get_features_for_tables(
+        self,
+        redis_values: List[List[Optional[bytes]]],
+        tables_requested_features: List[List[str]],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """Splits the hash fields read for every entity key into the features of each feature view."""
+        tables_result: List[
+            List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]
+        ] = [[] for _ in tables_requested_features]
+        for values in redis_values:
+            offset = 0
+            for table_result, requested_features in zip(
+                tables_result, tables_requested_features
+            ):
+                ts_offset = offset + len(requested_features)
+                table_result.append(
+                    self._get_features_for_entity(
+                        values[offset:ts_offset], values[ts_offset], requested_features
+                    )
+                )
+                offset = ts_offset + 1
+        return tables_result
 
     def _get_features_for_entity(
         self,
-        values: List[ByteString],
-        feature_view: str,
+        values: Sequence[Optional[ByteString]],
+        ts_val: Optional[ByteString],
         requested_features: List[str],
     ) -> Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]:
-        res_val = dict(zip(requested_features, values))
+        if not requested_features:
+            return None, None
 
         res_ts = Timestamp()
-        ts_val = res_val.pop(f"_ts:{feature_view}")
         if ts_val:
             res_ts.ParseFromString(bytes(ts_val))
 
         res = {}
-        for feature_name, val_bin in res_val.items():
+        for feature_name, val_bin in zip(requested_features, values):
             val = ValueProto()
             if val_bin:
                 val.ParseFromString(bytes(val_bin))
             res[feature_name] = val
 
-        if not res:
-            return None, None
-        else:
-            timestamp = datetime.fromtimestamp(res_ts.seconds, tz=pytz.utc)
-            return timestamp, res
+        timestamp = datetime.fromtimestamp(res_ts.seconds, tz=pytz.utc)
+        return timestamp, res
+
+
+@lru_cache(maxsize=None)
+def _hset_key(feature_view: str, feature_name: str) -> bytes:
+    """Returns the hash field of a feature, which is the same for every entity key."""
+    return _mmh3(f"{feature_view}:{feature_name}")
+
+
+@lru_cache(maxsize=1024)
+def _hset_keys(
+    feature_view: str, requested_features: Tuple[str, ...]
+) -> Tuple[Union[bytes, str], ...]:
+    """Returns the hash fields of the requested features of a feature view, followed by its timestamp field."""
+    return (
+        *[_hset_key(feature_view, feature_name) for feature_name in requested_features],
+        f"_ts:{feature_view}",
+    )
@@ -11,20 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import itertools
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import StrictStr
+from pydantic import StrictBool, StrictInt, StrictStr
 from pydantic.schema import Literal
 
 from feast import Entity
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import SQLITE_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import serialize_entity_keys
+from feast.infra.online_stores.helpers import (
+    _pack_feature_values,
+    _unpack_feature_values,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.InfraObject_pb2 import InfraObject as InfraObjectProto
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
@@ -47,6 +51,24 @@ class SqliteOnlineStoreConfig(FeastConfigBaseModel):
     path: StrictStr = "data/online.db"
     """ (optional) Path to sqlite db """
 
+    journal_mode: Optional[
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+    ] = None
+    """ (optional) SQLite journal mode, e.g. WAL. Defaults to the journal mode of the database."""
+
+    synchronous: Optional[Literal["OFF", "NORMAL", "FULL", "EXTRA"]] = None
+    """ (optional) SQLite synchronous setting, e.g. NORMAL, which is safe in WAL mode and makes writes
+    faster. Defaults to FULL."""
+
+    mmap_size: Optional[StrictInt] = None
+    """ (optional) Maximum number of bytes of the database file that are memory-mapped by read connections,
+    which makes reads faster when the database fits in memory."""
+
+    wide_rows: StrictBool = False
+    """ (optional) If True, tables have one row per entity with all feature values packed in a single
+    column, instead of one row per entity and feature. Every write replaces all the feature values of an
+    entity. Tables with wide rows can't be read by the Go feature server."""
+
 
 class SqliteOnlineStore(OnlineStore):
     """
@@ -54,9 +76,11 @@ class SqliteOnlineStore(OnlineStore):
 
     Attributes:
         _conn: SQLite connection.
+        _read_conns: Thread-local read-only SQLite connections.
     """
 
     _conn: Optional[sqlite3.Connection] = None
+    _read_conns: threading.local
 
     @staticmethod
     def _get_db_path(config: RepoConfig) -> str:
@@ -71,12 +95,38 @@ class SqliteOnlineStore(OnlineStore):
             db_path = config.online_store.path
         return db_path
 
+    def __init__(self):
+        super().__init__()
+        self._read_conns = threading.local()
+
     def _get_conn(self, config: RepoConfig):
         if not self._conn:
             db_path = self._get_db_path(config)
-            self._conn = _initialize_conn(db_path)
+            self._conn = _initialize_conn(
+                db_path,
+                journal_mode=config.online_store.journal_mode,
+                synchronous=config.online_store.synchronous,
+            )
         return self._conn
 
+    def _get_read_conn(self, config: RepoConfig) -> sqlite3.Connection:
+        """
+        Returns the read-only connection of the current thread, so that threads can read concurrently.
+        """
+        db_path = self._get_db_path(config)
+        read_conn = getattr(self._read_conns, "conn", None)
+        if read_conn is None or self._read_conns.db_path != db_path:
+            try:
+                read_conn = _initialize_read_conn(
+                    db_path, config.online_store.mmap_size
+                )
+            except sqlite3.OperationalError:
+                # A read-only connection can't create the database if it doesn't exist yet.
+                return self._get_conn(config)
+            self._read_conns.conn = read_conn
+            self._read_conns.db_path = db_path
+        return read_conn
+
     @log_exceptions_and_usage(online_store="sqlite")
     def online_write_batch(
         self,
@@ -90,50 +140,57 @@ class SqliteOnlineStore(OnlineStore):
 
         conn = self._get_conn(config)
 
-        project = config.project
+        table_id = _table_id(config.project, table, config.online_store.wide_rows)
+        entity_key_bins = serialize_entity_keys(
+            [entity_key for entity_key, _, _, _ in data],
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
 
-        with conn:
-            for entity_key, values, timestamp, created_ts in data:
-                entity_key_bin = serialize_entity_key(
-                    entity_key,
-                    entity_key_serialization_version=config.entity_key_serialization_version,
+        rows: List[Tuple[Any, ...]] = []
+        for entity_key_bin, (_, values, timestamp, created_ts) in zip(
+            entity_key_bins, data
+        ):
+            timestamp = to_naive_utc(timestamp)
+            if created_ts is not None:
+                created_ts = to_naive_utc(created_ts)
+
+            if config.online_store.wide_rows:
+                rows.append(
+                    (
+                        entity_key_bin,
+                        _pack_feature_values(values),
+                        timestamp,
+                        created_ts,
+                    )
                 )
-                timestamp = to_naive_utc(timestamp)
-                if created_ts is not None:
-                    created_ts = to_naive_utc(created_ts)
-
-                for feature_name, val in values.items():
-                    conn.execute(
-                        f"""
-                            UPDATE {_table_id(project, table)}
-                            SET value = ?, event_ts = ?, created_ts = ?
-                            WHERE (entity_key = ? AND feature_name = ?)
-                        """,
-                        (
-                            # SET
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                            # WHERE
-                            entity_key_bin,
-                            feature_name,
-                        ),
+            else:
+                rows.extend(
+                    (
+                        entity_key_bin,
+                        feature_name,
+                        val.SerializeToString(),
+                        timestamp,
+                        created_ts,
                     )
+                    for feature_name, val in values.items()
+                )
 
-                    conn.execute(
-                        f"""INSERT OR IGNORE INTO {_table_id(project, table)}
-                            (entity_key, feature_name, value, event_ts, created_ts)
-                            VALUES (?, ?, ?, ?, ?)""",
-                        (
-                            entity_key_bin,
-                            feature_name,
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                        ),
-                    )
-                if progress:
-                    progress(1)
+        if config.online_store.wide_rows:
+            query = _upsert_query(
+                table_id,
+                ["entity_key", "value", "event_ts", "created_ts"],
+                ["entity_key"],
+            )
+        else:
+            query = _upsert_query(
+                table_id,
+                ["entity_key", "feature_name", "value", "event_ts", "created_ts"],
+                ["entity_key", "feature_name"],
+            )
+        with conn:
+            conn.executemany(query, rows)
+        if progress:
+            progress(len(data))
 
     @log_exceptions_and_usage(online_store="sqlite")
     def online_read(
@@ -143,48 +200,46 @@ class SqliteOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
-        conn = self._get_conn(config)
-        cur = conn.cursor()
+        conn = self._get_read_conn(config)
+        wide_rows = config.online_store.wide_rows
+        table_id = _table_id(config.project, table, wide_rows)
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        entity_key_bins = serialize_entity_keys(
+            entity_keys,
+            entity_key_serialization_version=config.entity_key_serialization_version,
+        )
 
         with tracing_span(name="remote_call"):
-            # Fetch all entities in one go
-            cur.execute(
-                f"SELECT entity_key, feature_name, value, event_ts "
-                f"FROM {_table_id(config.project, table)} "
-                f"WHERE entity_key IN ({','.join('?' * len(entity_keys))}) "
-                f"ORDER BY entity_key",
-                [
-                    serialize_entity_key(
-                        entity_key,
-                        entity_key_serialization_version=config.entity_key_serialization_version,
-                    )
-                    for entity_key in entity_keys
-                ],
+            rows = _select_by_entity_keys(
+                conn,
+                f"SELECT entity_key, value, event_ts FROM {table_id}"
+                if wide_rows
+                else f"SELECT entity_key, feature_name, value, event_ts FROM {table_id}",
+                list(dict.fromkeys(entity_key_bins)),
             )
-            rows = cur.fetchall()
-
-        rows = {
-            k: list(group) for k, group in itertools.groupby(rows, key=lambda r: r[0])
-        }
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(
-                entity_key,
-                entity_key_serialization_version=config.entity_key_serialization_version,
-            )
-            res = {}
-            res_ts = None
-            for _, feature_name, val_bin, ts in rows.get(entity_key_bin, []):
+
+        values_by_entity_key: Dict[bytes, Tuple[datetime, Dict[str, ValueProto]]] = {}
+        if wide_rows:
+            for entity_key_bin, value_bin, event_ts in rows:
+                values_by_entity_key[entity_key_bin] = (
+                    event_ts,
+                    _unpack_feature_values(value_bin),
+                )
+        else:
+            for entity_key_bin, feature_name, val_bin, event_ts in rows:
                 val = ValueProto()
                 val.ParseFromString(val_bin)
+                _, res = values_by_entity_key.get(entity_key_bin, (None, {}))
                 res[feature_name] = val
-                res_ts = ts
+                values_by_entity_key[entity_key_bin] = (event_ts, res)
 
-            if not res:
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for entity_key_bin in entity_key_bins:
+            entity_values = values_by_entity_key.get(entity_key_bin)
+            if entity_values is None or not entity_values[1]:
                 result.append((None, None))
             else:
-                result.append((res_ts, res))
+                result.append(entity_values)
         return result
 
     @log_exceptions_and_usage(online_store="sqlite")
@@ -199,17 +254,13 @@ class SqliteOnlineStore(OnlineStore):
     ):
         conn = self._get_conn(config)
         project = config.project
+        wide_rows = config.online_store.wide_rows
 
         for table in tables_to_keep:
-            conn.execute(
-                f"CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
-            )
-            conn.execute(
-                f"CREATE INDEX IF NOT EXISTS {_table_id(project, table)}_ek ON {_table_id(project, table)} (entity_key);"
-            )
+            _create_table(conn, _table_id(project, table, wide_rows), wide_rows)
 
         for table in tables_to_delete:
-            conn.execute(f"DROP TABLE IF EXISTS {_table_id(project, table)}")
+            conn.execute(f"DROP TABLE IF EXISTS {_table_id(project, table, wide_rows)}")
 
     @log_exceptions_and_usage(online_store="sqlite")
     def plan(
@@ -220,7 +271,12 @@ class SqliteOnlineStore(OnlineStore):
         infra_objects: List[InfraObject] = [
             SqliteTable(
                 path=self._get_db_path(config),
-                name=_table_id(project, FeatureView.from_proto(view)),
+                name=_table_id(
+                    project,
+                    FeatureView.from_proto(view),
+                    config.online_store.wide_rows,
+                ),
+                wide_rows=config.online_store.wide_rows,
             )
             for view in [
                 *desired_registry_proto.feature_views,
@@ -240,18 +296,110 @@ class SqliteOnlineStore(OnlineStore):
         except FileNotFoundError:
             pass
 
-
-def _initialize_conn(db_path: str):
+        # Connections would keep using the deleted database. The read connections of other threads
+        # are closed once they are garbage collected.
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+        read_conn = getattr(self._read_conns, "conn", None)
+        if read_conn is not None:
+            read_conn.close()
+        self._read_conns = threading.local()
+
+
+def _initialize_conn(
+    db_path: str,
+    journal_mode: Optional[str] = None,
+    synchronous: Optional[str] = None,
+):
     Path(db_path).parent.mkdir(exist_ok=True)
-    return sqlite3.connect(
+    conn = sqlite3.connect(
         db_path,
         detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
         check_same_thread=False,
     )
+    if journal_mode:
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+    if synchronous:
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+    return conn
+
+
+def _initialize_read_conn(db_path: str, mmap_size: Optional[int] = None):
+    conn = sqlite3.connect(
+        f"{Path(db_path).absolute().as_uri()}?mode=ro",
+        uri=True,
+        detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+    )
+    if mmap_size is not None:
+        conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+    return conn
+
+
+def _max_variable_number(conn: sqlite3.Connection) -> int:
+    if hasattr(conn, "getlimit"):
+        return conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    # The default limits of SQLite before and since 3.32.0
+    return 999 if sqlite3.sqlite_version_info < (3, 32, 0) else 32766
+
+
+def _select_by_entity_keys(
+    conn: sqlite3.Connection, select: str, entity_key_bins: List[bytes]
+) -> List[Tuple[Any, ...]]:
+    """
+    Runs the select statement for the given entity keys, in chunks that don't exceed the maximum number
+    of host parameters of a statement.
+    """
+    chunk_size = _max_variable_number(conn)
+    rows: List[Tuple[Any, ...]] = []
+    for i in range(0, len(entity_key_bins), chunk_size):
+        chunk = entity_key_bins[i : i + chunk_size]
+        rows.extend(
+            conn.execute(
+                f"{select} WHERE entity_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+        )
+    return rows
 
 
-def _table_id(project: str, table: FeatureView) -> str:
-    return f"{project}_{table.name}"
+def _table_id(project: str, table: FeatureView, wide_rows: bool = False) -> str:
+    # Tables with wide rows have a different name, so that changing the layout creates new tables.
+    return f"{project}_{table.name}_wide" if wide_rows else f"{project}_{table.name}"
+
+
+def _create_table(conn: sqlite3.Connection, table_name: str, wide_rows: bool):
+    if wide_rows:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table_name} (entity_key BLOB PRIMARY KEY, value BLOB, event_ts timestamp, created_ts timestamp)"
+        )
+        return
+
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {table_name} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS {table_name}_ek ON {table_name} (entity_key);"
+    )
+
+
+def _upsert_query(table_name: str, columns: List[str], key_columns: List[str]) -> str:
+    """
+    Returns a statement that inserts a row, or updates the existing row with the same key columns.
+    """
+    placeholders = ", ".join("?" * len(columns))
+    if sqlite3.sqlite_version_info < (3, 24, 0):
+        # Upserts aren't supported, so existing rows are deleted and inserted again instead.
+        return f"INSERT OR REPLACE INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+    updates = ", ".join(
+        f"{column} = excluded.{column}"
+        for column in columns
+        if column not in key_columns
+    )
+    return (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT({', '.join(key_columns)}) DO UPDATE SET {updates}"
+    )
 
 
 class SqliteTable(InfraObject):
@@ -261,15 +409,18 @@ class SqliteTable(InfraObject):
     Attributes:
         path: The absolute path of the Sqlite file.
         name: The name of the table.
+        wide_rows: Whether the table has one row per entity instead of one row per entity and feature.
         conn: SQLite connection.
     """
 
     path: str
+    wide_rows: bool
     conn: sqlite3.Connection
 
-    def __init__(self, path: str, name: str):
+    def __init__(self, path: str, name: str, wide_rows: bool = False):
         super().__init__(name)
         self.path = path
+        self.wide_rows = wide_rows
         self.conn = _initialize_conn(path)
 
     def to_infra_object_proto(self) -> InfraObjectProto:
@@ -283,6 +434,7 @@ class SqliteTable(InfraObject):
         sqlite_table_proto = SqliteTableProto()
         sqlite_table_proto.path = self.path
         sqlite_table_proto.name = self.name
+        sqlite_table_proto.wide_rows = self.wide_rows
         return sqlite_table_proto
 
     @staticmethod
@@ -290,6 +442,7 @@ class SqliteTable(InfraObject):
         return SqliteTable(
             path=infra_object_proto.sqlite_table.path,
             name=infra_object_proto.sqlite_table.name,
+            wide_rows=infra_object_proto.sqlite_table.wide_rows,
         )
 
     @staticmethod
@@ -297,15 +450,11 @@ class SqliteTable(InfraObject):
         return SqliteTable(
             path=sqlite_table_proto.path,
             name=sqlite_table_proto.name,
+            wide_rows=sqlite_table_proto.wide_rows,
         )
 
     def update(self):
-        self.conn.execute(
-            f"CREATE TABLE IF NOT EXISTS {self.name} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
-        )
-        self.conn.execute(
-            f"CREATE INDEX IF NOT EXISTS {self.name}_ek ON {self.name} (entity_key);"
-        )
+        _create_table(self.conn, self.name, self.wide_rows)
 
     def teardown(self):
         self.conn.execute(f"DROP TABLE IF EXISTS {self.name}")
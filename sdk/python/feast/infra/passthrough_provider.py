@@ -190,6 +190,48 @@ class PassthroughProvider(Provider):
             )
         return result
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        result = []
+        if self.online_store:
+            result = await self.online_store.online_read_async(
+                config, table, entity_keys, requested_features
+            )
+        return result
+
+    @log_exceptions_and_usage(sampler=RatioSampler(ratio=0.001))
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        result: List = [[] for _ in tables]
+        if self.online_store:
+            result = self.online_store.online_read_many(config, tables, entity_keys)
+        return result
+
+    async def online_read_many_async(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List:
+        set_usage_attribute("provider", self.__class__.__name__)
+        result: List = [[] for _ in tables]
+        if self.online_store:
+            result = await self.online_store.online_read_many_async(
+                config, tables, entity_keys
+            )
+        return result
+
     def ingest_df(
         self,
         feature_view: FeatureView,
@@ -253,6 +295,39 @@ class PassthroughProvider(Provider):
             assert e
             raise e
 
+    def materialize_feature_views(
+        self,
+        config: RepoConfig,
+        feature_views: List[Tuple[FeatureView, datetime, datetime]],
+        registry: BaseRegistry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> List[Optional[BaseException]]:
+        set_usage_attribute("provider", self.__class__.__name__)
+        tasks = []
+        for feature_view, start_date, end_date in feature_views:
+            assert (
+                isinstance(feature_view, BatchFeatureView)
+                or isinstance(feature_view, StreamFeatureView)
+                or isinstance(feature_view, FeatureView)
+            ), f"Unexpected type for {feature_view.name}: {type(feature_view)}"
+            tasks.append(
+                MaterializationTask(
+                    project=project,
+                    feature_view=feature_view,
+                    start_time=start_date,
+                    end_time=end_date,
+                    tqdm_builder=tqdm_builder,
+                )
+            )
+        # The batch engine receives all tasks at once, so that it can run them concurrently.
+        jobs = self.batch_engine.materialize(registry, tasks)
+        assert len(jobs) == len(tasks)
+        return [
+            job.error() if job.status() == MaterializationJobStatus.ERROR else None
+            for job in jobs
+        ]
+
     def get_historical_features(
         self,
         config: RepoConfig,
@@ -173,6 +173,46 @@ class Provider(ABC):
         """
         pass
 
+    def materialize_feature_views(
+        self,
+        config: RepoConfig,
+        feature_views: List[Tuple[FeatureView, datetime, datetime]],
+        registry: BaseRegistry,
+        project: str,
+        tqdm_builder: Callable[[int], tqdm],
+    ) -> List[Optional[BaseException]]:
+        """
+        Writes latest feature values of several feature views to the online store. Each feature view is
+        materialized even if another one fails, possibly concurrently with the others.
+
+        Args:
+            config: The config for the current feature store.
+            feature_views: The feature views to materialize, each with the start and the end of its time range.
+            registry: The registry for the current feature store.
+            project: Feast project to which the objects belong.
+            tqdm_builder: A function to monitor the progress of materialization.
+
+        Returns:
+            For each feature view, the error raised by its materialization, or None if it succeeded.
+        """
+        errors: List[Optional[BaseException]] = []
+        for feature_view, start_date, end_date in feature_views:
+            try:
+                self.materialize_single_feature_view(
+                    config=config,
+                    feature_view=feature_view,
+                    start_date=start_date,
+                    end_date=end_date,
+                    registry=registry,
+                    project=project,
+                    tqdm_builder=tqdm_builder,
+                )
+            except Exception as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
+
     @abstractmethod
     def get_historical_features(
         self,
@@ -229,6 +269,77 @@ class Provider(ABC):
         """
         pass
 
+    async def online_read_async(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        """
+        Reads features values for the given entity keys asynchronously, like `online_read`.
+
+        Args:
+            config: The config for the current feature store.
+            table: The feature view whose feature values should be read.
+            entity_keys: The list of entity keys for which feature values should be read.
+            requested_features: The list of features that should be read.
+
+        Returns:
+            A list of the same length as entity_keys. Each item in the list is a tuple where the first
+            item is the event timestamp for the row, and the second item is a dict mapping feature names
+            to values, which are returned in proto format.
+
+        Raises:
+            NotImplementedError: The provider doesn't support asynchronous reads.
+        """
+        raise NotImplementedError(
+            f"Provider {self.__class__.__name__} does not support asynchronous reads."
+        )
+
+    def online_read_many(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values of several feature views for the same entity keys at once.
+
+        Args:
+            config: The config for the current feature store.
+            tables: The feature views whose feature values should be read, each with the list of features
+                that should be read. All feature views have the join keys of `entity_keys`.
+            entity_keys: The list of entity keys for which feature values should be read.
+
+        Returns:
+            One list per feature view, in the same order as `tables`, like the result of `online_read`.
+
+        Raises:
+            NotImplementedError: The provider doesn't support reading several feature views at once.
+        """
+        raise NotImplementedError(
+            f"Provider {self.__class__.__name__} does not support reading several feature views at once."
+        )
+
+    async def online_read_many_async(
+        self,
+        config: RepoConfig,
+        tables: Sequence[Tuple[FeatureView, Optional[List[str]]]],
+        entity_keys: List[EntityKeyProto],
+    ) -> List[List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]]:
+        """
+        Reads features values of several feature views asynchronously, like `online_read_many`.
+
+        Raises:
+            NotImplementedError: The provider doesn't support reading several feature views at once
+                asynchronously.
+        """
+        raise NotImplementedError(
+            f"Provider {self.__class__.__name__} does not support reading several feature views at once "
+            "asynchronously."
+        )
+
     @abstractmethod
     def retrieve_saved_dataset(
         self, config: RepoConfig, dataset: SavedDataset
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import logging
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from google.protobuf.json_format import MessageToJson
@@ -33,13 +35,20 @@ from feast.request_feature_view import RequestFeatureView
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
+logger = logging.getLogger(__name__)
+
 
 class BaseRegistry(ABC):
     """
     The interface that Feast uses to apply, list, retrieve, and delete Feast objects (e.g. entities,
     feature views, and data sources).
+
+    Attributes:
+        _refresh_thread: The thread that refreshes the registry cache in the background, if any.
     """
 
+    _refresh_thread: Optional["_RegistryRefreshThread"] = None
+
     # Entity operations
     @abstractmethod
     def apply_entity(self, entity: Entity, project: str, commit: bool = True):
@@ -564,6 +573,21 @@ class BaseRegistry(ABC):
             The registry proto object.
         """
 
+    def get_cached_registry_proto(self, project: str) -> Optional[RegistryProto]:
+        """
+        Retrieves the cached registry proto that cached lookups are served from, refreshing it first if the
+        cache has expired.
+
+        A different proto object or version id indicates that state derived from cached lookups is stale.
+
+        Args:
+            project: Feast project that the cached lookups belong to
+
+        Returns:
+            The cached registry proto, or None if the registry does not cache the registry proto.
+        """
+        return None
+
     @abstractmethod
     def commit(self):
         """Commits the state of the registry cache to the remote registry store."""
@@ -572,6 +596,40 @@ class BaseRegistry(ABC):
     def refresh(self, project: Optional[str] = None):
         """Refreshes the state of the registry cache by fetching the registry state from the remote registry store."""
 
+    def start_background_refresh(self, interval: timedelta):
+        """
+        Refreshes the registry cache in a daemon thread every `interval`, instead of when a cached lookup finds
+        that the cache has expired.
+
+        Cached lookups of registries that support it then return the last successfully refreshed registry state
+        without waiting for refreshes, and keep returning it if refreshes fail. Since refreshes replace the
+        cache, the registry shouldn't be modified while it is refreshed in the background.
+
+        Args:
+            interval: The time between refreshes. The registry isn't refreshed if it is not positive.
+        """
+        if self._refresh_thread is not None or interval.total_seconds() <= 0:
+            return
+        self._refresh_thread = _RegistryRefreshThread(self, interval)
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """Stops refreshing the registry cache in the background."""
+        refresh_thread = self._refresh_thread
+        if refresh_thread is not None:
+            self._refresh_thread = None
+            refresh_thread.stop()
+
+    def get_cache_staleness(self) -> Optional[timedelta]:
+        """
+        Returns the time since the registry cache was last refreshed successfully in the background, or None if
+        it isn't refreshed in the background. The staleness keeps growing while refreshes fail.
+        """
+        refresh_thread = self._refresh_thread
+        if refresh_thread is None:
+            return None
+        return datetime.utcnow() - refresh_thread.last_refreshed
+
     @staticmethod
     def _message_to_sorted_dict(message: Message) -> Dict[str, Any]:
         return json.loads(MessageToJson(message, sort_keys=True))
@@ -655,3 +713,32 @@ class BaseRegistry(ABC):
                 self._message_to_sorted_dict(infra_object.to_proto())
             )
         return registry_dict
+
+
+class _RegistryRefreshThread(threading.Thread):
+    """
+    Refreshes the cache of a registry every `interval` until it is stopped. If a refresh fails, the error is
+    logged and the registry keeps its previous cache.
+    """
+
+    def __init__(self, registry: BaseRegistry, interval: timedelta):
+        super().__init__(name="feast_registry_refresh", daemon=True)
+        self.registry = registry
+        self.interval = interval
+        self.last_refreshed = datetime.utcnow()
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval.total_seconds()):
+            try:
+                self.registry.refresh()
+            except Exception:
+                logger.exception(
+                    "Failed to refresh the registry, the cached registry was last refreshed %s ago",
+                    datetime.utcnow() - self.last_refreshed,
+                )
+            else:
+                self.last_refreshed = datetime.utcnow()
+
+    def stop(self):
+        self._stopped.set()
@@ -6,6 +6,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
 from feast.infra.registry.registry import RegistryConfig
@@ -66,6 +67,14 @@ class AzBlobRegistryStore(RegistryStore):
 
         return
 
+    def get_registry_version(self) -> Optional[str]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        try:
+            return self.blob.get_blob_properties().etag
+        except ResourceNotFoundError:
+            return None
+
     def get_registry_proto(self):
         file_obj = TemporaryFile()
         registry_proto = RegistryProto()
@@ -1,12 +1,17 @@
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from feast.infra.registry.registry_store import RegistryStore
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
 from feast.usage import log_exceptions_and_usage
 
+# Modification times more recent than this don't identify the registry state.
+_MTIME_GRANULARITY_NS = 2 * 10**9
+
 
 class FileRegistryStore(RegistryStore):
     def __init__(self, registry_config: RegistryConfig, repo_path: Path):
@@ -26,6 +31,17 @@ class FileRegistryStore(RegistryStore):
             f'Registry not found at path "{self._filepath}". Have you run "feast apply"?'
         )
 
+    def get_registry_version(self) -> Optional[str]:
+        try:
+            stat = self._filepath.stat()
+        except FileNotFoundError:
+            return None
+        if time.time_ns() - stat.st_mtime_ns < _MTIME_GRANULARITY_NS:
+            # The file may still be modified without changing its modification time, on file systems with a
+            # coarse timestamp granularity.
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     @log_exceptions_and_usage(registry="local")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
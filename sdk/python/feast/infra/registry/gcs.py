@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
 from feast.infra.registry.registry_store import RegistryStore
@@ -49,6 +50,16 @@ class GCSRegistryStore(RegistryStore):
             f'Registry not found at path "{self._uri.geturl()}". Have you run "feast apply"?'
         )
 
+    @log_exceptions_and_usage(registry="gs")
+    def get_registry_version(self) -> Optional[str]:
+        from google.cloud.exceptions import NotFound
+
+        try:
+            blob = self.gcs_client.bucket(self._bucket).get_blob(self._blob)
+        except NotFound:
+            return None
+        return None if blob is None else str(blob.generation)
+
     @log_exceptions_and_usage(registry="gs")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
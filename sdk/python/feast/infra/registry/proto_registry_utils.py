@@ -1,6 +1,6 @@
 import uuid
 from functools import wraps
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from feast import usage
 from feast.data_source import DataSource
@@ -23,27 +23,47 @@ from feast.request_feature_view import RequestFeatureView
 from feast.saved_dataset import SavedDataset, ValidationReference
 from feast.stream_feature_view import StreamFeatureView
 
+# The `clear` functions of every cache created by `registry_proto_cache`.
+_registry_proto_cache_clears: List[Callable[[], None]] = []
+
 
 def registry_proto_cache(func):
-    cache_key = None
-    cache_value = None
+    # The key and value are stored together, so that concurrent readers never observe
+    # a key that belongs to a different value.
+    cache_entry = None
 
     @wraps(func)
     def wrapper(registry_proto: RegistryProto, project: str):
-        nonlocal cache_key, cache_value
+        nonlocal cache_entry
 
         key = tuple([id(registry_proto), registry_proto.version_id, project])
 
-        if key == cache_key:
-            return cache_value
+        entry = cache_entry
+        if entry is not None and entry[0] == key:
+            return entry[1]
         else:
             cache_value = func(registry_proto, project)
-            cache_key = key
+            cache_entry = (key, cache_value)
             return cache_value
 
+    def clear():
+        nonlocal cache_entry
+        cache_entry = None
+
+    _registry_proto_cache_clears.append(clear)
     return wrapper
 
 
+def clear_registry_proto_caches():
+    """
+    Clears the results cached by `registry_proto_cache`. Caches are keyed on the identity and version
+    of the registry proto, so they must be cleared when a registry proto is changed in place without
+    a new version, e.g. by uncommitted changes.
+    """
+    for clear in _registry_proto_cache_clears:
+        clear()
+
+
 def init_project_metadata(cached_registry_proto: RegistryProto, project: str):
     new_project_uuid = f"{uuid.uuid4()}"
     usage.set_current_project_uuid(new_project_uuid)
@@ -63,6 +83,62 @@ def get_project_metadata(
     return None
 
 
+def get_cached_feature_service(
+    registry_proto: RegistryProto, name: str, project: str
+) -> FeatureService:
+    feature_service = _feature_services_by_name(registry_proto, project).get(name)
+    if feature_service is None:
+        raise FeatureServiceNotFoundException(name, project=project)
+    return feature_service
+
+
+def get_cached_feature_view(
+    registry_proto: RegistryProto, name: str, project: str
+) -> FeatureView:
+    feature_view = _feature_views_by_name(registry_proto, project).get(name)
+    if feature_view is None:
+        raise FeatureViewNotFoundException(name, project)
+    return feature_view
+
+
+def get_cached_stream_feature_view(
+    registry_proto: RegistryProto, name: str, project: str
+) -> StreamFeatureView:
+    stream_feature_view = _stream_feature_views_by_name(registry_proto, project).get(
+        name
+    )
+    if stream_feature_view is None:
+        raise FeatureViewNotFoundException(name, project)
+    return stream_feature_view
+
+
+def get_cached_on_demand_feature_view(
+    registry_proto: RegistryProto, name: str, project: str
+) -> OnDemandFeatureView:
+    on_demand_feature_view = _on_demand_feature_views_by_name(
+        registry_proto, project
+    ).get(name)
+    if on_demand_feature_view is None:
+        raise FeatureViewNotFoundException(name, project=project)
+    return on_demand_feature_view
+
+
+def get_cached_data_source(
+    registry_proto: RegistryProto, name: str, project: str
+) -> DataSource:
+    data_source = _data_sources_by_name(registry_proto, project).get(name)
+    if data_source is None:
+        raise DataSourceObjectNotFoundException(name, project=project)
+    return data_source
+
+
+def get_cached_entity(registry_proto: RegistryProto, name: str, project: str) -> Entity:
+    entity = _entities_by_name(registry_proto, project).get(name)
+    if entity is None:
+        raise EntityNotFoundException(name, project=project)
+    return entity
+
+
 def get_feature_service(
     registry_proto: RegistryProto, name: str, project: str
 ) -> FeatureService:
@@ -270,3 +346,65 @@ def list_project_metadata(
         for project_metadata in registry_proto.project_metadata
         if project_metadata.project == project
     ]
+
+
+# The indexes below map object names to the objects returned by the corresponding `list_*` function.
+# Like those functions they are cached per registry proto version, so the `get_cached_*` functions
+# above only decode protos once per refresh. The returned objects are shared between callers.
+
+
+@registry_proto_cache
+def _feature_services_by_name(
+    registry_proto: RegistryProto, project: str
+) -> Dict[str, FeatureService]:
+    return {
+        feature_service.name: feature_service
+        for feature_service in list_feature_services(registry_proto, project)
+    }
+
+
+@registry_proto_cache
+def _feature_views_by_name(
+    registry_proto: RegistryProto, project: str
+) -> Dict[str, FeatureView]:
+    return {
+        feature_view.name: feature_view
+        for feature_view in list_feature_views(registry_proto, project)
+    }
+
+
+@registry_proto_cache
+def _stream_feature_views_by_name(
+    registry_proto: RegistryProto, project: str
+) -> Dict[str, StreamFeatureView]:
+    return {
+        stream_feature_view.name: stream_feature_view
+        for stream_feature_view in list_stream_feature_views(registry_proto, project)
+    }
+
+
+@registry_proto_cache
+def _on_demand_feature_views_by_name(
+    registry_proto: RegistryProto, project: str
+) -> Dict[str, OnDemandFeatureView]:
+    return {
+        on_demand_feature_view.name: on_demand_feature_view
+        for on_demand_feature_view in list_on_demand_feature_views(
+            registry_proto, project
+        )
+    }
+
+
+@registry_proto_cache
+def _data_sources_by_name(
+    registry_proto: RegistryProto, project: str
+) -> Dict[str, DataSource]:
+    return {
+        data_source.name: data_source
+        for data_source in list_data_sources(registry_proto, project)
+    }
+
+
+@registry_proto_cache
+def _entities_by_name(registry_proto: RegistryProto, project: str) -> Dict[str, Entity]:
+    return {entity.name: entity for entity in list_entities(registry_proto, project)}
@@ -161,6 +161,9 @@ class Registry(BaseRegistry):
     cached_registry_proto: Optional[RegistryProto] = None
     cached_registry_proto_created: Optional[datetime] = None
     cached_registry_proto_ttl: timedelta
+    # The registry store version of the cached registry proto, if the registry store provides versions and the
+    # cached registry proto hasn't been modified since it was fetched.
+    cached_registry_store_version: Optional[str] = None
 
     def __new__(
         cls,
@@ -212,6 +215,8 @@ class Registry(BaseRegistry):
                 if registry_config.cache_ttl_seconds is not None
                 else 0
             )
+            if registry_config.cache_mode == "thread":
+                self.start_background_refresh(self.cached_registry_proto_ttl)
 
     def clone(self) -> "Registry":
         new_registry = Registry("project", None, None)
@@ -361,12 +366,18 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_feature_service(
+                registry_proto, name, project
+            )
         return proto_registry_utils.get_feature_service(registry_proto, name, project)
 
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_entity(registry_proto, name, project)
         return proto_registry_utils.get_entity(registry_proto, name, project)
 
     def apply_feature_view(
@@ -449,6 +460,10 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_on_demand_feature_view(
+                registry_proto, name, project
+            )
         return proto_registry_utils.get_on_demand_feature_view(
             registry_proto, name, project
         )
@@ -459,6 +474,10 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_data_source(
+                registry_proto, name, project
+            )
         return proto_registry_utils.get_data_source(registry_proto, name, project)
 
     def apply_materialization(
@@ -548,6 +567,10 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_feature_view(
+                registry_proto, name, project
+            )
         return proto_registry_utils.get_feature_view(registry_proto, name, project)
 
     def get_stream_feature_view(
@@ -556,6 +579,10 @@ class Registry(BaseRegistry):
         registry_proto = self._get_registry_proto(
             project=project, allow_cache=allow_cache
         )
+        if allow_cache:
+            return proto_registry_utils.get_cached_stream_feature_view(
+                registry_proto, name, project
+            )
         return proto_registry_utils.get_stream_feature_view(
             registry_proto, name, project
         )
@@ -760,6 +787,9 @@ class Registry(BaseRegistry):
         )
         return proto_registry_utils.list_project_metadata(registry_proto, project)
 
+    def get_cached_registry_proto(self, project: str) -> Optional[RegistryProto]:
+        return self._get_registry_proto(project=project, allow_cache=True)
+
     def commit(self):
         """Commits the state of the registry cache to the remote registry store."""
         if self.cached_registry_proto:
@@ -807,6 +837,10 @@ class Registry(BaseRegistry):
             )
             self.commit()
 
+        # The cached registry proto is about to be modified, so it no longer matches the registry store version.
+        # It keeps its identity and version id, so the results cached for it are cleared.
+        self.cached_registry_store_version = None
+        proto_registry_utils.clear_registry_proto_caches()
         return self.cached_registry_proto
 
     def _get_registry_proto(
@@ -820,6 +854,17 @@ class Registry(BaseRegistry):
 
         Returns: Returns a RegistryProto object which represents the state of the registry
         """
+        if allow_cache and self._refresh_thread is not None:
+            # The cache is refreshed in the background, so the last registry state is returned without waiting
+            # for a refresh in progress.
+            registry_proto = self.cached_registry_proto
+            if registry_proto is not None and (
+                not project
+                or proto_registry_utils.get_project_metadata(registry_proto, project)
+                is not None
+            ):
+                return registry_proto
+
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -849,7 +894,19 @@ class Registry(BaseRegistry):
                 return self.cached_registry_proto
 
             logger.info("Registry cache expired, so refreshing")
-            registry_proto = self._registry_store.get_registry_proto()
+            registry_store_version = self._registry_store.get_registry_version()
+            if (
+                registry_store_version is not None
+                and registry_store_version == self.cached_registry_store_version
+                and self.cached_registry_proto is not None
+            ):
+                # The registry is unchanged, so the cached registry proto is kept instead of fetching it again,
+                # which also keeps the state derived from it valid.
+                logger.info("Registry unchanged, so keeping the cached registry")
+                registry_proto = self.cached_registry_proto
+            else:
+                registry_proto = self._registry_store.get_registry_proto()
+            self.cached_registry_store_version = registry_store_version
             self.cached_registry_proto = registry_proto
             self.cached_registry_proto_created = datetime.utcnow()
 
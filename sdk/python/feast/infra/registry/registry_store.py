@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 
@@ -19,6 +20,18 @@ class RegistryStore(ABC):
         """
         pass
 
+    def get_registry_version(self) -> Optional[str]:
+        """
+        Retrieves an identifier of the registry state stored at the registry path, such as the modification time
+        of a file or the ETag of an object. The identifier changes whenever the registry is updated, and is much
+        cheaper to retrieve than the registry proto, so that an unchanged registry doesn't need to be fetched.
+
+        Returns:
+            The identifier, or None if the registry store can't provide one or there is no file at the registry
+            path.
+        """
+        return None
+
     @abstractmethod
     def update_registry_proto(self, registry_proto: RegistryProto):
         """
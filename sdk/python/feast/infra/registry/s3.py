@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryFile
+from typing import Optional
 from urllib.parse import urlparse
 
 from feast.errors import S3RegistryBucketForbiddenAccess, S3RegistryBucketNotExist
@@ -64,6 +65,19 @@ class S3RegistryStore(RegistryStore):
                 f"Error while trying to locate Registry at path {self._uri.geturl()}"
             ) from e
 
+    @log_exceptions_and_usage(registry="s3")
+    def get_registry_version(self) -> Optional[str]:
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.s3_client.meta.client.head_object(
+                Bucket=self._bucket, Key=self._key
+            )
+        except ClientError:
+            # Errors are raised by get_registry_proto instead.
+            return None
+        return response["ETag"]
+
     @log_exceptions_and_usage(registry="s3")
     def update_registry_proto(self, registry_proto: RegistryProto):
         self._write_registry(registry_proto)
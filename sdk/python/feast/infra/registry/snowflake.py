@@ -144,6 +144,8 @@ class SnowflakeRegistry(BaseRegistry):
             else 0
         )
         self.project = project
+        if registry_config.cache_mode == "thread":
+            self.start_background_refresh(self.cached_registry_proto_ttl)
 
     def refresh(self, project: Optional[str] = None):
         if project:
@@ -160,6 +162,9 @@ class SnowflakeRegistry(BaseRegistry):
         self.cached_registry_proto_created = datetime.utcnow()
 
     def _refresh_cached_registry_if_necessary(self):
+        if self._refresh_thread is not None:
+            # The cache is refreshed in the background.
+            return
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -430,7 +435,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> DataSource:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_data_source(
+            return proto_registry_utils.get_cached_data_source(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -447,7 +452,7 @@ class SnowflakeRegistry(BaseRegistry):
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_entity(
+            return proto_registry_utils.get_cached_entity(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -466,7 +471,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> FeatureService:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_service(
+            return proto_registry_utils.get_cached_feature_service(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -485,7 +490,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> FeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_view(
+            return proto_registry_utils.get_cached_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -518,7 +523,7 @@ class SnowflakeRegistry(BaseRegistry):
     ) -> OnDemandFeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_on_demand_feature_view(
+            return proto_registry_utils.get_cached_on_demand_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -575,7 +580,7 @@ class SnowflakeRegistry(BaseRegistry):
     ):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_stream_feature_view(
+            return proto_registry_utils.get_cached_stream_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -1096,5 +1101,9 @@ class SnowflakeRegistry(BaseRegistry):
                 """
                 execute_snowflake_statement(conn, query)
 
+    def get_cached_registry_proto(self, project: str) -> Optional[RegistryProto]:
+        self._refresh_cached_registry_if_necessary()
+        return self.cached_registry_proto
+
     def commit(self):
         pass
@@ -1,10 +1,12 @@
+import hashlib
 import logging
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from pydantic import StrictStr
 from sqlalchemy import (  # type: ignore
@@ -181,6 +183,101 @@ feast_metadata = Table(
 
 logger = logging.getLogger(__name__)
 
+# The tables of registry objects, with their name and proto columns, their proto and Python classes, and
+# the registry proto field that holds them.
+_OBJECT_TABLES: List[Tuple[Table, str, str, Any, Any, str]] = [
+    (entities, "entity_name", "entity_proto", EntityProto, Entity, "entities"),
+    (
+        data_sources,
+        "data_source_name",
+        "data_source_proto",
+        DataSourceProto,
+        DataSource,
+        "data_sources",
+    ),
+    (
+        feature_views,
+        "feature_view_name",
+        "feature_view_proto",
+        FeatureViewProto,
+        FeatureView,
+        "feature_views",
+    ),
+    (
+        on_demand_feature_views,
+        "feature_view_name",
+        "feature_view_proto",
+        OnDemandFeatureViewProto,
+        OnDemandFeatureView,
+        "on_demand_feature_views",
+    ),
+    (
+        request_feature_views,
+        "feature_view_name",
+        "feature_view_proto",
+        RequestFeatureViewProto,
+        RequestFeatureView,
+        "request_feature_views",
+    ),
+    (
+        stream_feature_views,
+        "feature_view_name",
+        "feature_view_proto",
+        StreamFeatureViewProto,
+        StreamFeatureView,
+        "stream_feature_views",
+    ),
+    (
+        feature_services,
+        "feature_service_name",
+        "feature_service_proto",
+        FeatureServiceProto,
+        FeatureService,
+        "feature_services",
+    ),
+    (
+        saved_datasets,
+        "saved_dataset_name",
+        "saved_dataset_proto",
+        SavedDatasetProto,
+        SavedDataset,
+        "saved_datasets",
+    ),
+    (
+        validation_references,
+        "validation_reference_name",
+        "validation_reference_proto",
+        ValidationReferenceProto,
+        ValidationReference,
+        "validation_references",
+    ),
+]
+
+# The tables whose projects are included in the registry proto.
+_PROJECT_TABLES = {
+    entities,
+    data_sources,
+    feature_views,
+    request_feature_views,
+    on_demand_feature_views,
+    stream_feature_views,
+}
+
+
+@dataclass
+class _RegistrySnapshot:
+    """The rows that a cached registry proto was built from."""
+
+    registry_proto: RegistryProto
+    # The last updated timestamp and the digest of the proto of every object, by table and (project, name).
+    object_rows: Dict[str, Dict[Tuple[str, str], Tuple[int, bytes]]] = field(
+        default_factory=dict
+    )
+    # The latest last updated timestamp of every table.
+    watermarks: Dict[str, int] = field(default_factory=dict)
+    metadata_rows: List[Tuple[str, str, str, int]] = field(default_factory=list)
+    infra_proto: Optional[bytes] = None
+
 
 class SqlRegistryConfig(RegistryConfig):
     registry_type: StrictStr = "sql"
@@ -201,7 +298,8 @@ class SqlRegistry(BaseRegistry):
         assert registry_config is not None, "SqlRegistry needs a valid registry_config"
         self.engine: Engine = create_engine(registry_config.path, echo=False)
         metadata.create_all(self.engine)
-        self.cached_registry_proto = self.proto()
+        self._cached_registry_snapshot: Optional[_RegistrySnapshot] = None
+        self.cached_registry_proto = self._get_updated_registry_proto()
         proto_registry_utils.init_project_metadata(self.cached_registry_proto, project)
         self.cached_registry_proto_created = datetime.utcnow()
         self._refresh_lock = Lock()
@@ -211,6 +309,8 @@ class SqlRegistry(BaseRegistry):
             else 0
         )
         self.project = project
+        if registry_config.cache_mode == "thread":
+            self.start_background_refresh(self.cached_registry_proto_ttl)
 
     def teardown(self):
         for t in {
@@ -238,10 +338,13 @@ class SqlRegistry(BaseRegistry):
                 proto_registry_utils.init_project_metadata(
                     self.cached_registry_proto, project
                 )
-        self.cached_registry_proto = self.proto()
+        self.cached_registry_proto = self._get_updated_registry_proto()
         self.cached_registry_proto_created = datetime.utcnow()
 
     def _refresh_cached_registry_if_necessary(self):
+        if self._refresh_thread is not None:
+            # The cache is refreshed in the background.
+            return
         with self._refresh_lock:
             expired = (
                 self.cached_registry_proto is None
@@ -267,7 +370,7 @@ class SqlRegistry(BaseRegistry):
     ):
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_stream_feature_view(
+            return proto_registry_utils.get_cached_stream_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -309,7 +412,7 @@ class SqlRegistry(BaseRegistry):
     def get_entity(self, name: str, project: str, allow_cache: bool = False) -> Entity:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_entity(
+            return proto_registry_utils.get_cached_entity(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -328,7 +431,7 @@ class SqlRegistry(BaseRegistry):
     ) -> FeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_view(
+            return proto_registry_utils.get_cached_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -347,7 +450,7 @@ class SqlRegistry(BaseRegistry):
     ) -> OnDemandFeatureView:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_on_demand_feature_view(
+            return proto_registry_utils.get_cached_on_demand_feature_view(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -385,7 +488,7 @@ class SqlRegistry(BaseRegistry):
     ) -> FeatureService:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_feature_service(
+            return proto_registry_utils.get_cached_feature_service(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -496,7 +599,7 @@ class SqlRegistry(BaseRegistry):
     ) -> DataSource:
         if allow_cache:
             self._refresh_cached_registry_if_necessary()
-            return proto_registry_utils.get_data_source(
+            return proto_registry_utils.get_cached_data_source(
                 self.cached_registry_proto, name, project
             )
         return self._get_object(
@@ -830,7 +933,7 @@ class SqlRegistry(BaseRegistry):
         r = RegistryProto()
         last_updated_timestamps = []
         projects = self._get_all_projects()
-        for project in projects:
+        for project in sorted(projects):
             for lister, registry_proto_field in [
                 (self.list_entities, r.entities),
                 (self.list_feature_views, r.feature_views),
@@ -863,6 +966,206 @@ class SqlRegistry(BaseRegistry):
 
         return r
 
+    def _get_updated_registry_proto(self) -> RegistryProto:
+        """
+        Returns the same registry proto as `proto`, by patching the cached registry proto with the objects
+        that were added, updated or deleted since it was built. Only the keys and last updated timestamps of
+        unchanged objects are read, and the cached registry proto itself is returned if nothing changed.
+        """
+        snapshot = self._cached_registry_snapshot
+        if (
+            snapshot is None
+            or snapshot.registry_proto is not self.cached_registry_proto
+        ):
+            snapshot = _RegistrySnapshot(registry_proto=RegistryProto())
+
+        with self.engine.connect() as conn:
+            object_timestamps: Dict[str, Dict[Tuple[str, str], int]] = {}
+            for table, id_field_name, _, _, _, _ in _OBJECT_TABLES:
+                stmt = select(
+                    table.c.project_id,
+                    getattr(table.c, id_field_name),
+                    table.c.last_updated_timestamp,
+                )
+                object_timestamps[table.name] = {
+                    (project, name): int(last_updated_timestamp)
+                    for project, name, last_updated_timestamp in conn.execute(stmt)
+                }
+            projects = sorted(
+                {
+                    project
+                    for table in _PROJECT_TABLES
+                    for project, _ in object_timestamps[table.name]
+                }
+            )
+
+            new_snapshot = _RegistrySnapshot(registry_proto=snapshot.registry_proto)
+            updated_objects: Dict[str, Dict[Tuple[str, str], Any]] = {}
+            deleted_objects: Dict[str, Set[Tuple[str, str]]] = {}
+            for (
+                table,
+                id_field_name,
+                proto_field_name,
+                proto_class,
+                python_class,
+                registry_proto_field,
+            ) in _OBJECT_TABLES:
+                timestamps = {
+                    key: last_updated_timestamp
+                    for key, last_updated_timestamp in object_timestamps[
+                        table.name
+                    ].items()
+                    if key[0] in projects
+                }
+                old_rows = snapshot.object_rows.get(table.name, {})
+                watermark = snapshot.watermarks.get(table.name)
+                rows = {
+                    key: old_rows[key] for key in timestamps.keys() & old_rows.keys()
+                }
+                deleted_objects[registry_proto_field] = old_rows.keys() - rows.keys()
+                # Timestamps have a granularity of seconds, so objects updated in the same second as the
+                # latest update seen before may have been updated again without a new timestamp.
+                candidates = {
+                    key
+                    for key, last_updated_timestamp in timestamps.items()
+                    if key not in rows
+                    or rows[key][0] != last_updated_timestamp
+                    or (watermark is not None and last_updated_timestamp >= watermark)
+                }
+                updated_objects[registry_proto_field] = {}
+                if candidates:
+                    stmt = select(
+                        table.c.project_id,
+                        getattr(table.c, id_field_name),
+                        table.c.last_updated_timestamp,
+                        getattr(table.c, proto_field_name),
+                    ).where(
+                        table.c.last_updated_timestamp
+                        >= min(timestamps[key] for key in candidates)
+                    )
+                    for (
+                        project,
+                        name,
+                        last_updated_timestamp,
+                        obj_bytes,
+                    ) in conn.execute(stmt):
+                        key = (project, name)
+                        if key not in candidates:
+                            continue
+                        digest = hashlib.blake2b(obj_bytes, digest_size=16).digest()
+                        if key in rows and rows[key][1] == digest:
+                            rows[key] = (int(last_updated_timestamp), digest)
+                            continue
+                        rows[key] = (int(last_updated_timestamp), digest)
+                        obj_proto = python_class.from_proto(
+                            proto_class.FromString(obj_bytes)
+                        ).to_proto()
+                        if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
+                            obj_proto.spec.project = project
+                        else:
+                            obj_proto.project = project
+                        updated_objects[registry_proto_field][key] = obj_proto
+                new_snapshot.object_rows[table.name] = rows
+                if timestamps:
+                    new_snapshot.watermarks[table.name] = max(timestamps.values())
+
+            stmt = select(
+                feast_metadata.c.project_id,
+                feast_metadata.c.metadata_key,
+                feast_metadata.c.metadata_value,
+                feast_metadata.c.last_updated_timestamp,
+            ).where(feast_metadata.c.project_id.in_(projects))
+            metadata_rows = sorted(tuple(row) for row in conn.execute(stmt))
+            projects_with_uuid = {
+                project
+                for project, metadata_key, _, _ in metadata_rows
+                if metadata_key == FeastMetadataKeys.PROJECT_UUID.value
+            }
+            if projects_with_uuid != set(projects):
+                for project in projects:
+                    if project not in projects_with_uuid:
+                        self._maybe_init_project_metadata(project)
+                metadata_rows = sorted(tuple(row) for row in conn.execute(stmt))
+            new_snapshot.metadata_rows = metadata_rows
+
+            if projects:
+                # Like `proto`, the infra of the last project is used.
+                stmt = select(managed_infra.c.infra_proto).where(
+                    managed_infra.c.infra_name == "infra_obj",
+                    managed_infra.c.project_id == projects[-1],
+                )
+                row = conn.execute(stmt).first()
+                new_snapshot.infra_proto = row[0] if row else None
+
+        if (
+            not any(updated_objects.values())
+            and not any(deleted_objects.values())
+            and new_snapshot.metadata_rows == snapshot.metadata_rows
+            and new_snapshot.infra_proto == snapshot.infra_proto
+        ):
+            self._cached_registry_snapshot = new_snapshot
+            return snapshot.registry_proto
+
+        r = RegistryProto()
+        r.CopyFrom(snapshot.registry_proto)
+        for registry_proto_field, updated in updated_objects.items():
+            deleted = deleted_objects[registry_proto_field]
+            if not updated and not deleted:
+                continue
+            obj_protos = getattr(r, registry_proto_field)
+            kept = [
+                obj_proto
+                for obj_proto in obj_protos
+                if _get_object_key(obj_proto) not in deleted
+                and _get_object_key(obj_proto) not in updated
+            ]
+            del obj_protos[:]
+            obj_protos.extend(kept)
+            obj_protos.extend(updated.values())
+
+        del r.project_metadata[:]
+        last_updated_timestamps = []
+        project_uuids = {}
+        for (
+            project,
+            metadata_key,
+            value,
+            last_updated_timestamp,
+        ) in new_snapshot.metadata_rows:
+            if metadata_key == FeastMetadataKeys.PROJECT_UUID.value:
+                project_uuids[project] = value
+            elif metadata_key == FeastMetadataKeys.LAST_UPDATED_TIMESTAMP.value:
+                last_updated_timestamps.append(last_updated_timestamp)
+        for project in projects:
+            r.project_metadata.append(
+                ProjectMetadata(
+                    project_name=project, project_uuid=project_uuids[project]
+                ).to_proto()
+            )
+
+        r.ClearField("infra")
+        if projects:
+            infra = (
+                Infra.from_proto(InfraProto.FromString(new_snapshot.infra_proto))
+                if new_snapshot.infra_proto
+                else Infra()
+            )
+            r.infra.CopyFrom(infra.to_proto())
+
+        r.ClearField("last_updated")
+        if last_updated_timestamps:
+            r.last_updated.FromDatetime(
+                datetime.utcfromtimestamp(max(last_updated_timestamps))
+            )
+
+        new_snapshot.registry_proto = r
+        self._cached_registry_snapshot = new_snapshot
+        return r
+
+    def get_cached_registry_proto(self, project: str) -> Optional[RegistryProto]:
+        self._refresh_cached_registry_if_necessary()
+        return self.cached_registry_proto
+
     def commit(self):
         # This method is a no-op since we're always writing values eagerly to the db.
         pass
@@ -898,7 +1201,10 @@ class SqlRegistry(BaseRegistry):
                 }
                 update_stmt = (
                     update(table)
-                    .where(getattr(table.c, id_field_name) == name)
+                    .where(
+                        getattr(table.c, id_field_name) == name,
+                        table.c.project_id == project,
+                    )
                     .values(
                         values,
                     )
@@ -1066,17 +1372,15 @@ class SqlRegistry(BaseRegistry):
     def _get_all_projects(self) -> Set[str]:
         projects = set()
         with self.engine.connect() as conn:
-            for table in {
-                entities,
-                data_sources,
-                feature_views,
-                request_feature_views,
-                on_demand_feature_views,
-                stream_feature_views,
-            }:
-                stmt = select(table)
-                rows = conn.execute(stmt).all()
-                for row in rows:
-                    projects.add(row["project_id"])
+            for table in _PROJECT_TABLES:
+                stmt = select(table.c.project_id).distinct()
+                for (project,) in conn.execute(stmt):
+                    projects.add(project)
 
         return projects
+
+
+def _get_object_key(obj_proto: Any) -> Tuple[str, str]:
+    if "spec" in obj_proto.DESCRIPTOR.fields_by_name:
+        return obj_proto.spec.project, obj_proto.spec.name
+    return obj_proto.project, obj_proto.name
@@ -1,8 +1,11 @@
-from typing import Dict
+import asyncio
+import contextlib
+from typing import AsyncIterator, Dict, List
 
 import numpy as np
 import pandas as pd
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
 import pyarrow as pa
 from psycopg2.pool import SimpleConnectionPool
@@ -45,6 +48,95 @@ def _get_connection_pool(config: PostgreSQLConfig):
     )
 
 
+async def _get_async_conn(config: PostgreSQLConfig):
+    """
+    Opens an asynchronous connection, whose queries don't block the event loop. Asynchronous connections
+    are always in autocommit mode.
+    """
+    conn = psycopg2.connect(
+        dbname=config.database,
+        host=config.host,
+        port=int(config.port),
+        user=config.user,
+        password=config.password,
+        sslmode=config.sslmode,
+        sslkey=config.sslkey_path,
+        sslcert=config.sslcert_path,
+        sslrootcert=config.sslrootcert_path,
+        options="-c search_path={}".format(config.db_schema or config.user),
+        keepalives_idle=config.keepalives_idle,
+        async_=True,
+    )
+    await wait_async(conn)
+    return conn
+
+
+async def wait_async(conn):
+    """
+    Waits until the pending operation of an asynchronous connection, such as connecting or executing a
+    query, is complete.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        state = conn.poll()
+        if state == psycopg2.extensions.POLL_OK:
+            return
+        ready = loop.create_future()
+        fileno = conn.fileno()
+        if state == psycopg2.extensions.POLL_READ:
+            loop.add_reader(fileno, _set_ready, ready)
+            remove = loop.remove_reader
+        elif state == psycopg2.extensions.POLL_WRITE:
+            loop.add_writer(fileno, _set_ready, ready)
+            remove = loop.remove_writer
+        else:
+            raise psycopg2.OperationalError(f"Unexpected poll state: {state}")
+        try:
+            await ready
+        finally:
+            remove(fileno)
+
+
+def _set_ready(ready: "asyncio.Future[None]"):
+    if not ready.done():
+        ready.set_result(None)
+
+
+class AsyncConnectionPool:
+    """
+    A pool of asynchronous connections, which opens at most `max_conn` connections. It must be created in
+    a coroutine, and only be used from the event loop running it, which is available as `loop`.
+    """
+
+    def __init__(self, config: PostgreSQLConfig):
+        self._config = config
+        self._idle_conns: List = []
+        self._semaphore = asyncio.Semaphore(config.max_conn)
+        self.loop = asyncio.get_running_loop()
+
+    def close(self):
+        """Closes the idle connections of the pool."""
+        while self._idle_conns:
+            self._idle_conns.pop().close()
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator:
+        async with self._semaphore:
+            conn = (
+                self._idle_conns.pop()
+                if self._idle_conns
+                else await _get_async_conn(self._config)
+            )
+            try:
+                yield conn
+            except BaseException:
+                # The connection may be in the middle of a query.
+                conn.close()
+                raise
+            if not conn.closed:
+                self._idle_conns.append(conn)
+
+
 def _df_to_create_table_sql(entity_df, table_name) -> str:
     pa_table = pa.Table.from_pandas(entity_df)
     columns = [
@@ -14,7 +14,9 @@
 
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from feast.feature_view import DUMMY_ENTITY_ID
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
@@ -77,3 +79,67 @@ class OnlineResponse:
         """
 
         return pd.DataFrame(self.to_dict(include_event_timestamps))
+
+
+class ColumnarOnlineResponse:
+    """
+    Defines an online response in feast whose features are held as columns instead of protos.
+
+    Attributes:
+        feature_names: The names of the returned features, in response order.
+        values: The values of each feature, as an Arrow array with one element per entity row.
+        statuses: The `FieldStatus` of each feature, as a NumPy array with one element per entity row.
+        event_timestamps: The event timestamps of each feature in seconds since the epoch, as a NumPy array
+            with one element per entity row. Features of the same feature view share the same array.
+    """
+
+    feature_names: List[str]
+    values: Dict[str, pa.Array]
+    statuses: Dict[str, np.ndarray]
+    event_timestamps: Dict[str, np.ndarray]
+
+    def __init__(
+        self,
+        feature_names: List[str],
+        values: Dict[str, pa.Array],
+        statuses: Dict[str, np.ndarray],
+        event_timestamps: Dict[str, np.ndarray],
+    ):
+        self.feature_names = feature_names
+        self.values = values
+        self.statuses = statuses
+        self.event_timestamps = event_timestamps
+
+    def to_arrow(self, include_event_timestamps: bool = False) -> pa.Table:
+        """
+        Converts the features into an Arrow table. The feature arrays are not copied.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps in the table
+        """
+        columns: Dict[str, Any] = {}
+        for feature_name in self.feature_names:
+            columns[feature_name] = self.values[feature_name]
+            if include_event_timestamps:
+                columns[feature_name + TIMESTAMP_POSTFIX] = self.event_timestamps[
+                    feature_name
+                ]
+        return pa.table(columns)
+
+    def to_dict(self, include_event_timestamps: bool = False) -> Dict[str, Any]:
+        """
+        Converts the features into a dictionary form.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps in the dictionary
+        """
+        return self.to_arrow(include_event_timestamps).to_pydict()
+
+    def to_df(self, include_event_timestamps: bool = False) -> pd.DataFrame:
+        """
+        Converts the features into Panda dataframe form.
+
+        Args:
+        include_event_timestamps: bool Optionally include feature timestamps in the dataframe
+        """
+        return self.to_arrow(include_event_timestamps).to_pandas()
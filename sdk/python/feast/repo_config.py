@@ -15,7 +15,7 @@ from pydantic import (
     validator,
 )
 from pydantic.error_wrappers import ErrorWrapper
-from pydantic.typing import Dict, Optional
+from pydantic.typing import Dict, Literal, Optional
 
 from feast.errors import (
     FeastFeatureServerTypeInvalidError,
@@ -126,6 +126,12 @@ class RegistryConfig(FeastBaseModel):
      set to infinity by setting TTL to 0 seconds, which means the cache will only be loaded once and will never
      expire. Users can manually refresh the cache by calling feature_store.refresh_registry() """
 
+    cache_mode: Literal["sync", "thread"] = "sync"
+    """str: How the registry cache is refreshed. In "sync" mode, the lookup that finds that the cache has expired
+     refreshes it while other lookups wait. In "thread" mode, a background thread refreshes the cache every
+     cache_ttl_seconds, and lookups return the last successfully refreshed registry state without waiting.
+     The "thread" mode is intended for processes that only read from the registry, such as feature servers. """
+
     s3_additional_kwargs: Optional[Dict[str, str]]
     """ Dict[str, str]: Extra arguments to pass to boto3 when writing the registry file to S3. """
 
@@ -181,6 +187,10 @@ class RepoConfig(FeastBaseModel):
     coerce_tz_aware: Optional[bool] = True
     """ If True, coerces entity_df timestamp columns to be timezone aware (to UTC by default). """
 
+    online_read_concurrency: StrictInt = 1
+    """ The maximum number of feature views that a single online feature retrieval reads from the online store
+    concurrently. A value of 1 (the default) reads the feature views one after another. """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -300,7 +310,7 @@ class RepoConfig(FeastBaseModel):
                     self._batch_engine_config
                 )()
             elif self._batch_engine_config:
-                self._batch_engine = self._batch_engine
+                self._batch_engine = self._batch_engine_config
 
         return self._batch_engine
 
@@ -462,6 +462,160 @@ def python_values_to_proto_values(
     return _python_value_to_proto_value(value_type, values)
 
 
+def pa_array_to_proto_values(
+    array: Union["pyarrow.Array", "pyarrow.ChunkedArray"], feature_type: ValueType
+) -> List[ProtoValue]:
+    """
+    Converts an Arrow array holding a single feature into Value protos, one per element.
+
+    Arrays whose Arrow type matches `feature_type` are read with a single `to_pylist()` call and
+    wrapped into protos without further per-value type checks; nulls, and NaNs in floating point
+    arrays, become empty protos. Any other array goes through `python_values_to_proto_values`.
+
+    Args:
+        array: The values of the feature.
+        feature_type: The value type of the feature.
+
+    Returns:
+        A list of Value protos with one element per value of the array.
+    """
+    import pyarrow
+
+    if isinstance(array, pyarrow.ChunkedArray):
+        array = array.combine_chunks()
+    pa_type = array.type
+    if pyarrow.types.is_null(pa_type):
+        # Arrays without any value, e.g. from columns of Nones, are empty protos like in
+        # `python_values_to_proto_values`.
+        return [ProtoValue() for _ in range(len(array))]
+
+    if feature_type == ValueType.UNIX_TIMESTAMP and pyarrow.types.is_timestamp(pa_type):
+        # NumPy rounds down to whole seconds, also before 1970, and keeps NaT as the null value.
+        int_timestamps = (
+            array.cast(pyarrow.int64())
+            .fill_null(int(NULL_TIMESTAMP_INT_VALUE))
+            .to_numpy()
+            .view(f"datetime64[{pa_type.unit}]")
+            .astype("datetime64[s]")
+            .astype(np.int64)
+            .tolist()
+        )
+        return [ProtoValue(unix_timestamp_val=ts) for ts in int_timestamps]
+
+    if feature_type in PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE and _pa_type_matches(
+        pa_type, feature_type
+    ):
+        field_name = PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE[feature_type][0]
+        # NaN is the only value that isn't equal to itself.
+        return [
+            ProtoValue(**{field_name: value})
+            if value is not None and value == value
+            else ProtoValue()
+            for value in array.to_pylist()
+        ]
+
+    if (
+        feature_type in PYTHON_LIST_VALUE_TYPE_TO_PROTO_VALUE
+        and feature_type != ValueType.UNIX_TIMESTAMP_LIST
+        and (pyarrow.types.is_list(pa_type) or pyarrow.types.is_large_list(pa_type))
+        and _pa_type_matches(pa_type.value_type, feature_type.name[: -len("_LIST")])
+        and array.flatten().null_count == 0
+    ):
+        proto_type, field_name, _ = PYTHON_LIST_VALUE_TYPE_TO_PROTO_VALUE[feature_type]
+        return [
+            ProtoValue(**{field_name: proto_type(val=value)})  # type: ignore
+            if value is not None
+            else ProtoValue()
+            for value in array.to_pylist()
+        ]
+
+    return python_values_to_proto_values(
+        array.to_numpy(zero_copy_only=False), feature_type
+    )
+
+
+def _pa_type_matches(
+    pa_type: "pyarrow.DataType", feature_type: Union[ValueType, str]
+) -> bool:
+    """Returns whether values of `pa_type` can be stored as `feature_type` without any conversion."""
+    import pyarrow
+
+    feature_type_name = (
+        feature_type.name if isinstance(feature_type, ValueType) else feature_type
+    )
+    if feature_type_name in ("INT32", "INT64"):
+        return pyarrow.types.is_integer(pa_type)
+    if feature_type_name in ("FLOAT", "DOUBLE"):
+        return pyarrow.types.is_floating(pa_type)
+    if feature_type_name == "STRING":
+        return pyarrow.types.is_string(pa_type) or pyarrow.types.is_large_string(
+            pa_type
+        )
+    if feature_type_name == "BYTES":
+        return pyarrow.types.is_binary(pa_type) or pyarrow.types.is_large_binary(
+            pa_type
+        )
+    if feature_type_name == "BOOL":
+        return pyarrow.types.is_boolean(pa_type)
+    return False
+
+
+def proto_values_to_pa_array(
+    proto_values: Sequence[Optional[ProtoValue]], feature_type: ValueType
+) -> "pyarrow.Array":
+    """
+    Converts the Value protos of a single feature into an Arrow array. Missing values (None or unset
+    protos) become nulls.
+
+    Scalar values stored in the proto field that belongs to `feature_type` are read directly from that
+    field; any other value goes through `feast_value_type_to_python_type`.
+
+    Args:
+        proto_values: The Value protos of the feature, one per row.
+        feature_type: The value type of the feature.
+
+    Returns:
+        An Arrow array with one element per row.
+    """
+    import pyarrow
+
+    if feature_type == ValueType.UNIX_TIMESTAMP:
+        timestamps = [
+            None
+            if v is None
+            or v.WhichOneof("val") != "unix_timestamp_val"
+            or v.unix_timestamp_val == NULL_TIMESTAMP_INT_VALUE
+            else v.unix_timestamp_val
+            for v in proto_values
+        ]
+        return pyarrow.array(timestamps, type=pyarrow.int64()).cast(
+            pyarrow.timestamp("s", tz="UTC")
+        )
+
+    if feature_type in PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE:
+        field_name = PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE[feature_type][0]
+        values: List[Any] = []
+        for v in proto_values:
+            if v is None:
+                values.append(None)
+            elif v.WhichOneof("val") == field_name:
+                values.append(getattr(v, field_name))
+            else:
+                values.append(feast_value_type_to_python_type(v))
+        return pyarrow.array(values, type=feast_value_type_to_pa(feature_type))
+
+    values = [
+        None if v is None else feast_value_type_to_python_type(v) for v in proto_values
+    ]
+    if feature_type in (ValueType.UNKNOWN, ValueType.NULL):
+        return pyarrow.array(values)
+    if feature_type == ValueType.UNIX_TIMESTAMP_LIST:
+        return pyarrow.array(
+            values, type=pyarrow.list_(pyarrow.timestamp("us", tz="UTC"))
+        )
+    return pyarrow.array(values, type=feast_value_type_to_pa(feature_type))
+
+
 def _proto_value_to_value_type(proto_value: ProtoValue) -> ValueType:
     """
     Returns Feast ValueType given Feast ValueType string.
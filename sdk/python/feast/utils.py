@@ -3,7 +3,7 @@ import typing
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import pandas as pd
 import pyarrow
@@ -15,13 +15,15 @@ from feast.constants import FEAST_FS_YAML_FILE_PATH_ENV_NAME
 from feast.entity import Entity
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
-from feast.type_map import python_values_to_proto_values
+from feast.type_map import NULL_TIMESTAMP_INT_VALUE, pa_array_to_proto_values
 from feast.value_type import ValueType
 
 if typing.TYPE_CHECKING:
     from feast.feature_view import FeatureView
     from feast.on_demand_feature_view import OnDemandFeatureView
 
+_ArrowTableOrBatch = TypeVar("_ArrowTableOrBatch", pyarrow.Table, pyarrow.RecordBatch)
+
 
 def make_tzaware(t: datetime) -> datetime:
     """We assume tz-naive datetimes are UTC"""
@@ -162,14 +164,16 @@ def _get_column_names(
 
 
 def _run_pyarrow_field_mapping(
-    table: pyarrow.Table,
+    table: _ArrowTableOrBatch,
     field_mapping: Dict[str, str],
-) -> pyarrow.Table:
+) -> _ArrowTableOrBatch:
     # run field mapping in the forward direction
-    cols = table.column_names
+    cols = table.schema.names
     mapped_cols = [
         field_mapping[col] if col in field_mapping.keys() else col for col in cols
     ]
+    if isinstance(table, pyarrow.RecordBatch):
+        return pyarrow.RecordBatch.from_arrays(table.columns, names=mapped_cols)
     table = table.rename_columns(mapped_cols)
     return table
 
@@ -201,6 +205,28 @@ def _coerce_datetime(ts):
         return ts
 
 
+def _arrow_to_datetimes(array: pyarrow.Array) -> List[datetime]:
+    """
+    Converts an Arrow array of timestamps into naive UTC datetimes with microsecond resolution.
+    Timestamp arrays are converted by NumPy, which rounds down to whole microseconds like pandas;
+    nulls become NaT. Anything else goes through pandas.
+    """
+    if pyarrow.types.is_timestamp(array.type):
+        datetimes = (
+            array.cast(pyarrow.int64())
+            .fill_null(int(NULL_TIMESTAMP_INT_VALUE))
+            .to_numpy()
+            .view(f"datetime64[{array.type.unit}]")
+            .astype("datetime64[us]")
+            .tolist()
+        )
+        return [pd.NaT if ts is None else ts for ts in datetimes]
+    return [
+        _coerce_datetime(val)
+        for val in pd.to_datetime(array.to_numpy(zero_copy_only=False))
+    ]
+
+
 def _convert_arrow_to_proto(
     table: Union[pyarrow.Table, pyarrow.RecordBatch],
     feature_view: "FeatureView",
@@ -215,18 +241,14 @@ def _convert_arrow_to_proto(
     ] + list(join_keys.items())
 
     proto_values_by_column = {
-        column: python_values_to_proto_values(
-            table.column(column).to_numpy(zero_copy_only=False), value_type
-        )
+        column: pa_array_to_proto_values(table.column(column), value_type)
         for column, value_type in columns
     }
 
+    join_key_names = list(join_keys)
     entity_keys = [
-        EntityKeyProto(
-            join_keys=join_keys,
-            entity_values=[proto_values_by_column[k][idx] for k in join_keys],
-        )
-        for idx in range(table.num_rows)
+        EntityKeyProto(join_keys=join_key_names, entity_values=entity_values)
+        for entity_values in zip(*(proto_values_by_column[k] for k in join_key_names))
     ]
 
     # Serialize the features per row
@@ -237,25 +259,16 @@ def _convert_arrow_to_proto(
     features = [dict(zip(feature_dict, vars)) for vars in zip(*feature_dict.values())]
 
     # Convert event_timestamps
-    event_timestamps = [
-        _coerce_datetime(val)
-        for val in pd.to_datetime(
-            table.column(feature_view.batch_source.timestamp_field).to_numpy(
-                zero_copy_only=False
-            )
-        )
-    ]
+    event_timestamps = _arrow_to_datetimes(
+        table.column(feature_view.batch_source.timestamp_field)
+    )
 
     # Convert created_timestamps if they exist
+    created_timestamps: Sequence[Optional[datetime]]
     if feature_view.batch_source.created_timestamp_column:
-        created_timestamps = [
-            _coerce_datetime(val)
-            for val in pd.to_datetime(
-                table.column(
-                    feature_view.batch_source.created_timestamp_column
-                ).to_numpy(zero_copy_only=False)
-            )
-        ]
+        created_timestamps = _arrow_to_datetimes(
+            table.column(feature_view.batch_source.created_timestamp_column)
+        )
     else:
         created_timestamps = [None] * table.num_rows
 
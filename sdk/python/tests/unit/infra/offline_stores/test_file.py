@@ -0,0 +1,370 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import dask.dataframe as dd
+import pandas as pd
+import pyarrow
+import pytest
+from pytz import utc
+
+from feast import Entity, FeatureView, Field
+from feast.feature_view import DUMMY_ENTITY_ID
+from feast.infra.offline_stores.file import (
+    FileOfflineStore,
+    FileOfflineStoreConfig,
+    _read_datasource,
+    compact_file_source,
+)
+from feast.infra.offline_stores.file_source import FileSource
+from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
+from feast.repo_config import RepoConfig
+from feast.types import Float64, Int64
+
+
+@pytest.fixture
+def repo_config():
+    return RepoConfig(
+        registry="registry.db",
+        project="test",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(type="sqlite"),
+        offline_store=FileOfflineStoreConfig(type="file"),
+        entity_key_serialization_version=2,
+    )
+
+
+@pytest.fixture(params=[None, "US/Pacific", timezone(timedelta(hours=2))])
+def file_source(request, tmp_path):
+    start = datetime(2023, 1, 1)
+    num_rows = 1000
+    df = pd.DataFrame(
+        {
+            "driver_id": [i % 37 for i in range(num_rows)],
+            "rating": [float(i) for i in range(num_rows)],
+            # Several rows of each driver share the same event timestamp.
+            "event_timestamp": [
+                start + timedelta(hours=(i * 7) % 50) for i in range(num_rows)
+            ],
+            "created": [start + timedelta(minutes=i % 13) for i in range(num_rows)],
+        }
+    )
+    if request.param:
+        df["event_timestamp"] = (
+            df["event_timestamp"].dt.tz_localize(utc).dt.tz_convert(request.param)
+        )
+    path = str(tmp_path / "driver_stats.parquet")
+    # Small row groups, so that the result is streamed in several batches.
+    df.to_parquet(path, row_group_size=100)
+    return FileSource(
+        path=path,
+        timestamp_field="event_timestamp",
+        created_timestamp_column="created",
+    )
+
+
+def _sorted_df(table: pyarrow.Table, columns) -> pd.DataFrame:
+    return table.select(columns).to_pandas().sort_values(columns).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("join_key_columns", [["driver_id"], []])
+def test_pull_latest_to_arrow_batches(repo_config, file_source, join_key_columns):
+    job = FileOfflineStore.pull_latest_from_table_or_query(
+        config=repo_config,
+        data_source=file_source,
+        join_key_columns=join_key_columns,
+        feature_name_columns=["rating"],
+        timestamp_field="event_timestamp",
+        created_timestamp_column="created",
+        start_date=datetime(2023, 1, 1, 5, tzinfo=utc),
+        end_date=datetime(2023, 1, 2, 12, tzinfo=utc),
+    )
+
+    batches = list(job.to_arrow_batches(batch_size=30))
+    assert len(batches) > 1
+    assert all(batch.num_rows <= 30 for batch in batches)
+
+    columns = join_key_columns + ["rating", "event_timestamp", "created"]
+    if not join_key_columns:
+        columns.append(DUMMY_ENTITY_ID)
+    expected = _sorted_df(job.to_arrow(), columns)
+    actual = _sorted_df(pyarrow.Table.from_batches(batches), columns)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_read_datasource_pushdown(file_source, monkeypatch):
+    read_parquet_calls = []
+    read_parquet = dd.read_parquet
+
+    def counting_read_parquet(*args, **kwargs):
+        read_parquet_calls.append(kwargs)
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", counting_read_parquet)
+    source_df = _read_datasource(
+        file_source,
+        columns=["driver_id", "event_timestamp"],
+        timestamp_field="event_timestamp",
+        timestamp_filters=[
+            (">=", datetime(2023, 1, 1, 5, tzinfo=utc)),
+            ("<", datetime(2023, 1, 1, 7)),
+        ],
+    ).compute()
+
+    # The schema is read from the parquet metadata, so the files are only read once.
+    assert len(read_parquet_calls) == 1
+    assert list(source_df.columns) == ["driver_id", "event_timestamp"]
+    timestamps = pd.to_datetime(source_df["event_timestamp"], utc=True)
+    assert len(source_df) > 0
+    assert timestamps.min() >= pd.Timestamp("2023-01-01 05:00", tz=utc)
+    assert timestamps.max() < pd.Timestamp("2023-01-01 07:00", tz=utc)
+
+
+def _driver_stats_feature_view(file_source, ttl):
+    return FeatureView(
+        name="driver_stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        ttl=ttl,
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+        ],
+        source=file_source,
+    )
+
+
+@pytest.mark.parametrize("join_engine", ["dask", "asof"])
+def test_get_historical_features_with_ttl(repo_config, file_source, join_engine):
+    repo_config.offline_store.join_engine = join_engine
+    driver_stats = _driver_stats_feature_view(file_source, timedelta(hours=3))
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 3],
+            "event_timestamp": [
+                datetime(2023, 1, 1, 12, tzinfo=utc),
+                datetime(2023, 1, 2, 0, tzinfo=utc),
+                datetime(2023, 1, 2, 23, tzinfo=utc),
+            ],
+        }
+    )
+    registry = MagicMock()
+    registry.list_on_demand_feature_views.return_value = []
+
+    result = (
+        FileOfflineStore.get_historical_features(
+            config=repo_config,
+            feature_views=[driver_stats],
+            feature_refs=["driver_stats:rating"],
+            entity_df=entity_df,
+            registry=registry,
+            project=repo_config.project,
+        )
+        .to_df()
+        .sort_values("driver_id")
+    )
+
+    source_df = pd.read_parquet(file_source.path)
+    source_df["event_timestamp"] = pd.to_datetime(
+        source_df["event_timestamp"], utc=True
+    )
+    expected_ratings = []
+    for driver_id, event_timestamp in zip(
+        entity_df["driver_id"], entity_df["event_timestamp"]
+    ):
+        candidates = source_df[
+            (source_df["driver_id"] == driver_id)
+            & (source_df["event_timestamp"] <= event_timestamp)
+            & (source_df["event_timestamp"] >= event_timestamp - timedelta(hours=3))
+        ].sort_values(["event_timestamp", "created"])
+        expected_ratings.append(candidates["rating"].iloc[-1])
+    assert result["rating"].tolist() == expected_ratings
+
+
+def test_get_historical_features_join_engines(repo_config, file_source):
+    driver_stats = _driver_stats_feature_view(file_source, None)
+    # Entity rows are after the first feature row of every driver, and some of them are duplicated.
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [i % 40 for i in range(300)],
+            "event_timestamp": [
+                datetime(2023, 1, 2) + timedelta(minutes=17 * (i % 150))
+                for i in range(300)
+            ],
+        }
+    )
+    registry = MagicMock()
+    registry.list_on_demand_feature_views.return_value = []
+
+    results = []
+    for join_engine in ["dask", "asof"]:
+        repo_config.offline_store.join_engine = join_engine
+        results.append(
+            FileOfflineStore.get_historical_features(
+                config=repo_config,
+                feature_views=[driver_stats],
+                feature_refs=["driver_stats:rating"],
+                entity_df=entity_df,
+                registry=registry,
+                project=repo_config.project,
+                full_feature_names=True,
+            )
+            .to_df()
+            .sort_values(["driver_id", "event_timestamp"])
+            .reset_index(drop=True)
+        )
+
+    assert results[0]["driver_stats__rating"].notna().sum() > 0
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+@pytest.mark.parametrize("join_engine", ["dask", "asof"])
+def test_get_historical_features_concurrent_joins(
+    repo_config, file_source, join_engine
+):
+    repo_config.offline_store.join_engine = join_engine
+    feature_views = [
+        _driver_stats_feature_view(file_source, None),
+        _driver_stats_feature_view(file_source, timedelta(hours=2)).with_name(
+            "driver_stats_2h"
+        ),
+        # A feature view without entities is joined with every entity row.
+        FeatureView(
+            name="global_stats",
+            entities=[],
+            ttl=timedelta(hours=1),
+            schema=[Field(name="rating", dtype=Float64)],
+            source=file_source,
+        ),
+    ]
+    feature_refs = [
+        "driver_stats:rating",
+        "driver_stats_2h:rating",
+        "global_stats:rating",
+    ]
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [i % 40 for i in range(100)],
+            "event_timestamp": [
+                datetime(2023, 1, 1, 12) + timedelta(minutes=23 * i) for i in range(100)
+            ],
+        }
+    )
+    registry = MagicMock()
+    registry.list_on_demand_feature_views.return_value = []
+
+    results = []
+    for max_join_workers in [1, 3]:
+        repo_config.offline_store.max_join_workers = max_join_workers
+        results.append(
+            FileOfflineStore.get_historical_features(
+                config=repo_config,
+                feature_views=feature_views,
+                feature_refs=feature_refs,
+                entity_df=entity_df,
+                registry=registry,
+                project=repo_config.project,
+                full_feature_names=True,
+            )
+            .to_df()
+            .sort_values(["driver_id", "event_timestamp"])
+            .reset_index(drop=True)
+        )
+
+    assert list(results[0].columns) == [
+        "driver_id",
+        "event_timestamp",
+        "driver_stats__rating",
+        "driver_stats_2h__rating",
+        "global_stats__rating",
+    ]
+    # Entity rows are kept, even if a feature view has no feature row within its ttl.
+    assert len(results[0]) == len(entity_df)
+    assert results[0]["global_stats__rating"].notna().sum() > 0
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
+def test_offline_write_batch_append_and_compact(tmp_path):
+    source_path = tmp_path / "driver_stats"
+    source_path.mkdir()
+    df = pd.DataFrame(
+        {
+            "driver_id": [1, 2],
+            "rating": [1.0, 2.0],
+            "event_timestamp": [datetime(2023, 1, 1, 23), datetime(2023, 1, 2, 1)],
+        }
+    )
+    for date, date_df in [("2023-01-01", df.iloc[:1]), ("2023-01-02", df.iloc[1:])]:
+        (source_path / f"date={date}").mkdir()
+        date_df.to_parquet(source_path / f"date={date}" / "initial.parquet")
+    file_source = FileSource(path=str(source_path), timestamp_field="event_timestamp")
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+        ],
+        source=file_source,
+    )
+    repo_config = RepoConfig(
+        registry="registry.db",
+        project="test",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(type="sqlite"),
+        offline_store=FileOfflineStoreConfig(
+            offline_write_mode="append", offline_write_partition_by_date=True
+        ),
+        entity_key_serialization_version=2,
+    )
+
+    for i in range(3):
+        FileOfflineStore.offline_write_batch(
+            repo_config,
+            driver_stats,
+            pyarrow.Table.from_pandas(
+                df.assign(rating=df["rating"] + 10 * (i + 1)), preserve_index=False
+            ),
+            progress=None,
+        )
+
+    # The initial files are kept, and appended rows are written to a hive partition per date.
+    assert (source_path / "date=2023-01-01" / "initial.parquet").exists()
+    assert len(list((source_path / "date=2023-01-01").iterdir())) == 4
+    assert len(list((source_path / "date=2023-01-02").iterdir())) == 4
+    assert [
+        column
+        for column, _ in file_source.get_table_column_names_and_types(repo_config)
+    ] == ["driver_id", "rating", "event_timestamp"]
+
+    expected_ratings = [1.0, 2.0, 11.0, 12.0, 21.0, 22.0, 31.0, 32.0]
+    assert sorted(_read_datasource(file_source).compute()["rating"]) == (
+        expected_ratings
+    )
+
+    compact_file_source(file_source)
+
+    assert len(list((source_path / "date=2023-01-01").iterdir())) == 1
+    assert len(list((source_path / "date=2023-01-02").iterdir())) == 1
+    assert sorted(_read_datasource(file_source).compute()["rating"]) == (
+        expected_ratings
+    )
+
+    # Timestamp filters skip the date partitions that can't satisfy them, without opening their files.
+    (source_path / "date=2023-01-01" / "unreadable.parquet").write_bytes(b"")
+    source_df = _read_datasource(
+        file_source,
+        columns=["driver_id", "rating", "event_timestamp"],
+        timestamp_field="event_timestamp",
+        timestamp_filters=[(">=", datetime(2023, 1, 2)), ("<", datetime(2023, 1, 3))],
+    )
+    assert source_df.npartitions == 1
+    assert sorted(source_df.compute()["rating"]) == [2.0, 12.0, 22.0, 32.0]
+
+    # Rows can't be appended outside of the date partitions.
+    repo_config.offline_store.offline_write_partition_by_date = False
+    with pytest.raises(ValueError):
+        FileOfflineStore.offline_write_batch(
+            repo_config,
+            driver_stats,
+            pyarrow.Table.from_pandas(df, preserve_index=False),
+            progress=None,
+        )
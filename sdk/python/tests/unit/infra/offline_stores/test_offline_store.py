@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pyarrow
+import pyarrow.parquet
 import pytest
 
 from feast.infra.offline_stores.contrib.athena_offline_store.athena import (
@@ -25,7 +26,12 @@ from feast.infra.offline_stores.contrib.trino_offline_store.trino import (
     TrinoRetrievalJob,
 )
 from feast.infra.offline_stores.file import FileRetrievalJob
-from feast.infra.offline_stores.offline_store import RetrievalJob, RetrievalMetadata
+from feast.infra.offline_stores.file_source import SavedDatasetFileStorage
+from feast.infra.offline_stores.offline_store import (
+    ChunkedRetrievalJob,
+    RetrievalJob,
+    RetrievalMetadata,
+)
 from feast.infra.offline_stores.redshift import (
     RedshiftOfflineStoreConfig,
     RedshiftRetrievalJob,
@@ -223,3 +229,79 @@ def test_to_arrow_timeout(retrieval_job, timeout: Optional[int]):
     with patch.object(retrieval_job, "_to_arrow_internal") as mock_to_arrow_internal:
         retrieval_job.to_arrow(timeout=timeout)
         mock_to_arrow_internal.assert_called_once_with(timeout=timeout)
+
+
+class ArrowRetrievalJob(FileRetrievalJob):
+    def __init__(self, table: pyarrow.Table):
+        super().__init__(evaluation_function=table.to_pandas, full_feature_names=False)
+        self._table = table
+
+    def _to_arrow_internal(self, timeout: Optional[int] = None) -> pyarrow.Table:
+        return self._table
+
+
+def test_chunked_retrieval_job_persist_with_different_chunk_types(tmp_path):
+    """Test that chunks whose columns have different types are persisted to a single parquet file."""
+
+    tables = [
+        pyarrow.table({"driver_id": [1, 2], "name": [None, None]}),
+        pyarrow.table({"driver_id": [3], "name": ["c"]}),
+        pyarrow.table({"name": [None], "driver_id": [4]}),
+    ]
+    job = ChunkedRetrievalJob(
+        lambda: (ArrowRetrievalJob(table) for table in tables),
+        full_feature_names=False,
+    )
+
+    path = str(tmp_path / "saved.parquet")
+    job.persist(SavedDatasetFileStorage(path=path))
+
+    saved = pyarrow.parquet.read_table(path)
+    assert saved.schema == pyarrow.schema(
+        [("driver_id", pyarrow.int64()), ("name", pyarrow.string())]
+    )
+    assert saved.to_pydict() == {
+        "driver_id": [1, 2, 3, 4],
+        "name": [None, None, "c", None],
+    }
+
+
+def test_chunked_retrieval_job_with_integer_and_floating_point_chunks(tmp_path):
+    """Test that an integer column which is floating point in some chunks has a single type."""
+
+    tables = [
+        pyarrow.table({"driver_id": [1], "trips": [10]}),
+        pyarrow.table({"driver_id": [2], "trips": [float("nan")]}),
+        pyarrow.table({"driver_id": [3], "trips": pyarrow.nulls(1)}),
+    ]
+    job = ChunkedRetrievalJob(
+        lambda: (ArrowRetrievalJob(table) for table in tables),
+        full_feature_names=False,
+    )
+    schema = pyarrow.schema(
+        [("driver_id", pyarrow.int64()), ("trips", pyarrow.float64())]
+    )
+
+    assert job.to_arrow().schema == schema
+    assert [batch.schema for batch in job.to_arrow_batches()] == [schema] * 3
+
+    path = str(tmp_path / "saved.parquet")
+    job.persist(SavedDatasetFileStorage(path=path))
+    saved = pyarrow.parquet.read_table(path)
+    assert saved.schema == schema
+    assert saved.column("trips").to_pylist()[0] == 10.0
+
+
+def test_chunked_retrieval_job_persist_unsupported(tmp_path):
+    """Test that persisting fails if the retrieval jobs of the chunks can't persist tables."""
+
+    class MockArrowRetrievalJob(MockRetrievalJob):
+        def _to_arrow_internal(self, timeout: Optional[int] = None) -> pyarrow.Table:
+            return pyarrow.table({"driver_id": [1]})
+
+    job = ChunkedRetrievalJob(
+        lambda: iter([MockArrowRetrievalJob()]),
+        full_feature_names=False,
+    )
+    with pytest.raises(NotImplementedError):
+        job.persist(SavedDatasetFileStorage(path=str(tmp_path / "saved.parquet")))
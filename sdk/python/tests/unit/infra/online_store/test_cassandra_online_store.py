@@ -0,0 +1,212 @@
+import logging
+import re
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib.cassandra_online_store import (
+    cassandra_online_store,
+)
+from feast.infra.online_stores.contrib.cassandra_online_store.cassandra_online_store import (
+    CassandraOnlineStore,
+    CassandraOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+class InMemoryCassandraFuture:
+    def __init__(self, result, exception=None):
+        self._result = result
+        self._exception = exception
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+class InMemoryCassandraMetadata:
+    def __init__(self, hosts):
+        self.hosts = hosts
+
+    def get_replicas(self, keyspace, routing_key):
+        # Every partition has a single replica.
+        return [self.hosts[sum(routing_key) % len(self.hosts)]]
+
+
+class InMemoryCassandraCluster:
+    def __init__(self, hosts):
+        self.metadata = InMemoryCassandraMetadata(hosts)
+
+
+class InMemoryCassandraSession:
+    """Executes the CQL statements used by the Cassandra online store against a dict."""
+
+    def __init__(self, hosts):
+        self.cluster = InMemoryCassandraCluster(hosts)
+        self.hosts = hosts
+        self.tables = {}
+        self.selects = []
+        self.failing_hosts = set()
+
+    def get_pool_state(self):
+        return {host: {} for host in self.hosts}
+
+    def prepare(self, query):
+        return query
+
+    def execute_async(self, query, parameters=None, host=None):
+        if host in self.failing_hosts:
+            return InMemoryCassandraFuture(None, Exception(f"{host} is unavailable"))
+        return InMemoryCassandraFuture(self.execute(query, parameters, host))
+
+    def execute(self, query, parameters=None, host=None):
+        insert = re.match(r"INSERT INTO (\S+) \((.*)\) VALUES", query)
+        if insert:
+            columns = [column.strip() for column in insert.group(2).split(",")]
+            row = dict(zip(columns, parameters))
+            rows = self.tables.setdefault(insert.group(1), {})
+            rows[(row["entity_key"], row.get("feature_name"))] = row
+            return []
+
+        select = re.match(r"SELECT (.*) FROM (\S+) WHERE (.*);", query)
+        if select:
+            self.selects.append((query, parameters, host))
+            columns = [column.strip() for column in select.group(1).split(",")]
+            entity_keys = parameters[0]
+            if "entity_key IN ?" not in select.group(3):
+                entity_keys = [entity_keys]
+            feature_names = parameters[1] if len(parameters) > 1 else None
+            Row = namedtuple("Row", columns)
+            return [
+                Row(*[row[column] for column in columns])
+                for (entity_key, feature_name), row in self.tables.get(
+                    select.group(2), {}
+                ).items()
+                if entity_key in entity_keys
+                and (feature_names is None or feature_name in feature_names)
+            ]
+        return []
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+@pytest.mark.parametrize("wide_rows", [False, True])
+@pytest.mark.parametrize("read_batch_size", [None, 3])
+def test_cassandra_online_store_write_and_read(
+    monkeypatch, caplog, wide_rows, read_batch_size
+):
+    monkeypatch.setattr(
+        cassandra_online_store,
+        "execute_concurrent_with_args",
+        lambda session, statement, parameters, concurrency: [
+            (True, session.execute(statement, params)) for params in parameters
+        ],
+    )
+    repo_config = RepoConfig(
+        registry="registry.db",
+        project="test_cassandra",
+        provider="local",
+        online_store=CassandraOnlineStoreConfig(
+            hosts=["127.0.0.1"], wide_rows=wide_rows, read_batch_size=read_batch_size
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store = CassandraOnlineStore()
+    store._session = InMemoryCassandraSession(["host1", "host2"])
+    table = MockFeatureView(name="driver_stats")
+
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (
+                _entity_key(driver_id),
+                {
+                    "rating": ValueProto(double_val=driver_id),
+                    "trips": ValueProto(int64_val=10 * driver_id),
+                },
+                datetime(2023, 1, 1),
+                None,
+            )
+            for driver_id in range(10)
+        ],
+        None,
+    )
+    table_name = (
+        '"feast_keyspace"."test_cassandra_driver_stats_wide"'
+        if wide_rows
+        else '"feast_keyspace"."test_cassandra_driver_stats"'
+    )
+    assert len(store._session.tables[table_name]) == (10 if wide_rows else 20)
+
+    entity_keys = [_entity_key(driver_id) for driver_id in [3, 100, 7, 3]]
+    result = store.online_read(repo_config, table, entity_keys, ["rating"])
+    assert result == [
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=3)}),
+        (None, None),
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=7)}),
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=3)}),
+    ]
+    # Duplicate entity keys are read once, and the requested features are filtered by the query.
+    selects = store._session.selects
+    assert all(("feature_name IN ?" in query) != wide_rows for query, _, _ in selects)
+    if read_batch_size is None:
+        assert len(selects) == 3
+        assert all(host is None for _, _, host in selects)
+    else:
+        assert sum(len(parameters[0]) for _, parameters, _ in selects) == 3
+
+    store._session.selects.clear()
+    entity_keys = [_entity_key(driver_id) for driver_id in range(10)]
+    result = store.online_read(repo_config, table, entity_keys)
+    assert [values for _, values in result] == [
+        {
+            "rating": ValueProto(double_val=driver_id),
+            "trips": ValueProto(int64_val=10 * driver_id),
+        }
+        for driver_id in range(10)
+    ]
+    if read_batch_size is not None:
+        # Entity keys are read in batches sent to the replica of their partitions.
+        metadata = store._session.cluster.metadata
+        for _, (entity_key_bins,), host in store._session.selects:
+            assert len(entity_key_bins) <= read_batch_size
+            for entity_key_bin in entity_key_bins:
+                routing_key = (
+                    entity_key_bin if wide_rows else entity_key_bin.encode("utf8")
+                )
+                assert metadata.get_replicas("feast_keyspace", routing_key) == [host]
+        assert len({host for _, _, host in store._session.selects}) == 2
+
+        # Failed reads are logged, and their entity keys are returned without values.
+        store._session.failing_hosts.add("host2")
+        with caplog.at_level(logging.ERROR):
+            result = store.online_read(repo_config, table, entity_keys)
+        assert "host2 is unavailable" in caplog.text
+        failed = []
+        for entity_key in entity_keys:
+            routing_key = serialize_entity_key(entity_key, 2)
+            if not wide_rows:
+                routing_key = routing_key.hex().encode("utf8")
+            failed.append(
+                metadata.get_replicas("feast_keyspace", routing_key) == ["host2"]
+            )
+        assert any(failed) and not all(failed)
+        assert [values is None for _, values in result] == failed
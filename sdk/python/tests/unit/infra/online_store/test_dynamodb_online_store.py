@@ -1,3 +1,5 @@
+import asyncio
+import time
 from copy import deepcopy
 from dataclasses import dataclass
 
@@ -5,6 +7,7 @@ import boto3
 import pytest
 from moto import mock_dynamodb
 
+from feast.errors import DynamoDBUnprocessedKeysError
 from feast.infra.offline_stores.file import FileOfflineStoreConfig
 from feast.infra.online_stores.dynamodb import (
     DynamoDBOnlineStore,
@@ -358,3 +361,148 @@ def test_dynamodb_online_store_online_read_unknown_entity_end_of_batch(
     # ensure the entity is not dropped
     assert len(returned_items) == len(entity_keys)
     assert returned_items[-1] == (None, None)
+
+
+@mock_dynamodb
+def test_dynamodb_online_store_online_read_concurrent_batches(
+    repo_config, dynamodb_online_store, monkeypatch
+):
+    """
+    Test DynamoDBOnlineStore online_read method with concurrent batches, unprocessed keys and duplicate
+    entity keys.
+    """
+    repo_config.online_store.batch_size = 7
+    repo_config.online_store.read_retry_backoff_ms = 1
+    db_table_name = f"{TABLE_NAME}_concurrent_batches"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=50)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    dynamodb_client = dynamodb_online_store._get_dynamodb_client(REGION)
+    batch_get_item = dynamodb_client.batch_get_item
+    requested_keys = []
+
+    def throttled_batch_get_item(RequestItems):
+        # Only the first key of every call is processed.
+        ((table_name, request),) = RequestItems.items()
+        requested_keys.append(len(request["Keys"]))
+        response = batch_get_item(
+            RequestItems={table_name: {**request, "Keys": request["Keys"][:1]}}
+        )
+        if len(request["Keys"]) > 1:
+            response["UnprocessedKeys"] = {
+                table_name: {**request, "Keys": request["Keys"][1:]}
+            }
+        return response
+
+    monkeypatch.setattr(dynamodb_client, "batch_get_item", throttled_batch_get_item)
+
+    entity_keys, features, *rest = zip(*data)
+    returned_items = dynamodb_online_store.online_read(
+        config=repo_config,
+        table=MockFeatureView(name=db_table_name),
+        entity_keys=list(entity_keys) + list(entity_keys[:3]),
+    )
+    assert [item[1] for item in returned_items] == list(features) + list(features[:3])
+    # Every key is requested once, until it is processed.
+    assert len(requested_keys) == 50
+    assert max(requested_keys) == 7
+
+    repo_config.online_store.max_read_retries = 3
+    with pytest.raises(DynamoDBUnprocessedKeysError):
+        dynamodb_online_store.online_read(
+            config=repo_config,
+            table=MockFeatureView(name=db_table_name),
+            entity_keys=entity_keys,
+        )
+
+
+@mock_dynamodb
+def test_dynamodb_online_store_online_read_timeout(
+    repo_config, dynamodb_online_store, monkeypatch
+):
+    """Test DynamoDBOnlineStore online_read method with a deadline."""
+    repo_config.online_store.batch_size = 5
+    repo_config.online_store.read_timeout_secs = 0.1
+    db_table_name = f"{TABLE_NAME}_timeout"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=20)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    dynamodb_client = dynamodb_online_store._get_dynamodb_client(REGION)
+    batch_get_item = dynamodb_client.batch_get_item
+    monkeypatch.setattr(
+        dynamodb_client,
+        "batch_get_item",
+        lambda **kwargs: time.sleep(0.5) or batch_get_item(**kwargs),
+    )
+
+    entity_keys, *rest = zip(*data)
+    with pytest.raises(TimeoutError):
+        dynamodb_online_store.online_read(
+            config=repo_config,
+            table=MockFeatureView(name=db_table_name),
+            entity_keys=entity_keys,
+        )
+
+
+class AsyncDynamoDBClient:
+    """
+    Wraps a boto3 client like an aiobotocore client, since moto doesn't mock aiobotocore. Like an
+    aiobotocore client, it can only be used from the event loop it was created in.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._loop = asyncio.get_running_loop()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def batch_get_item(self, **kwargs):
+        assert asyncio.get_running_loop() is self._loop
+        return self._client.batch_get_item(**kwargs)
+
+
+@mock_dynamodb
+def test_dynamodb_online_store_online_read_async(
+    repo_config, dynamodb_online_store, monkeypatch
+):
+    """Test DynamoDBOnlineStore online_read_async method."""
+    aiobotocore_session = pytest.importorskip("aiobotocore.session")
+    repo_config.online_store.batch_size = 7
+    db_table_name = f"{TABLE_NAME}_online_read_async"
+    create_test_table(PROJECT, db_table_name, REGION)
+    data = create_n_customer_test_samples(n=50)
+    insert_data_test_table(data, PROJECT, db_table_name, REGION)
+
+    async_clients = []
+
+    def create_client(service_name, region_name, **kwargs):
+        async_clients.append(
+            AsyncDynamoDBClient(dynamodb_online_store._get_dynamodb_client(region_name))
+        )
+        return async_clients[-1]
+
+    session = aiobotocore_session.get_session()
+    monkeypatch.setattr(session, "create_client", create_client)
+    monkeypatch.setattr(aiobotocore_session, "get_session", lambda: session)
+
+    entity_keys, features, *rest = zip(*data)
+    unknown_entity_key = EntityKeyProto(
+        join_keys=["customer"], entity_values=[ValueProto(string_val="12359")]
+    )
+    # Every event loop gets its own client.
+    for _ in range(2):
+        returned_items = asyncio.run(
+            dynamodb_online_store.online_read_async(
+                config=repo_config,
+                table=MockFeatureView(name=db_table_name),
+                entity_keys=list(entity_keys) + [unknown_entity_key],
+            )
+        )
+        assert [item[1] for item in returned_items] == list(features) + [None]
+    assert len(async_clients) == 2
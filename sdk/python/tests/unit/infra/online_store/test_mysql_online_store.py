@@ -0,0 +1,163 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from pymysql.cursors import RE_INSERT_VALUES
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib.mysql_online_store import mysql
+from feast.infra.online_stores.contrib.mysql_online_store.mysql import (
+    MySQLOnlineStore,
+    MySQLOnlineStoreConfig,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+class InMemoryMySQLCursor:
+    """Executes the statements used by the MySQL online store against a dict."""
+
+    def __init__(self, rows, statements):
+        self.rows = rows
+        self.statements = statements
+        self.results = []
+
+    def executemany(self, query, args):
+        # The statement is sent as a single multi-row INSERT by PyMySQL.
+        assert RE_INSERT_VALUES.match(query)
+        self.statements.append(("executemany", query, len(args)))
+        for entity_key, feature_name, value, event_ts, created_ts in args:
+            self.rows[(entity_key, feature_name)] = (value, event_ts)
+
+    def execute(self, query, args):
+        self.statements.append(("execute", query, len(args)))
+        placeholders = re.search(r"entity_key IN \(([^)]*)\)", query).group(1)
+        num_entity_keys = placeholders.count("%s")
+        entity_keys = set(args[:num_entity_keys])
+        feature_names = set(args[num_entity_keys:])
+        self.results = [
+            (entity_key, feature_name, value, event_ts)
+            for (entity_key, feature_name), (value, event_ts) in self.rows.items()
+            if entity_key in entity_keys
+            and (not feature_names or feature_name in feature_names)
+        ]
+
+    def fetchall(self):
+        return self.results
+
+
+class InMemoryMySQLConnection:
+    def __init__(self, rows, statements):
+        self.rows = rows
+        self.statements = statements
+
+    def cursor(self):
+        return InMemoryMySQLCursor(self.rows, self.statements)
+
+    def commit(self):
+        pass
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def test_mysql_online_store_batched_reads_and_writes(monkeypatch):
+    rows = {}
+    statements = []
+    connections = []
+
+    def connect(**kwargs):
+        connections.append(threading.current_thread())
+        return InMemoryMySQLConnection(rows, statements)
+
+    monkeypatch.setattr(mysql.pymysql, "connect", connect)
+    repo_config = RepoConfig(
+        registry="registry.db",
+        project="test_mysql",
+        provider="local",
+        online_store=MySQLOnlineStoreConfig(batch_size=20),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store = MySQLOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+
+    progress = []
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (
+                _entity_key(driver_id),
+                {
+                    "rating": ValueProto(double_val=driver_id),
+                    "trips": ValueProto(int64_val=10 * driver_id),
+                },
+                datetime(2023, 1, 1),
+                None,
+            )
+            for driver_id in range(50)
+        ],
+        progress.append,
+    )
+    assert progress == [20, 20, 10]
+    assert [(method, num_args) for method, _, num_args in statements] == [
+        ("executemany", 40),
+        ("executemany", 40),
+        ("executemany", 20),
+    ]
+    assert len(rows) == 100
+
+    statements.clear()
+    entity_keys = [_entity_key(driver_id) for driver_id in [3, 100, 7, 3] * 10]
+    result = store.online_read(repo_config, table, entity_keys, ["rating"])
+    # Duplicate entity keys are read once, in batches of at most 20 entity keys.
+    assert [(method, num_args) for method, _, num_args in statements] == [
+        ("execute", 4)
+    ]
+    assert result[:4] == [
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=3)}),
+        (None, None),
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=7)}),
+        (datetime(2023, 1, 1), {"rating": ValueProto(double_val=3)}),
+    ]
+    assert result == result[:4] * 10
+    # Repeated entity keys don't share their values.
+    assert result[0][1] is not result[3][1]
+    result[0][1]["rating"] = ValueProto(double_val=0)
+    assert result[3][1] == {"rating": ValueProto(double_val=3)}
+
+    statements.clear()
+    entity_keys = [_entity_key(driver_id) for driver_id in range(45)]
+    result = store.online_read(repo_config, table, entity_keys)
+    assert [(method, num_args) for method, _, num_args in statements] == [
+        ("execute", 20),
+        ("execute", 20),
+        ("execute", 5),
+    ]
+    assert [values["trips"].int64_val for _, values in result] == [
+        10 * driver_id for driver_id in range(45)
+    ]
+
+    # Every thread uses its own connection.
+    connections.clear()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(
+            executor.map(
+                lambda _: store.online_read(repo_config, table, entity_keys[:1]),
+                range(10),
+            )
+        )
+    assert 1 <= len(connections) <= 2
+    assert len(set(connections)) == len(connections)
@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import dataclass
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.contrib import postgres
+from feast.infra.online_stores.contrib.postgres import (
+    PostgreSQLOnlineStore,
+    PostgreSQLOnlineStoreConfig,
+)
+from feast.infra.utils.postgres import connection_utils
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+class LoopBoundCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params):
+        assert asyncio.get_running_loop() is self.conn.loop
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class LoopBoundConnection:
+    """Like an asynchronous psycopg2 connection, can only be used from the event loop it was opened in."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    def cursor(self):
+        return LoopBoundCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+def test_postgres_online_read_async_in_several_event_loops(monkeypatch):
+    conns = []
+
+    async def get_async_conn(config):
+        conns.append(LoopBoundConnection())
+        return conns[-1]
+
+    async def wait_async(conn):
+        pass
+
+    monkeypatch.setattr(connection_utils, "_get_async_conn", get_async_conn)
+    monkeypatch.setattr(postgres, "wait_async", wait_async)
+    repo_config = RepoConfig(
+        registry="registry.db",
+        project="test_postgres",
+        provider="local",
+        online_store=PostgreSQLOnlineStoreConfig(
+            host="localhost", database="feast", user="feast", password="feast"
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store = PostgreSQLOnlineStore()
+    entity_key = EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=1)]
+    )
+
+    # Every event loop gets its own connection pool.
+    for _ in range(2):
+        result = asyncio.run(
+            store.online_read_async(
+                repo_config, MockFeatureView(name="driver_stats"), [entity_key]
+            )
+        )
+        assert result == [(None, None)]
+    assert len(conns) == 2
+    assert [conn.closed for conn in conns] == [True, False]
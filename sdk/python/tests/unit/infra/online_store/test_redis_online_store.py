@@ -0,0 +1,176 @@
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+
+from redis import asyncio as redis_asyncio
+
+from feast import Entity, FeatureView, Field, FileSource
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores.redis import RedisOnlineStore, RedisOnlineStoreConfig
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+from feast.types import Float64, Int64
+
+
+class InMemoryRedisPipeline:
+    """Executes the hash commands used by the Redis online store against a dict."""
+
+    def __init__(self, hashes, hmget_calls):
+        self.hashes = hashes
+        self.hmget_calls = hmget_calls
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def hmget(self, name, keys):
+        keys = [keys] if isinstance(keys, (bytes, str)) else list(keys)
+        self.commands.append(
+            lambda: [
+                self.hashes[name].get(k.encode() if isinstance(k, str) else k)
+                for k in keys
+            ]
+        )
+        self.hmget_calls.append((name, keys))
+
+    def hset(self, name, mapping):
+        def hset():
+            self.hashes[name].update(
+                {k.encode() if isinstance(k, str) else k: v for k, v in mapping.items()}
+            )
+            return len(mapping)
+
+        self.commands.append(hset)
+
+    def execute(self):
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
+
+
+class AsyncInMemoryRedisPipeline(InMemoryRedisPipeline):
+    async def execute(self):
+        return super().execute()
+
+
+class InMemoryRedis:
+    def __init__(self, pipeline_class=InMemoryRedisPipeline):
+        self.hashes = defaultdict(dict)
+        self.hmget_calls = []
+        self.pipeline_class = pipeline_class
+
+    def pipeline(self, transaction=True):
+        return self.pipeline_class(self.hashes, self.hmget_calls)
+
+
+class AsyncInMemoryRedis(InMemoryRedis):
+    """Like an asyncio Redis client, can only be used from the event loop it was created in."""
+
+    def __init__(self, hashes):
+        super().__init__(AsyncInMemoryRedisPipeline)
+        self.hashes = hashes
+        self.loop = asyncio.get_running_loop()
+
+    def pipeline(self, transaction=True):
+        assert asyncio.get_running_loop() is self.loop
+        return super().pipeline(transaction)
+
+
+def _feature_view(name: str) -> FeatureView:
+    return FeatureView(
+        name=name,
+        entities=[Entity(name="driver", join_keys=["driver_id"])],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+            Field(name="trips", dtype=Int64),
+        ],
+        source=FileSource(path="driver_stats.parquet", timestamp_field="ts"),
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def test_redis_online_read_many(monkeypatch):
+    repo_config = RepoConfig(
+        registry="registry.db",
+        project="test_redis",
+        provider="local",
+        online_store=RedisOnlineStoreConfig(),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+    store = RedisOnlineStore()
+    store._client = InMemoryRedis()
+    driver_stats = _feature_view("driver_stats")
+    driver_daily_stats = _feature_view("driver_daily_stats")
+    for i, table in enumerate([driver_stats, driver_daily_stats]):
+        store.online_write_batch(
+            repo_config,
+            table,
+            [
+                (
+                    _entity_key(driver_id),
+                    {
+                        "rating": ValueProto(double_val=driver_id + i),
+                        "trips": ValueProto(int64_val=10 * driver_id),
+                    },
+                    datetime(2023, 1, 1 + i),
+                    None,
+                )
+                for driver_id in range(5)
+            ],
+            None,
+        )
+
+    entity_keys = [_entity_key(3), _entity_key(100), _entity_key(1)]
+    requested_features = ["rating"]
+    tables = [(driver_stats, requested_features), (driver_daily_stats, None)]
+    store._client.hmget_calls.clear()
+    result = store.online_read_many(repo_config, tables, entity_keys)
+
+    # Both feature views are read with a single HMGET per entity key.
+    assert len(store._client.hmget_calls) == len(entity_keys)
+    assert requested_features == ["rating"]
+    assert result == [
+        store.online_read(repo_config, table, entity_keys, features)
+        for table, features in tables
+    ]
+    ts, values = result[1][0]
+    assert ts.replace(tzinfo=None) == datetime(2023, 1, 2)
+    assert values == {
+        "rating": ValueProto(double_val=4),
+        "trips": ValueProto(int64_val=30),
+    }
+    assert result[0][2][1] == {"rating": ValueProto(double_val=1)}
+
+    # Asynchronous reads return the same result, and every event loop gets its own client.
+    async_clients = []
+
+    def create_async_client(**kwargs):
+        async_clients.append(AsyncInMemoryRedis(store._client.hashes))
+        return async_clients[-1]
+
+    monkeypatch.setattr(redis_asyncio, "Redis", create_async_client)
+    for _ in range(2):
+        assert (
+            asyncio.run(store.online_read_many_async(repo_config, tables, entity_keys))
+            == result
+        )
+    assert [len(client.hmget_calls) for client in async_clients] == [
+        len(entity_keys)
+    ] * 2
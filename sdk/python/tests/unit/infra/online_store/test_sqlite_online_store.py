@@ -0,0 +1,188 @@
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pytest
+
+from feast.infra.offline_stores.file import FileOfflineStoreConfig
+from feast.infra.online_stores import sqlite
+from feast.infra.online_stores.sqlite import (
+    SqliteOnlineStore,
+    SqliteOnlineStoreConfig,
+    SqliteTable,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import RepoConfig
+
+
+@dataclass
+class MockFeatureView:
+    name: str
+
+
+def _repo_config(tmp_path, **online_store_kwargs):
+    return RepoConfig(
+        registry=str(tmp_path / "registry.db"),
+        project="test_sqlite",
+        provider="local",
+        online_store=SqliteOnlineStoreConfig(
+            path=str(tmp_path / "online.db"), **online_store_kwargs
+        ),
+        offline_store=FileOfflineStoreConfig(),
+        entity_key_serialization_version=2,
+    )
+
+
+def _entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+@pytest.mark.parametrize("wide_rows", [False, True])
+def test_sqlite_online_store_write_and_read(tmp_path, wide_rows):
+    repo_config = _repo_config(
+        tmp_path, journal_mode="WAL", synchronous="NORMAL", wide_rows=wide_rows
+    )
+    store = SqliteOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+    store.update(repo_config, [], [table], [], [], partial=False)
+
+    event_ts = datetime(2023, 1, 1)
+    progress = []
+    for i in range(2):
+        # The second write overwrites the values of the first one.
+        store.online_write_batch(
+            repo_config,
+            table,
+            [
+                (
+                    _entity_key(driver_id),
+                    {
+                        "rating": ValueProto(double_val=driver_id + i),
+                        "name": ValueProto(string_val=f"driver {driver_id}"),
+                    },
+                    event_ts + timedelta(days=i),
+                    None,
+                )
+                for driver_id in range(100)
+            ],
+            progress.append,
+        )
+    assert sum(progress) == 200
+
+    result = store.online_read(
+        repo_config, table, [_entity_key(5), _entity_key(1000), _entity_key(7)]
+    )
+    assert result[1] == (None, None)
+    for (ts, values), driver_id in zip([result[0], result[2]], [5, 7]):
+        assert ts == event_ts + timedelta(days=1)
+        assert values == {
+            "rating": ValueProto(double_val=driver_id + 1),
+            "name": ValueProto(string_val=f"driver {driver_id}"),
+        }
+
+    conn = store._get_conn(repo_config)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    # One row per entity, or one row per entity and feature
+    table_name = (
+        "test_sqlite_driver_stats_wide" if wide_rows else "test_sqlite_driver_stats"
+    )
+    (num_rows,) = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()
+    assert num_rows == (100 if wide_rows else 200)
+
+
+def test_sqlite_table_wide_rows(tmp_path):
+    table = SqliteTable(path=str(tmp_path / "online.db"), name="wide", wide_rows=True)
+    assert SqliteTable.from_proto(table.to_proto()).wide_rows
+
+    table.update()
+    with pytest.raises(sqlite3.OperationalError):
+        table.conn.execute("SELECT feature_name FROM wide")
+
+
+def test_sqlite_online_store_concurrent_chunked_reads(tmp_path, monkeypatch):
+    # Entity keys are looked up in chunks that don't exceed the maximum number of parameters.
+    monkeypatch.setattr(sqlite, "_max_variable_number", lambda conn: 7)
+    repo_config = _repo_config(tmp_path, mmap_size=2**20)
+    store = SqliteOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+    store.update(repo_config, [], [table], [], [], partial=False)
+    store.online_write_batch(
+        repo_config,
+        table,
+        [
+            (
+                _entity_key(driver_id),
+                {"rating": ValueProto(double_val=driver_id)},
+                datetime(2023, 1, 1),
+                None,
+            )
+            for driver_id in range(0, 100, 2)
+        ],
+        None,
+    )
+
+    barrier = threading.Barrier(4)
+
+    def read(thread_idx):
+        barrier.wait()
+        driver_ids = [(driver_id + thread_idx) % 100 for driver_id in range(100)]
+        result = store.online_read(
+            repo_config, table, [_entity_key(driver_id) for driver_id in driver_ids]
+        )
+        # Every thread reads with its own connection.
+        return (
+            store._get_read_conn(repo_config),
+            [values["rating"].double_val if values else None for _, values in result],
+            driver_ids,
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(read, range(4)))
+
+    assert len({id(conn) for conn, _, _ in results}) == 4
+    for _, ratings, driver_ids in results:
+        assert ratings == [
+            float(driver_id) if driver_id % 2 == 0 else None for driver_id in driver_ids
+        ]
+
+
+def test_sqlite_online_store_read_before_db_exists(tmp_path):
+    repo_config = _repo_config(tmp_path)
+    store = SqliteOnlineStore()
+
+    # Falls back to the read-write connection, which creates the database.
+    with pytest.raises(sqlite3.OperationalError, match="no such table"):
+        store.online_read(
+            repo_config, MockFeatureView(name="driver_stats"), [_entity_key(1)]
+        )
+
+
+def test_sqlite_online_store_read_after_teardown(tmp_path):
+    repo_config = _repo_config(tmp_path)
+    store = SqliteOnlineStore()
+    table = MockFeatureView(name="driver_stats")
+
+    for rating in [1.0, 2.0]:
+        store.update(repo_config, [], [table], [], [], partial=False)
+        store.online_write_batch(
+            repo_config,
+            table,
+            [
+                (
+                    _entity_key(1),
+                    {"rating": ValueProto(double_val=rating)},
+                    datetime(2023, 1, 1),
+                    None,
+                )
+            ],
+            None,
+        )
+        # The read connection must not outlive the database it was opened on.
+        result = store.online_read(repo_config, table, [_entity_key(1)])
+        assert result[0][1]["rating"].double_val == rating
+        store.teardown(repo_config, [table], [])
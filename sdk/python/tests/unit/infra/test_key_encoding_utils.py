@@ -1,8 +1,17 @@
+import struct
+
+import numpy as np
+import pyarrow as pa
 import pytest
 
-from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.key_encoding_utils import (
+    serialize_entity_key,
+    serialize_entity_key_columns,
+    serialize_entity_keys,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.value_type import ValueType
 
 
 def test_serialize_entity_key():
@@ -28,3 +37,85 @@ def test_serialize_entity_key():
                 join_keys=["user"], entity_values=[ValueProto(int64_val=int(2**31))]
             ),
         )
+
+
+@pytest.mark.parametrize("entity_key_serialization_version", [1, 2])
+def test_serialize_entity_keys(entity_key_serialization_version):
+    entity_keys = [
+        EntityKeyProto(join_keys=["user"], entity_values=[ValueProto(int64_val=1)]),
+        EntityKeyProto(
+            join_keys=["user", "item"],
+            entity_values=[ValueProto(int64_val=-2), ValueProto(string_val="é")],
+        ),
+        EntityKeyProto(join_keys=["user"], entity_values=[ValueProto(int64_val=3)]),
+        EntityKeyProto(
+            join_keys=["user", "item"],
+            entity_values=[ValueProto(int64_val=4), ValueProto(string_val="")],
+        ),
+        EntityKeyProto(
+            join_keys=["session", "user"],
+            entity_values=[ValueProto(bytes_val=b"\x00"), ValueProto(int32_val=5)],
+        ),
+        # Mixed value types for the same join key are serialized one by one
+        EntityKeyProto(join_keys=["session"], entity_values=[ValueProto(int32_val=6)]),
+        EntityKeyProto(
+            join_keys=["session"], entity_values=[ValueProto(string_val="7")]
+        ),
+    ]
+
+    assert serialize_entity_keys(
+        entity_keys, entity_key_serialization_version=entity_key_serialization_version
+    ) == [
+        serialize_entity_key(
+            entity_key,
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+        for entity_key in entity_keys
+    ]
+
+
+@pytest.mark.parametrize("entity_key_serialization_version", [1, 2])
+def test_serialize_entity_key_columns(entity_key_serialization_version):
+    user_ids = [1, 2**20, -3]
+    items = ["a", "bb", "ccc"]
+    expected = [
+        serialize_entity_key(
+            EntityKeyProto(
+                join_keys=["user", "item"],
+                entity_values=[
+                    ValueProto(int64_val=user_id),
+                    ValueProto(string_val=item),
+                ],
+            ),
+            entity_key_serialization_version=entity_key_serialization_version,
+        )
+        for user_id, item in zip(user_ids, items)
+    ]
+
+    for join_key_values in (
+        {"user": user_ids, "item": items},
+        {"user": np.array(user_ids), "item": np.array(items)},
+        {"user": pa.array(user_ids), "item": pa.array(items)},
+    ):
+        assert (
+            serialize_entity_key_columns(
+                join_key_values,
+                {"user": ValueType.INT64, "item": ValueType.STRING},
+                entity_key_serialization_version=entity_key_serialization_version,
+            )
+            == expected
+        )
+
+
+def test_serialize_entity_key_columns_errors():
+    # Old serialization scheme, should fail like serialize_entity_key.
+    with pytest.raises(struct.error):
+        serialize_entity_key_columns({"user": [1, 2**31]}, {"user": ValueType.INT64})
+
+    with pytest.raises(ValueError):
+        serialize_entity_key_columns({"user": [1.0]}, {"user": ValueType.DOUBLE})
+
+    with pytest.raises(ValueError):
+        serialize_entity_key_columns(
+            {"user": pa.array([1, None])}, {"user": ValueType.INT64}
+        )
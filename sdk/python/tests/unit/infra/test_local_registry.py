@@ -11,6 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from tempfile import mkstemp
 
@@ -23,6 +26,7 @@ from feast.aggregation import Aggregation
 from feast.data_format import AvroFormat, ParquetFormat
 from feast.data_source import KafkaSource
 from feast.entity import Entity
+from feast.errors import FeatureViewNotFoundException
 from feast.feature_view import FeatureView
 from feast.field import Field
 from feast.infra.registry.registry import Registry
@@ -524,6 +528,179 @@ def test_commit():
         test_registry._get_registry_proto(project=project)
 
 
+@pytest.mark.parametrize(
+    "test_registry",
+    [lazy_fixture("local_registry")],
+)
+def test_cached_lookups(test_registry):
+    batch_source = FileSource(
+        file_format=ParquetFormat(),
+        path="file://feast/*",
+        timestamp_field="ts_col",
+    )
+    entity = Entity(name="fs1_my_entity_1", join_keys=["test"])
+    fv1 = FeatureView(
+        name="my_feature_view_1",
+        schema=[Field(name="fs1_my_feature_1", dtype=Int64)],
+        entities=[entity],
+        source=batch_source,
+        ttl=timedelta(minutes=5),
+    )
+
+    project = "project"
+    test_registry.apply_entity(entity, project)
+    test_registry.apply_feature_view(fv1, project)
+
+    # Cached lookups are served from an index, so the same object is returned every time
+    feature_view = test_registry.get_feature_view(
+        "my_feature_view_1", project, allow_cache=True
+    )
+    assert feature_view.name == "my_feature_view_1"
+    assert feature_view is test_registry.get_feature_view(
+        "my_feature_view_1", project, allow_cache=True
+    )
+    entity = test_registry.get_entity("fs1_my_entity_1", project, allow_cache=True)
+    assert entity.join_key == "test"
+    assert entity is test_registry.get_entity(
+        "fs1_my_entity_1", project, allow_cache=True
+    )
+
+    with pytest.raises(FeatureViewNotFoundException):
+        test_registry.get_feature_view("my_feature_view_2", project, allow_cache=True)
+
+    # Committing a change produces a new registry version, which invalidates the index
+    fv1.ttl = timedelta(minutes=10)
+    test_registry.apply_feature_view(fv1, project)
+    updated_feature_view = test_registry.get_feature_view(
+        "my_feature_view_1", project, allow_cache=True
+    )
+    assert updated_feature_view is not feature_view
+    assert updated_feature_view.ttl == timedelta(minutes=10)
+
+    # Uncommitted changes keep the registry version, but are visible to cached lookups too
+    fv1.ttl = timedelta(minutes=15)
+    test_registry.apply_feature_view(fv1, project, commit=False)
+    assert test_registry.get_feature_view(
+        "my_feature_view_1", project, allow_cache=True
+    ).ttl == timedelta(minutes=15)
+
+    test_registry.teardown()
+
+
+def _wait_for(condition, timeout_secs=10):
+    deadline = time.monotonic() + timeout_secs
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_background_refresh(monkeypatch):
+    fd, registry_path = mkstemp()
+    project = "project"
+    writer = Registry(
+        project, RegistryConfig(path=registry_path, cache_ttl_seconds=600), None
+    )
+    writer.apply_entity(Entity(name="driver", join_keys=["driver_id"]), project)
+
+    reader = Registry(
+        project,
+        RegistryConfig(path=registry_path, cache_ttl_seconds=600, cache_mode="thread"),
+        None,
+    )
+    assert reader.get_cache_staleness() is not None
+    reader.stop_background_refresh()
+    assert reader.get_cache_staleness() is None
+    reader.start_background_refresh(timedelta(milliseconds=10))
+    try:
+
+        def list_entity_names():
+            return sorted(
+                entity.name
+                for entity in reader.list_entities(project, allow_cache=True)
+            )
+
+        assert list_entity_names() == ["driver"]
+
+        # Cached lookups don't wait for a refresh in progress
+        with reader._refresh_lock, ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(list_entity_names).result(timeout=5) == ["driver"]
+
+        writer.apply_entity(Entity(name="customer", join_keys=["customer_id"]), project)
+        _wait_for(lambda: list_entity_names() == ["customer", "driver"])
+
+        # Failed refreshes keep serving the last registry state, which gets staler
+        def get_registry_proto():
+            raise ConnectionError("registry store unavailable")
+
+        monkeypatch.setattr(
+            reader._registry_store, "get_registry_proto", get_registry_proto
+        )
+        _wait_for(lambda: reader.get_cache_staleness() > timedelta(milliseconds=100))
+        assert list_entity_names() == ["customer", "driver"]
+    finally:
+        reader.stop_background_refresh()
+    writer.teardown()
+
+
+def test_refresh_unchanged_registry(monkeypatch):
+    fd, registry_path = mkstemp()
+    project = "project"
+    writer = Registry(
+        project, RegistryConfig(path=registry_path, cache_ttl_seconds=600), None
+    )
+    reader = Registry(
+        project, RegistryConfig(path=registry_path, cache_ttl_seconds=600), None
+    )
+
+    def apply_entity(name: str, age: timedelta):
+        writer.apply_entity(Entity(name=name, join_keys=[f"{name}_id"]), project)
+        # Recent modification times are not trusted, since they may not change on the next write.
+        mtime_ns = time.time_ns() - int(age.total_seconds() * 10**9)
+        os.utime(registry_path, ns=(mtime_ns, mtime_ns))
+
+    fetches = []
+    get_registry_proto = reader._registry_store.get_registry_proto
+
+    def counting_get_registry_proto():
+        fetches.append(1)
+        return get_registry_proto()
+
+    monkeypatch.setattr(
+        reader._registry_store, "get_registry_proto", counting_get_registry_proto
+    )
+
+    apply_entity("driver", timedelta(minutes=2))
+    reader.refresh()
+    registry_proto = reader.cached_registry_proto
+    # The registry is only fetched again after it changed
+    reader.refresh()
+    assert len(fetches) == 1
+    assert reader.cached_registry_proto is registry_proto
+
+    apply_entity("customer", timedelta(minutes=1))
+    reader.refresh()
+    assert len(fetches) == 2
+    assert {e.name for e in reader.list_entities(project, allow_cache=True)} == {
+        "driver",
+        "customer",
+    }
+
+    # Uncommitted changes to the cached registry are discarded by refreshes, like before
+    reader.apply_entity(
+        Entity(name="merchant", join_keys=["merchant_id"]), project, commit=False
+    )
+    reader.refresh()
+    assert len(fetches) == 3
+    assert len(reader.list_entities(project, allow_cache=True)) == 2
+
+    # Recently modified registries are always fetched
+    writer.apply_entity(Entity(name="rider", join_keys=["rider_id"]), project)
+    reader.refresh()
+    reader.refresh()
+    assert len(fetches) == 5
+    writer.teardown()
+
+
 def validate_project_uuid(project_uuid, test_registry):
     assert len(test_registry.cached_registry_proto.project_metadata) == 1
     project_metadata = test_registry.cached_registry_proto.project_metadata[0]
@@ -11,6 +11,7 @@ from feast.driver_test_data import (
     create_global_daily_stats_df,
 )
 from feast.feature_store import FeatureStore
+from feast.repo_config import RepoConfig
 from feast.types import Float32, String
 from tests.utils.basic_read_write_test import basic_rw_test
 from tests.utils.cli_repo_creator import CliRunner, get_example_repo
@@ -93,6 +94,57 @@ def test_e2e_local() -> None:
             assert "feast.errors.FeastJoinKeysDuringMaterialization" in str(output)
 
 
+def test_e2e_local_concurrent_materialization() -> None:
+    """
+    Tests materialization and online retrieval with a local engine that materializes
+    feature views concurrently and pipelines conversion with online writes.
+    """
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as data_dir:
+        end_date = datetime.now().replace(microsecond=0, second=0, minute=0)
+        start_date = end_date - timedelta(days=15)
+
+        driver_entities = [1001, 1002, 1003, 1004, 1005]
+        driver_df = create_driver_hourly_stats_df(driver_entities, start_date, end_date)
+        driver_stats_path = os.path.join(data_dir, "driver_stats.parquet")
+        driver_df.to_parquet(path=driver_stats_path, allow_truncated_timestamps=True)
+
+        global_df = create_global_daily_stats_df(start_date, end_date)
+        global_stats_path = os.path.join(data_dir, "global_stats.parquet")
+        global_df.to_parquet(path=global_stats_path, allow_truncated_timestamps=True)
+
+        with runner.local_repo(
+            get_example_repo("example_feature_repo_2.py")
+            .replace("%PARQUET_PATH%", driver_stats_path)
+            .replace("%PARQUET_PATH_GLOBAL%", global_stats_path),
+            "file",
+        ) as store:
+            concurrent_store = FeatureStore(
+                repo_path=str(store.repo_path),
+                config=RepoConfig(
+                    registry=store.config.registry,
+                    project=store.project,
+                    provider=store.config.provider,
+                    online_store=store.config.online_store,
+                    offline_store=store.config.offline_store,
+                    entity_key_serialization_version=2,
+                    batch_engine={
+                        "type": "local",
+                        "max_workers": 2,
+                        "pipeline_queue_size": 2,
+                    },
+                ),
+            )
+
+            concurrent_store.materialize(start_date, end_date - timedelta(days=7))
+            validate_online_features(
+                concurrent_store, driver_df, end_date - timedelta(days=7)
+            )
+
+            concurrent_store.materialize_incremental(end_date)
+            validate_online_features(concurrent_store, driver_df, end_date)
+
+
 def _test_materialize_and_online_retrieval(
     runner: CliRunner,
     store: FeatureStore,
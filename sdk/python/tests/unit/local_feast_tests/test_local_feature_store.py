@@ -1,22 +1,27 @@
 from datetime import datetime, timedelta
 from tempfile import mkstemp
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 from pytest_lazyfixture import lazy_fixture
 
 from feast import BatchFeatureView
 from feast.aggregation import Aggregation
 from feast.data_format import AvroFormat, ParquetFormat
-from feast.data_source import KafkaSource
+from feast.data_source import KafkaSource, PushMode, PushSource
 from feast.entity import Entity
+from feast.errors import PushSourceNotFoundException
+from feast.feature_server import PushBuffer
 from feast.feature_store import FeatureStore
-from feast.feature_view import FeatureView
+from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_NAME, FeatureView
 from feast.field import Field
-from feast.infra.offline_stores.file_source import FileSource
+from feast.infra.feature_servers.base_config import PushBufferConfig
+from feast.infra.offline_stores.file_source import FileSource, SavedDatasetFileStorage
 from feast.infra.online_stores.sqlite import SqliteOnlineStoreConfig
 from feast.repo_config import RepoConfig
 from feast.stream_feature_view import stream_feature_view
-from feast.types import Array, Bytes, Float32, Int64, String
+from feast.types import Array, Bytes, Float32, Float64, Int64, String
 from tests.utils.cli_repo_creator import CliRunner, get_example_repo
 from tests.utils.data_source_test_creator import prep_file_source
 
@@ -545,6 +550,348 @@ def test_apply_stream_source_from_repo() -> None:
         assert len(ds) == 2
 
 
+@pytest.mark.parametrize(
+    "test_feature_store",
+    [lazy_fixture("feature_store_with_local_registry")],
+)
+def test_get_entityless_feature_view_from_cache(test_feature_store):
+    """Test that hiding the dummy entity doesn't change the feature views cached by the registry."""
+    nokey = FeatureView(
+        name="nokey",
+        schema=[Field(name="rating", dtype=Float64)],
+        source=FileSource(path="driver_stats.parquet", timestamp_field="ts"),
+    )
+    test_feature_store.apply([nokey])
+
+    for _ in range(2):
+        feature_view = test_feature_store.get_feature_view(
+            "nokey", allow_registry_cache=True
+        )
+        assert feature_view.entities == []
+        (listed_feature_view,) = test_feature_store.list_feature_views(allow_cache=True)
+        assert listed_feature_view.entities == []
+        assert listed_feature_view.entity_columns == []
+
+    cached_feature_view = test_feature_store._registry.get_feature_view(
+        "nokey", test_feature_store.project, allow_cache=True
+    )
+    assert cached_feature_view.entities == [DUMMY_ENTITY_NAME]
+    assert [column.name for column in cached_feature_view.entity_columns] == [
+        DUMMY_ENTITY_ID
+    ]
+
+    test_feature_store.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_feature_store",
+    [lazy_fixture("feature_store_with_local_registry")],
+)
+def test_get_historical_features_in_chunks(test_feature_store, tmp_path):
+    start = datetime(2023, 1, 1)
+    driver_stats_path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [i % 10 for i in range(200)],
+            "rating": [float(i) for i in range(200)],
+            "event_timestamp": [start + timedelta(hours=i) for i in range(200)],
+        }
+    ).to_parquet(driver_stats_path)
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[entity],
+        ttl=timedelta(hours=12),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+        ],
+        source=FileSource(path=driver_stats_path, timestamp_field="event_timestamp"),
+    )
+    test_feature_store.apply([entity, driver_stats])
+
+    # Pairs of entity rows share the same event timestamp.
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [i % 10 for i in range(100)],
+            "event_timestamp": [
+                start + timedelta(hours=3 * (i // 2)) for i in range(100)
+            ],
+        }
+    ).sample(frac=1, random_state=0)
+
+    def sort(df: pd.DataFrame) -> pd.DataFrame:
+        return df.sort_values(["event_timestamp", "driver_id"]).reset_index(drop=True)
+
+    expected = sort(
+        test_feature_store.get_historical_features(
+            entity_df, ["driver_stats:rating"]
+        ).to_df()
+    )
+    job = test_feature_store.get_historical_features(
+        entity_df, ["driver_stats:rating"], entity_df_chunk_size=7
+    )
+
+    # Every chunk has 8 rows, since rows with the same event timestamp aren't split.
+    batches = list(job.to_arrow_batches())
+    assert [batch.num_rows for batch in batches] == [8] * 12 + [4]
+    assert job.metadata.min_event_timestamp == pd.Timestamp(start, tz="UTC")
+    pd.testing.assert_frame_equal(sort(job.to_df()), expected)
+
+    for path in [tmp_path / "saved.parquet", tmp_path / "saved"]:
+        job.persist(SavedDatasetFileStorage(path=str(path)))
+        pd.testing.assert_frame_equal(
+            sort(pd.read_parquet(path)), expected, check_dtype=False
+        )
+
+    with pytest.raises(ValueError):
+        test_feature_store.get_historical_features(
+            entity_df, ["driver_stats:rating"], entity_df_chunk_size=0
+        )
+
+    test_feature_store.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_feature_store",
+    [lazy_fixture("feature_store_with_local_registry")],
+)
+def test_get_historical_features_in_chunks_without_matches(
+    test_feature_store, tmp_path
+):
+    start = datetime(2023, 1, 1)
+    driver_stats_path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1, 2],
+            "trips": [10, 20],
+            "event_timestamp": [start, start],
+        }
+    ).to_parquet(driver_stats_path)
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[entity],
+        ttl=timedelta(hours=2),
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="trips", dtype=Int64),
+        ],
+        source=FileSource(path=driver_stats_path, timestamp_field="event_timestamp"),
+    )
+    test_feature_store.apply([entity, driver_stats])
+
+    # The first chunk matches every entity row, the second one none, and the last one only some.
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 98, 99, 1, 3],
+            "event_timestamp": [start + timedelta(hours=i) for i in range(6)],
+        }
+    )
+    job = test_feature_store.get_historical_features(
+        entity_df, ["driver_stats:trips"], entity_df_chunk_size=2
+    )
+
+    batches = list(job.to_arrow_batches())
+    assert len(batches) == 3
+    assert all(batch.schema == batches[0].schema for batch in batches)
+    assert batches[0].schema.field("trips").type == pa.float64()
+
+    df = job.to_df().sort_values("event_timestamp")
+    assert df["trips"].tolist()[:2] == [10, 20]
+    assert df["trips"].isna().tolist() == [False, False, True, True, True, True]
+
+    path = tmp_path / "saved.parquet"
+    job.persist(SavedDatasetFileStorage(path=str(path)))
+    assert len(pd.read_parquet(path)) == 6
+
+    test_feature_store.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_feature_store",
+    [lazy_fixture("feature_store_with_local_registry")],
+)
+def test_push_with_cached_routes(test_feature_store, tmp_path, monkeypatch):
+    driver_stats_path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1],
+            "rating": [1.0],
+            "event_timestamp": [pd.Timestamp("2023-01-01", tz="UTC")],
+        }
+    ).to_parquet(driver_stats_path)
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[entity],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+        ],
+        source=PushSource(
+            name="driver_stats_push",
+            batch_source=FileSource(
+                path=driver_stats_path, timestamp_field="event_timestamp"
+            ),
+        ),
+    )
+    test_feature_store.apply([entity, driver_stats])
+
+    list_feature_views_calls = []
+    list_feature_views = test_feature_store.list_feature_views
+    monkeypatch.setattr(
+        test_feature_store,
+        "list_feature_views",
+        lambda *args, **kwargs: list_feature_views_calls.append(1)
+        or list_feature_views(*args, **kwargs),
+    )
+    schema_calls = []
+    get_table_column_names_and_types = FileSource.get_table_column_names_and_types
+    monkeypatch.setattr(
+        FileSource,
+        "get_table_column_names_and_types",
+        lambda self, config: schema_calls.append(1)
+        or get_table_column_names_and_types(self, config),
+    )
+
+    for i in range(3):
+        test_feature_store.push(
+            "driver_stats_push",
+            pd.DataFrame(
+                {
+                    "driver_id": [1],
+                    "rating": [2.0 + i],
+                    "event_timestamp": [pd.Timestamp("2023-01-02", tz="UTC")],
+                }
+            ),
+            to=PushMode.ONLINE_AND_OFFLINE,
+        )
+
+    # The feature views and the columns of the batch source are only looked up on the first push, while
+    # the offline store gets the columns for every write.
+    assert len(list_feature_views_calls) == 1
+    assert len(schema_calls) == 1 + 3
+    online_features = test_feature_store.get_online_features(
+        ["driver_stats:rating"], [{"driver_id": 1}]
+    ).to_dict()
+    assert online_features["rating"] == [4.0]
+    assert sorted(pd.read_parquet(driver_stats_path)["rating"]) == [
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+    ]
+
+    with pytest.raises(PushSourceNotFoundException):
+        test_feature_store.push("unknown_push", pd.DataFrame())
+
+    # The columns are fetched again once the registry changes.
+    driver_stats.description = "Driver stats"
+    test_feature_store.apply([driver_stats])
+    test_feature_store.push(
+        "driver_stats_push",
+        pd.DataFrame(
+            {
+                "driver_id": [1],
+                "rating": [5.0],
+                "event_timestamp": [pd.Timestamp("2023-01-03", tz="UTC")],
+            }
+        ),
+        to=PushMode.OFFLINE,
+    )
+    assert len(schema_calls) == 4 + 2
+
+    test_feature_store.teardown()
+
+
+@pytest.mark.parametrize(
+    "test_feature_store",
+    [lazy_fixture("feature_store_with_local_registry")],
+)
+def test_push_buffer(test_feature_store, tmp_path, monkeypatch):
+    driver_stats_path = str(tmp_path / "driver_stats.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1],
+            "rating": [1.0],
+            "event_timestamp": [pd.Timestamp("2023-01-01", tz="UTC")],
+        }
+    ).to_parquet(driver_stats_path)
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    driver_stats = FeatureView(
+        name="driver_stats",
+        entities=[entity],
+        schema=[
+            Field(name="driver_id", dtype=Int64),
+            Field(name="rating", dtype=Float64),
+        ],
+        source=PushSource(
+            name="driver_stats_push",
+            batch_source=FileSource(
+                path=driver_stats_path, timestamp_field="event_timestamp"
+            ),
+        ),
+    )
+    test_feature_store.apply([entity, driver_stats])
+
+    pushed_dfs = []
+    push = test_feature_store.push
+    monkeypatch.setattr(
+        test_feature_store,
+        "push",
+        lambda push_source_name, df, **kwargs: pushed_dfs.append(df)
+        or push(push_source_name, df, **kwargs),
+    )
+
+    def driver_df(driver_id):
+        return pd.DataFrame(
+            {
+                "driver_id": [driver_id],
+                "rating": [float(driver_id)],
+                "event_timestamp": [pd.Timestamp("2023-01-02", tz="UTC")],
+            }
+        )
+
+    push_buffer = PushBuffer(
+        test_feature_store, PushBufferConfig(max_rows=3, flush_interval_ms=60_000)
+    )
+    # The buffer is flushed once it holds the maximum number of rows.
+    futures = [
+        push_buffer.push(
+            "driver_stats_push", driver_df(driver_id), to=PushMode.ONLINE_AND_OFFLINE
+        )
+        for driver_id in [2, 3, 4]
+    ]
+    for future in futures:
+        future.result(timeout=10)
+    assert [len(df) for df in pushed_dfs] == [3]
+
+    # Remaining rows are flushed when the buffer is closed.
+    future = push_buffer.push("driver_stats_push", driver_df(5))
+    push_buffer.close()
+    assert future.done() and future.exception() is None
+    assert [len(df) for df in pushed_dfs] == [3, 1]
+
+    online_features = test_feature_store.get_online_features(
+        ["driver_stats:rating"], [{"driver_id": i} for i in range(2, 6)]
+    ).to_dict()
+    assert online_features["rating"] == [2.0, 3.0, 4.0, 5.0]
+    assert sorted(pd.read_parquet(driver_stats_path)["rating"]) == [
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+    ]
+
+    with pytest.raises(PushSourceNotFoundException):
+        push_buffer.push("unknown_push", driver_df(6))
+    with pytest.raises(RuntimeError):
+        push_buffer.push("driver_stats_push", driver_df(6))
+
+    test_feature_store.teardown()
+
+
 @pytest.fixture
 def feature_store_with_local_registry():
     fd, registry_path = mkstemp()
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import os
 import time
 from datetime import datetime
@@ -6,15 +8,18 @@ import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
-from feast import FeatureStore, RepoConfig
+from feast import FeatureService, FeatureStore, RepoConfig
 from feast.errors import FeatureViewNotFoundException
+from feast.feature_server import get_app
+from feast.infra.online_stores.sqlite import SqliteOnlineStore
+from feast.protos.feast.serving.ServingService_pb2 import FieldStatus
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RegistryConfig
 from tests.utils.cli_repo_creator import CliRunner, get_example_repo
 
 
-def test_online() -> None:
+def test_online(monkeypatch) -> None:
     """
     Test reading from the online store in local mode.
     """
@@ -124,6 +129,87 @@ def test_online() -> None:
 
         assert "trips" in result
 
+        # The columnar response holds the same values, and nulls for missing keys
+        columnar_result = store.get_online_features_columnar(
+            features=[
+                "driver_locations:lon",
+                "customer_profile:avg_orders_day",
+                "customer_profile:name",
+                "customer_driver_combined:trips",
+            ],
+            entity_rows=[
+                {"driver_id": 1, "customer_id": "5"},
+                {"driver_id": 0, "customer_id": 0},
+            ],
+            full_feature_names=True,
+        )
+        assert columnar_result.to_dict() == {
+            "driver_id": [1, 0],
+            "customer_id": ["5", "0"],
+            "driver_locations__lon": ["1.0", None],
+            "customer_profile__avg_orders_day": [1.0, None],
+            "customer_profile__name": ["John", None],
+            "customer_driver_combined__trips": [7, None],
+        }
+        assert columnar_result.statuses["customer_profile__name"].tolist() == [
+            FieldStatus.PRESENT,
+            FieldStatus.NOT_FOUND,
+        ]
+
+        # Asynchronous reads return the same response, if the online store supports them
+        async_features = [
+            "driver_locations:lon",
+            "customer_profile:avg_orders_day",
+            "customer_driver_combined:trips",
+        ]
+        async_entity_rows = [
+            {"driver_id": 1, "customer_id": "5"},
+            {"driver_id": 0, "customer_id": 0},
+        ]
+        with pytest.raises(NotImplementedError):
+            asyncio.run(
+                store.get_online_features_async(async_features, async_entity_rows)
+            )
+
+        async def online_read_async(self, *args, **kwargs):
+            return self.online_read(*args, **kwargs)
+
+        monkeypatch.setattr(SqliteOnlineStore, "online_read_async", online_read_async)
+        async_result = asyncio.run(
+            store.get_online_features_async(async_features, async_entity_rows)
+        )
+        assert (
+            async_result.proto
+            == store.get_online_features(async_features, async_entity_rows).proto
+        )
+        assert async_result.to_dict()["trips"] == [7, None]
+
+        # The feature server only reads the online store on the event loop
+        def without_event_loop(method):
+            def wrapper(*args, **kwargs):
+                with pytest.raises(RuntimeError):
+                    asyncio.get_running_loop()
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        for name in ["_prepare_online_features_request", "_build_online_response"]:
+            monkeypatch.setattr(store, name, without_event_loop(getattr(store, name)))
+        get_online_features = next(
+            route.endpoint
+            for route in get_app(store).routes
+            if route.path == "/get-online-features"
+        )
+        body = json.dumps(
+            {
+                "features": async_features,
+                "entities": {"driver_id": [1, 0], "customer_id": ["5", "0"]},
+            }
+        )
+        response = asyncio.run(get_online_features(body))
+        store.registry.stop_background_refresh()
+        assert response["results"][-1]["values"] == [7, None]
+
         # invalid table reference
         with pytest.raises(FeatureViewNotFoundException):
             store.get_online_features(
@@ -251,7 +337,7 @@ def test_online() -> None:
         os.rename(store.config.registry.path + "_fake", store.config.registry.path)
 
 
-def test_online_to_df():
+def test_online_to_df(monkeypatch):
     """
     Test dataframe conversion. Make sure the response columns and rows are
     the same order as the request.
@@ -358,21 +444,24 @@ def test_online_to_df():
                 progress=None,
             )
 
+        features = [
+            "driver_locations:lon",
+            "driver_locations:lat",
+            "customer_profile:avg_orders_day",
+            "customer_profile:name",
+            "customer_profile:age",
+            "customer_driver_combined:trips",
+        ]
+        # Reverse the row order
+        entity_rows = [
+            {"driver_id": d, "customer_id": c}
+            for (d, c) in zip(reversed(driver_ids), reversed(customer_ids))
+        ]
+
         # Get online features in dataframe
         result_df = store.get_online_features(
-            features=[
-                "driver_locations:lon",
-                "driver_locations:lat",
-                "customer_profile:avg_orders_day",
-                "customer_profile:name",
-                "customer_profile:age",
-                "customer_driver_combined:trips",
-            ],
-            # Reverse the row order
-            entity_rows=[
-                {"driver_id": d, "customer_id": c}
-                for (d, c) in zip(reversed(driver_ids), reversed(customer_ids))
-            ],
+            features=features,
+            entity_rows=entity_rows,
         ).to_df()
         """
         Construct the expected dataframe with reversed row order like so:
@@ -404,3 +493,102 @@ def test_online_to_df():
         ]
         expected_df = pd.DataFrame({k: reversed(v) for (k, v) in df_dict.items()})
         assert_frame_equal(result_df[ordered_column], expected_df)
+
+        # Reading the feature views concurrently should return the same response
+        concurrent_store = FeatureStore(
+            config=RepoConfig(
+                registry=store.config.registry,
+                online_store=store.config.online_store,
+                project=store.project,
+                provider=store.config.provider,
+                entity_key_serialization_version=2,
+                online_read_concurrency=3,
+            )
+        )
+        concurrent_result_df = concurrent_store.get_online_features(
+            features=features,
+            entity_rows=entity_rows,
+        ).to_df()
+        assert_frame_equal(concurrent_result_df[ordered_column], expected_df)
+
+        # Feature views with the same join keys are read at once, if the online store supports it
+        grouped_features = features + ["pushed_driver_locations:driver_lat"]
+        grouped_result_df = concurrent_store.get_online_features(
+            features=grouped_features,
+            entity_rows=entity_rows,
+        ).to_df()
+        assert not concurrent_store._online_read_many_supported
+        assert_frame_equal(grouped_result_df[ordered_column], expected_df)
+        assert grouped_result_df["driver_lat"].isna().all()
+
+        read_many_calls = []
+
+        def online_read_many(self, config, tables, entity_keys):
+            read_many_calls.append([table.name for table, _ in tables])
+            return [
+                self.online_read(config, table, entity_keys, requested_features)
+                for table, requested_features in tables
+            ]
+
+        monkeypatch.setattr(SqliteOnlineStore, "online_read_many", online_read_many)
+        concurrent_store._online_read_many_supported = True
+        for get_online_features in (
+            concurrent_store.get_online_features,
+            concurrent_store.get_online_features_columnar,
+        ):
+            read_many_calls.clear()
+            assert_frame_equal(
+                get_online_features(
+                    features=grouped_features, entity_rows=entity_rows
+                ).to_df()[grouped_result_df.columns],
+                grouped_result_df,
+                check_dtype=False,
+            )
+            assert read_many_calls == [["driver_locations", "pushed_driver_locations"]]
+
+        # Projections with different join key maps have the same join keys, but different entity
+        # values, so they are read separately.
+        locations_service = FeatureService(
+            name="locations",
+            features=[
+                driver_locations_fv.with_name("origin").with_join_key_map(
+                    {"driver_id": "origin_id"}
+                ),
+                driver_locations_fv.with_name("dest").with_join_key_map(
+                    {"driver_id": "dest_id"}
+                ),
+            ],
+        )
+        concurrent_store.apply([locations_service])
+        read_many_calls.clear()
+        locations_df = concurrent_store.get_online_features(
+            features=locations_service,
+            entity_rows=[{"origin_id": 1, "dest_id": 2}],
+            full_feature_names=True,
+        ).to_df()
+        assert read_many_calls == []
+        assert locations_df["origin__lat"].tolist() == [pytest.approx(0.1)]
+        assert locations_df["dest__lat"].tolist() == [pytest.approx(0.2)]
+
+        # The columnar response should return the same values, typed as declared in the
+        # feature views rather than as written (lat is a Float32 feature)
+        columnar_result_df = store.get_online_features_columnar(
+            features=features,
+            entity_rows=entity_rows,
+        ).to_df()
+        assert_frame_equal(
+            columnar_result_df[ordered_column], expected_df, check_dtype=False
+        )
+
+        # Retrieval plans are reused until the registry is refreshed
+        plan = store._get_online_retrieval_plan(features, full_feature_names=False)
+        assert plan is store._get_online_retrieval_plan(
+            features, full_feature_names=False
+        )
+        assert plan is not store._get_online_retrieval_plan(
+            features, full_feature_names=True
+        )
+        store.refresh_registry()
+        assert plan is not store._get_online_retrieval_plan(
+            features, full_feature_names=False
+        )
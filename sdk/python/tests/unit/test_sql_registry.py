@@ -18,6 +18,7 @@ from datetime import timedelta
 
 import pandas as pd
 import pytest
+from google.protobuf.message import Message
 from pytest_lazyfixture import lazy_fixture
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
@@ -32,6 +33,7 @@ from feast.infra.infra_object import Infra
 from feast.infra.online_stores.sqlite import SqliteTable
 from feast.infra.registry.sql import SqlRegistry
 from feast.on_demand_feature_view import on_demand_feature_view
+from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.repo_config import RegistryConfig
 from feast.types import Array, Bytes, Float32, Int32, Int64, String
 from feast.value_type import ValueType
@@ -671,3 +673,96 @@ def test_update_infra(sql_registry):
 
     # Try again since second time, infra should be not-empty
     sql_registry.teardown()
+
+
+def _normalize_registry_proto(registry_proto: RegistryProto):
+    # The order of objects in the registry proto doesn't matter.
+    normalized = {}
+    for field in registry_proto.DESCRIPTOR.fields:
+        value = getattr(registry_proto, field.name)
+        if field.message_type is None:
+            normalized[field.name] = value
+        elif isinstance(value, Message):
+            normalized[field.name] = value.SerializeToString(deterministic=True)
+        else:
+            # Repeated message fields
+            normalized[field.name] = sorted(
+                obj.SerializeToString(deterministic=True) for obj in value
+            )
+    return normalized
+
+
+def test_incremental_refresh(tmp_path, monkeypatch):
+    registry_config = RegistryConfig(
+        registry_type="sql", path=f"sqlite:///{tmp_path / 'registry.db'}"
+    )
+    sql_registry = SqlRegistry(registry_config, "project", None)
+    batch_source = FileSource(
+        name="test_source", path="file://feast/*", timestamp_field="ts_col"
+    )
+    entity = Entity(name="driver", join_keys=["driver_id"])
+    fv1, fv2 = [
+        FeatureView(
+            name=name,
+            schema=[Field(name="rating", dtype=Float32)],
+            entities=[entity],
+            source=batch_source,
+            ttl=timedelta(minutes=5),
+        )
+        for name in ["driver_stats", "driver_daily_stats"]
+    ]
+    for project in ["project", "other_project"]:
+        sql_registry.apply_data_source(batch_source, project)
+        sql_registry.apply_entity(entity, project)
+        sql_registry.apply_feature_view(fv1, project)
+        sql_registry.apply_feature_view(fv2, project)
+    sql_registry.update_infra(
+        Infra(
+            infra_objects=[
+                SqliteTable(path=str(tmp_path / "online.db"), name="driver_stats")
+            ]
+        ),
+        "project",
+    )
+
+    sql_registry.refresh()
+    registry_proto = sql_registry.cached_registry_proto
+    assert _normalize_registry_proto(registry_proto) == _normalize_registry_proto(
+        sql_registry.proto()
+    )
+    assert len(registry_proto.feature_views) == 4
+    assert len(registry_proto.project_metadata) == 2
+    assert len(registry_proto.infra.infra_objects) == 1
+
+    # Nothing changed, so the cached registry proto is kept.
+    sql_registry.refresh()
+    assert sql_registry.cached_registry_proto is registry_proto
+
+    # Only updated objects are deserialized. The update may happen in the same second as the last refresh.
+    from_proto_calls = []
+    from_proto = FeatureView.from_proto
+    monkeypatch.setattr(
+        FeatureView,
+        "from_proto",
+        lambda feature_view_proto: from_proto_calls.append(feature_view_proto)
+        or from_proto(feature_view_proto),
+    )
+    fv1.ttl = timedelta(minutes=10)
+    sql_registry.apply_feature_view(fv1, "project")
+    sql_registry.delete_feature_view(fv2.name, "other_project")
+    sql_registry.refresh()
+    assert [proto.spec.name for proto in from_proto_calls] == [fv1.name]
+    monkeypatch.undo()
+
+    registry_proto = sql_registry.cached_registry_proto
+    assert _normalize_registry_proto(registry_proto) == _normalize_registry_proto(
+        sql_registry.proto()
+    )
+    assert sorted(
+        (proto.spec.project, proto.spec.name, proto.spec.ttl.seconds)
+        for proto in registry_proto.feature_views
+    ) == [
+        ("other_project", "driver_stats", 300),
+        ("project", "driver_daily_stats", 300),
+        ("project", "driver_stats", 600),
+    ]
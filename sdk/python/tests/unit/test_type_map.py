@@ -1,8 +1,12 @@
+from datetime import datetime
+
 import numpy as np
+import pyarrow as pa
 import pytest
 
 from feast.type_map import (
     feast_value_type_to_python_type,
+    pa_array_to_proto_values,
     python_values_to_proto_values,
 )
 from feast.value_type import ValueType
@@ -48,3 +52,54 @@ def test_python_values_to_proto_values_bool(values):
     converted = feast_value_type_to_python_type(protos[0])
 
     assert converted is bool(values[0])
+
+
+@pytest.mark.parametrize(
+    "array,value_type",
+    (
+        (pa.array([1, None, 3], pa.int32()), ValueType.INT32),
+        (pa.array([1, None, 3]), ValueType.INT64),
+        (pa.array([1.5, None, float("nan")], pa.float32()), ValueType.FLOAT),
+        (pa.array([1.5, None, float("nan")]), ValueType.DOUBLE),
+        (pa.array(["a", None, "c"]), ValueType.STRING),
+        (pa.array([b"a", None, b"c"]), ValueType.BYTES),
+        (pa.array([True, None, False]), ValueType.BOOL),
+        (pa.array([None, None], pa.int64()), ValueType.INT64),
+        (
+            pa.array([datetime(2021, 1, 1, 12, 30, 15, 500), None], pa.timestamp("ns")),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+        (
+            pa.array([datetime(2021, 1, 1), None], pa.timestamp("us", tz="UTC")),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+        (
+            pa.array([datetime(1969, 12, 31, 23, 59, 59, 500000)], pa.timestamp("ns")),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+        (
+            pa.array([datetime(2021, 1, 1), None], pa.timestamp("s", tz="+02:00")),
+            ValueType.UNIX_TIMESTAMP,
+        ),
+        (pa.array([[1, 2], None, []]), ValueType.INT64_LIST),
+        (pa.array([["a"], None, ["b", "c"]]), ValueType.STRING_LIST),
+        (pa.array([[1.5], [2.5, 3.5]]), ValueType.DOUBLE_LIST),
+        (pa.array([[True], [False, True]]), ValueType.BOOL_LIST),
+        (pa.array([None, None], pa.timestamp("us")), ValueType.UNIX_TIMESTAMP),
+        (pa.array([None, None]), ValueType.UNIX_TIMESTAMP),
+        (pa.array([None, None]), ValueType.STRING),
+        (pa.chunked_array([[[1, 2], None], [[3]]]), ValueType.INT64_LIST),
+        (pa.chunked_array([[1.5], [None, 2.5]]), ValueType.DOUBLE),
+    ),
+)
+def test_pa_array_to_proto_values(array, value_type):
+    """Test that Arrow arrays get converted like their NumPy equivalents."""
+
+    protos = pa_array_to_proto_values(array, value_type)
+    expected = python_values_to_proto_values(
+        array.to_numpy(zero_copy_only=False), value_type
+    )
+
+    assert protos == expected
+    # Every row has its own proto.
+    assert len({id(proto) for proto in protos}) == len(protos)
@@ -0,0 +1,33 @@
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast.utils import _arrow_to_datetimes, _coerce_datetime
+
+
+@pytest.mark.parametrize(
+    "array",
+    (
+        pa.array(
+            [datetime(2021, 1, 1, 12, 30, 15, 500), None], pa.timestamp("us", tz="UTC")
+        ),
+        pa.array(
+            [pd.Timestamp("1969-12-31 23:59:59.9999995"), None], pa.timestamp("ns")
+        ),
+        pa.array([datetime(2021, 1, 1), None], pa.timestamp("s", tz="+02:00")),
+        pa.array(["2021-01-01 12:30:15", None]),
+    ),
+)
+def test_arrow_to_datetimes(array):
+    """Test that Arrow arrays get converted like their pandas equivalents."""
+
+    datetimes = _arrow_to_datetimes(array)
+    expected = [
+        _coerce_datetime(val)
+        for val in pd.to_datetime(array.to_numpy(zero_copy_only=False))
+    ]
+
+    assert datetimes[:-1] == expected[:-1]
+    assert datetimes[-1] is pd.NaT and expected[-1] is pd.NaT
@@ -98,7 +98,12 @@ REDIS_REQUIRED = [
     "hiredis>=2.0.0,<3",
 ]
 
-AWS_REQUIRED = ["boto3>=1.17.0,<2", "docker>=5.0.2", "fsspec<2023.10.0"]
+AWS_REQUIRED = [
+    "boto3>=1.17.0,<2",
+    "aiobotocore>2,<3",
+    "docker>=5.0.2",
+    "fsspec<2023.10.0",
+]
 
 BYTEWAX_REQUIRED = ["bytewax==0.15.1", "docker>=5.0.2", "kubernetes<=20.13.0"]
 